@@ -10,6 +10,9 @@ class fluent_entrypoint:  # pylint: disable=invalid-name,too-few-public-methods
     that you class not accept any arguments for instantiation.
 
     This will automatically return `self` for fluent chaining in your methods.
+    Before calling your method, `_on_reconfigure()` is called on the object if
+    it has one, so matchers can clear anything which depends on how they are
+    configured (or refuse to change).
     """
 
     def __init__(self, function):
@@ -22,6 +25,9 @@ class fluent_entrypoint:  # pylint: disable=invalid-name,too-few-public-methods
             obj = _type()
 
         def wrapper(*args, **kwargs):
+            if on_reconfigure := getattr(obj, "_on_reconfigure", None):
+                on_reconfigure()
+
             self.function(obj, *args, **kwargs)
 
             return obj
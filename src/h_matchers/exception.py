@@ -2,4 +2,8 @@
 
 
 class NoMatch(Exception):
-    """The items being compared do not match."""
+    """The items being compared do not match.
+
+    Matchers no longer raise this internally (they return a `MatchResult`
+    from `match()` instead), but it's kept for code which imports it.
+    """
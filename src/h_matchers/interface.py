@@ -1,5 +1,7 @@
 """The public interface class for comparing with things."""
 
+from importlib import import_module
+
 from h_matchers.matcher import collection
 from h_matchers.matcher import number as _number
 from h_matchers.matcher.anything import AnyThing
@@ -7,12 +9,35 @@ from h_matchers.matcher.combination import AllOf, AnyOf
 from h_matchers.matcher.meta import AnyCallable, AnyFunction
 from h_matchers.matcher.object import AnyObject
 from h_matchers.matcher.strings import AnyString
-from h_matchers.matcher.web.request import AnyRequest
-from h_matchers.matcher.web.url import AnyURL
 
 __all__ = ["Any", "All"]
 
 
+class _Lazy:
+    """A class attribute which is imported the first time it's used.
+
+    Some matchers are slow to import (they import optional libraries, or
+    build things up front). Most people won't use all of them, so there's no
+    need to pay that cost in every process.
+    """
+
+    def __init__(self, module, name):
+        self._module = module
+        self._name = name
+        self._attribute = None
+
+    def __set_name__(self, owner, name):
+        self._attribute = name
+
+    def __get__(self, instance, owner):
+        value = getattr(import_module(self._module), self._name)
+
+        # Replace ourselves with the real thing, so this only happens once
+        setattr(owner, self._attribute, value)
+
+        return value
+
+
 class Any(AnyThing):
     """Matches anything and provides access to other matchers."""
 
@@ -37,8 +62,8 @@ class Any(AnyThing):
     tuple = collection.AnyTuple
     generator = collection.AnyGenerator
 
-    url = AnyURL
-    request = AnyRequest
+    url = _Lazy("h_matchers.matcher.web.url", "AnyURL")
+    request = _Lazy("h_matchers.matcher.web.request", "AnyRequest")
 
     of = AnyOf
 
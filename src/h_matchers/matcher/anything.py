@@ -7,4 +7,11 @@ class AnyThing(Matcher):
     """Matches anything."""
 
     def __init__(self):
-        super().__init__("* anything *", lambda _: True)
+        super().__init__("* anything *", self._is_anything)
+
+    @staticmethod
+    def _is_anything(_):
+        return True
+
+    def _compile(self):
+        return self._is_anything
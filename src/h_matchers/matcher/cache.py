@@ -0,0 +1,188 @@
+"""A cache for the results of matching values which can't change.
+
+Matchers can be asked to remember their results with `cache_results()`, so
+comparing the same values to them over and over only does the work once:
+
+    STATUS = Any.of(["active", "pending"]).cache_results(size=64)
+
+Results are only cached for values which are hashable and can't change, so
+the result couldn't be different next time:
+
+ * `str`, `bytes`, `int`, `float`, `complex`, `bool`, `Decimal` and `None`
+ * Tuples (including named tuples) and frozen sets of these
+ * Frozen data classes with fields which are any of these
+
+Subclasses of the simple types above aren't cached, as they can change how
+they compare. Values are cached by type as well as value, so `1`, `1.0` and
+`True` each get their own result.
+
+When the cache is full either the least recently used result (`"lru"`) or the
+oldest result (`"fifo"`) is dropped.
+
+The cache is cleared whenever the matcher, or any matcher inside it, is
+changed with one of its fluent methods:
+
+    inner = Any.int()
+    outer = Any.of([inner, "x"]).cache_results()
+
+    outer == 1  # True
+    inner.greater_than(5)
+    outer == 1  # False
+
+Changes made any other way, like adding to a list the matcher was made
+from, aren't noticed. Don't change anything a caching matcher uses.
+"""
+
+from collections import OrderedDict, namedtuple
+from decimal import Decimal
+
+_SIMPLE_TYPES = frozenset((str, bytes, int, float, complex, bool, Decimal, type(None)))
+
+
+def cache_key(value):
+    """Get a key to cache the result for a value under.
+
+    :param value: The value being matched
+    :return: A hashable key, or None if the value can't be cached
+    """
+    type_ = type(value)
+
+    if type_ in _SIMPLE_TYPES:
+        return type_, value
+
+    if isinstance(value, tuple):
+        items = _item_keys(value)
+        return None if items is None else (type_, items)
+
+    if type_ is frozenset:
+        items = _item_keys(value)
+        return None if items is None else (type_, frozenset(items))
+
+    if _is_frozen_dataclass(value):
+        # Anything which has made a data class has imported this already, so
+        # we don't slow down importing by doing it up front
+        import dataclasses  # pylint: disable=import-outside-toplevel
+
+        items = _item_keys(
+            getattr(value, field.name) for field in dataclasses.fields(value)
+        )
+        return None if items is None else (type_, items)
+
+    return None
+
+
+def _item_keys(items):
+    keys = []
+    for item in items:
+        if (key := cache_key(item)) is None:
+            return None
+
+        keys.append(key)
+
+    return tuple(keys)
+
+
+def _generations(matchers):
+    """Get how many times each of some matchers has been changed."""
+    # pylint: disable=protected-access
+    return [matcher._generation for matcher in matchers]
+
+
+def _is_frozen_dataclass(value):
+    # Without `eq` data classes compare by identity, so two with the same
+    # fields aren't interchangeable
+    params = getattr(type(value), "__dataclass_params__", None)
+
+    return params is not None and params.frozen and params.eq
+
+
+class CacheInfo(namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])):
+    """Statistics about a result cache, like `functools.lru_cache` gives."""
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """Get the fraction of cacheable lookups which were hits."""
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """A bounded store of match results."""
+
+    EVICTION_POLICIES = ("lru", "fifo")
+
+    def __init__(self, maxsize, eviction="lru"):
+        """Create a new cache.
+
+        :param maxsize: The number of results to keep
+        :param eviction: "lru" or "fifo" (see the module docs)
+        :raise ValueError: If the size is less than 1 or the eviction policy
+            isn't known
+        """
+        if maxsize < 1:
+            raise ValueError("The cache size must be at least 1")
+
+        if eviction not in self.EVICTION_POLICIES:
+            raise ValueError(
+                f"The eviction policy must be one of {self.EVICTION_POLICIES}"
+            )
+
+        self.maxsize = maxsize
+        self.eviction = eviction
+        self.hits = self.misses = 0
+        self._results = OrderedDict()
+        # The matchers the results depend on, and how many times each had
+        # been changed when they were stored
+        self._matchers = None
+        self._generations = None
+
+    def get(self, key):
+        """Get a cached result, or None if there isn't one."""
+        try:
+            result = self._results[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if self.eviction == "lru":
+            self._results.move_to_end(key)
+
+        return result
+
+    def put(self, key, result):
+        """Store a result, dropping another if the cache is full."""
+        self._results[key] = result
+
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def clear(self):
+        """Drop every stored result, but keep the statistics."""
+        self._results.clear()
+
+    def clear_if_stale(self, matchers):
+        """Drop every stored result if matchers have changed since they were.
+
+        :param matchers: A function which gets the matchers the results
+            depend on
+        """
+        if self._matchers is None or self._generations != _generations(self._matchers):
+            self._results.clear()
+            self._matchers = matchers()
+            self._generations = _generations(self._matchers)
+
+    def info(self):
+        """Get statistics about the cache."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    def __reduce__(self):
+        # Results are only valid for this matcher in this process, so only the
+        # settings are pickled
+        return type(self), (self.maxsize, self.eviction)
+
+    def __repr__(self):
+        return f"<ResultCache {self.eviction} {self.maxsize}>"
@@ -1,10 +1,11 @@
 """Flexible matchers for various collection types in a fluent style."""
 
+from collections.abc import Sized
 from types import GeneratorType
 
-from h_matchers.exception import NoMatch
 from h_matchers.matcher.collection import _mixin
-from h_matchers.matcher.core import Matcher
+from h_matchers.matcher.collection.containment import as_collection
+from h_matchers.matcher.core import MATCH, Matcher, MatchResult
 
 
 class AnyCollection(
@@ -19,27 +20,85 @@ class AnyCollection(
     def __init__(self):
         # Pass None as our function, as we will be in charge of our own type
         # checking
-        super().__init__("dummy", self.assert_equal_to)
-
-    def assert_equal_to(self, other):
-        try:
-            copy = list(other)
-        except TypeError as err:
-            raise AssertionError("Object is not iterable") from err
+        super().__init__("dummy", self._match)
 
+    def _match(self, other):
         # Execute checks roughly in complexity order
-        for checker in [
+        checkers = [
             self._check_type,
             self._check_size,
             self._check_item_matcher,
             self._check_contains,
-        ]:
+        ]
+
+        if isinstance(other, Sized):
+            # We can reject the wrong type or size before copying anything
+            for checker in checkers[:2]:
+                if not (result := checker(other, original=other)):
+                    return result
+
+            checkers = checkers[2:]
+
+        try:
+            copy = as_collection(other, limit=self._item_limit())
+        except TypeError:
+            return MatchResult(False, "Object is not iterable")
+
+        for checker in checkers:
+            if not (result := checker(copy, original=other)):
+                return result
+
+        return MATCH
+
+    def _compile(self):
+        type_and_size_checks = [
+            check for check in (self._compile_type(), self._compile_size()) if check
+        ]
+        item_checks = [
+            check
+            for check in (self._compile_item_matcher(), self._compile_contains())
+            if check
+        ]
+        limit = self._item_limit()
+
+        def predicate(other):
+            checks = type_and_size_checks + item_checks
+
+            if isinstance(other, Sized):
+                for check in type_and_size_checks:
+                    if not check(other, other):
+                        return False
+
+                checks = item_checks
+
             try:
-                checker(copy, original=other)
-            except NoMatch as err:
-                raise AssertionError("No match could be found") from err
+                copy = as_collection(other, limit=limit)
+            except TypeError:
+                return False
+
+            for check in checks:
+                if not check(copy, other):
+                    return False
+
+            return True
+
+        return predicate
 
-        return True
+    def _item_limit(self):
+        """Get the most items we need to read to tell if `other` matches.
+
+        If there's a maximum size, reading one more item than that is enough
+        to tell `other` is too big. The checks will then reject the partial
+        copy for being the wrong size.
+        """
+        limits = []
+        if self._max_size:
+            limits.append(self._max_size)
+
+        if self._exact_match and self._items:
+            limits.append(len(self._items))
+
+        return min(limits, default=None)
 
     def __str__(self):
         # This is some pretty gross code, but it makes test output so much
@@ -87,7 +146,13 @@ class AnyGenerator(AnyCollection):
 class AnyMapping(AnyCollection):
     """A matcher representing any mapping."""
 
-    def assert_equal_to(self, other):
-        assert hasattr(other, "items"), "Mapping object needs items()"
+    def _match(self, other):
+        if not hasattr(other, "items"):
+            return MatchResult(False, "Mapping object needs items()")
+
+        return super()._match(other)
+
+    def _compile(self):
+        collection_predicate = super()._compile()
 
-        return super().assert_equal_to(other)
+        return lambda other: hasattr(other, "items") and collection_predicate(other)
@@ -1,14 +1,14 @@
 """A mixin for AnyCollection which lets you check for specific items."""
 
-from types import GeneratorType
+from collections.abc import Iterator
 
 from h_matchers.decorator import fluent_entrypoint
-from h_matchers.exception import NoMatch
 from h_matchers.matcher.collection.containment import (
     AnyIterableWithItems,
     AnyIterableWithItemsInOrder,
     AnyMappingWithItems,
 )
+from h_matchers.matcher.core import MATCH, MatchResult
 
 
 class ContainsMixin:
@@ -58,7 +58,9 @@ class ContainsMixin:
         if self._items is None:
             raise ValueError("You must set items before calling this")
 
+        self._on_reconfigure()
         self._in_order = True
+
         return self
 
     def only(self):
@@ -70,19 +72,46 @@ class ContainsMixin:
         if self._items is None:
             raise ValueError("You must set items before calling this")
 
+        self._on_reconfigure()
         self._exact_match = True
 
         return self
 
     def _check_contains(self, other, original=None):
         if not self._items:
-            return
+            return MATCH
 
         # We can bail out early if we need an exact match and they are
         # different sizes
         if self._exact_match and len(self._items) != len(other):
-            raise NoMatch("Items of different size")
+            return MatchResult(False, "Items of different size")
+
+        # If the original object was an iterator compare against our copy of
+        # the values, not the original object, as it will have been consumed
+        compare_to = other if isinstance(original, Iterator) else original
+
+        if self._containment_matcher() != compare_to:
+            return MatchResult(False, "Items not found")
+
+        return MATCH
+
+    def _compile_contains(self):
+        """Get a check function for the contents, or None if there isn't one."""
+        if not self._items:
+            return None
+
+        size = len(self._items) if self._exact_match else None
+        contains = self._containment_matcher().compile()
+
+        def check(other, original):
+            if size is not None and size != len(other):
+                return False
+
+            return contains(other if isinstance(original, Iterator) else original)
 
+        return check
+
+    def _containment_matcher(self):
         if hasattr(self._items, "items"):
             matcher_class = AnyMappingWithItems
         elif self._in_order:
@@ -90,12 +119,7 @@ class ContainsMixin:
         else:
             matcher_class = AnyIterableWithItems
 
-        # If the original object was a generator compare against our copy of
-        # the values, not the original object, as it will have been consumed
-        compare_to = other if isinstance(original, GeneratorType) else original
-
-        if matcher_class(self._items) != compare_to:
-            raise NoMatch()
+        return matcher_class(self._items)
 
     def _describe_contains(self):
         if not self._items:
@@ -3,7 +3,7 @@
 # pylint: disable=too-few-public-methods
 
 from h_matchers.decorator import fluent_entrypoint
-from h_matchers.exception import NoMatch
+from h_matchers.matcher.core import MATCH, MatchResult, compile_value
 
 
 class ItemMatcherMixin:
@@ -33,13 +33,33 @@ class ItemMatcherMixin:
     def _check_item_matcher(self, other, original):
         """Check to see if all items in the object match a pattern."""
         if not self._item_matcher:
-            return
+            return MATCH
 
         items = original.keys() if isinstance(original, dict) else other
 
         for item in items:
             if not self._item_matcher == item:
-                raise NoMatch("Item does not match item matcher")
+                return MatchResult(False, "Item does not match item matcher")
+
+        return MATCH
+
+    def _compile_item_matcher(self):
+        """Get a check function for the items, or None if there isn't one."""
+        if not self._item_matcher:
+            return None
+
+        item_predicate = compile_value(self._item_matcher)
+
+        def check(other, original):
+            items = original.keys() if isinstance(original, dict) else other
+
+            for item in items:
+                if not item_predicate(item):
+                    return False
+
+            return True
+
+        return check
 
     def _describe_item_matcher(self):
         if self._item_matcher:
@@ -3,7 +3,7 @@
 # pylint: disable=too-few-public-methods
 
 from h_matchers.decorator import fluent_entrypoint
-from h_matchers.exception import NoMatch
+from h_matchers.matcher.core import MATCH, MatchResult
 
 
 class SizeMixin:
@@ -46,10 +46,27 @@ class SizeMixin:
     def _check_size(self, other, original=None):
         """Run the size check (if any)."""
         if self._min_size and len(other) < self._min_size:
-            raise NoMatch("Too small")
+            return MatchResult(False, "Too small")
 
         if self._max_size and len(other) > self._max_size:
-            raise NoMatch("Too big")
+            return MatchResult(False, "Too big")
+
+        return MATCH
+
+    def _compile_size(self):
+        """Get a check function for the size, or None if there isn't one."""
+        min_size, max_size = self._min_size, self._max_size
+        if not min_size and not max_size:
+            return None
+
+        def check(other, original):  # pylint: disable=unused-argument
+            size = len(other)
+            if min_size and size < min_size:
+                return False
+
+            return not (max_size and size > max_size)
+
+        return check
 
     def _describe_size(self):
         if self._min_size is None and self._max_size is None:
@@ -3,7 +3,7 @@
 # pylint: disable=too-few-public-methods
 
 from h_matchers.decorator import fluent_entrypoint
-from h_matchers.exception import NoMatch
+from h_matchers.matcher.core import MATCH, MatchResult
 
 
 class TypeMixin:
@@ -25,9 +25,19 @@ class TypeMixin:
         self._exact_type = of_type
 
     def _check_type(self, _, original):
-        if self._exact_type:
-            if not isinstance(original, self._exact_type):
-                raise NoMatch("Wrong type")
+        if self._exact_type and not isinstance(original, self._exact_type):
+            return MatchResult(False, "Wrong type")
+
+        return MATCH
+
+    def _compile_type(self):
+        """Get a check function for the type, or None if there isn't one."""
+        if not self._exact_type:
+            return None
+
+        exact_type = self._exact_type
+
+        return lambda _, original: isinstance(original, exact_type)
 
     def _describe_type(self):
         if self._exact_type:
@@ -1,17 +1,88 @@
 """Matchers for testing collections have specific items."""
 
-from h_matchers.matcher.core import Matcher
+from collections import defaultdict, deque
+from collections.abc import Collection, Iterator
+from itertools import islice
+from math import inf
+from operator import eq
+
+from h_matchers.matcher.core import Matcher, compile_value
+
+
+def as_collection(value, limit=None):
+    """Get a version of `value` we can size and iterate over repeatedly.
+
+    Collections like lists, sets and dict views are returned unchanged, so
+    they aren't copied. Anything else (like a generator) is copied into a
+    list.
+
+    :param value: The value to convert
+    :param limit: Copy at most `limit + 1` items. This is enough to tell
+        that there were more than `limit` without reading everything.
+    :raise TypeError: If the value isn't iterable
+    """
+    if isinstance(value, Collection) and not isinstance(value, Iterator):
+        return value
+
+    if limit is not None:
+        return list(islice(value, limit + 1))
+
+    return list(value)
+
+
+def _as_sequence(value):
+    # Lists and tuples have a fast `index()` we can use directly. Other
+    # sequences have different ideas about what `index()` means (`str`
+    # finds substrings, `range` doesn't take a start) so we copy them.
+    if isinstance(value, (list, tuple)):
+        return value
+
+    return list(value)
 
 
 class AnyIterableWithItemsInOrder(Matcher):
     """Matches any item which contains certain elements in order."""
 
     def __init__(self, items_to_match):
+        self.items_to_match = items_to_match
+
         super().__init__(
-            f"* contains {items_to_match} in any order *",
-            lambda other: self._contains_in_order(other, items_to_match),
+            f"* contains {items_to_match} in any order *", self._contains_items
         )
 
+    def _contains_items(self, other):
+        return self._contains_in_order(other, self.items_to_match)
+
+    def _compile(self):
+        # Match literals like `list.index()` does: by identity, then equality
+        predicates = [
+            (
+                item.compile()
+                if isinstance(item, Matcher)
+                else lambda other, item=item: other is item or other == item
+            )
+            for item in self.items_to_match
+        ]
+
+        def predicate(container):
+            try:
+                container = _as_sequence(container)
+            except TypeError:
+                return False
+
+            position = 0
+            for item_predicate in predicates:
+                for index in range(position, len(container)):
+                    if item_predicate(container[index]):
+                        position = index + 1
+                        break
+                else:
+                    return False
+
+            return True
+
+        return predicate
+
     @classmethod
     def _contains_in_order(cls, container, items_to_match):
         """Check if each item can be found in order in the container.
@@ -22,7 +93,7 @@ class AnyIterableWithItemsInOrder(Matcher):
         """
         # Ensure we can work with generators
         try:
-            container = list(container)
+            container = _as_sequence(container)
         except TypeError:
             # It's not even iterable
             return False
@@ -42,133 +113,336 @@ class AnyIterableWithItemsInOrder(Matcher):
         return True
 
 
+# Values of these types can only be equal to values of the same types, and
+# two values with the same type and value can't be told apart by any matcher
+_LITERAL_TYPES = frozenset((str, bytes, int, bool, type(None)))
+
+
 class AnyIterableWithItems(Matcher):
     """Matches any item which contains certain elements."""
 
     def __init__(self, items_to_match):
+        self.items_to_match = items_to_match
+
         super().__init__(
-            f"* contains {items_to_match} in any order *",
-            lambda other: self._contains_in_any_order(other, items_to_match),
+            f"* contains {items_to_match} in any order *", self._contains_items
         )
 
+    def _contains_items(self, other):
+        return self._contains_in_any_order(other, self.items_to_match)
+
+    def _compile(self):
+        predicates = [compile_value(item) for item in self.items_to_match]
+
+        def predicate(container):
+            try:
+                container = as_collection(container)
+            except TypeError:
+                return False
+
+            return (
+                self._find_solution(container, self.items_to_match, predicates)
+                is not None
+            )
+
+        return predicate
+
     @classmethod
     def _contains_in_any_order(cls, container, items_to_match):
         # See `containment.md` for a description of this algorithm
         try:
-            container = list(container)
+            container = as_collection(container)
         except TypeError:
             # Not even an iterable
             return False
 
-        # Create a tuple of tuples containing the matcher index, and the set of all
-        # possible indices of items from the container which could be a match. From
-        # here on in, we deal entirely with indices, no matcher matching will happen
-        # again.
-        unsolved = tuple(
-            (
-                match_index,
-                {
-                    item_index
-                    for item_index, item in enumerate(container)
-                    if item == matcher
-                },
-            )
-            for match_index, matcher in enumerate(items_to_match)
-        )
+        predicates = [
+            lambda item, matcher=matcher: item == matcher for matcher in items_to_match
+        ]
 
-        if matched_item_indices := cls._solve(unsolved=unsolved, solved=[]):
+        if (
+            matched_item_indices := cls._find_solution(
+                container, items_to_match, predicates
+            )
+        ) is not None:
             # Update any matchers to have the correct last history entry.
 
             # For each item in items to match which is matcher, set its history
             # as if it had just matched against the corresponding item in
             # container. This will fix the history we mess up during with
             # matching operations creating unsolved above.
-            for item_to_match, matched_item_index in zip(
-                items_to_match, matched_item_indices
-            ):
-                if isinstance(item_to_match, Matcher):
-                    item_to_match.matched_to = [container[matched_item_index]]
+            matched = {
+                matched_item_index: item_to_match
+                for item_to_match, matched_item_index in zip(
+                    items_to_match, matched_item_indices
+                )
+                if isinstance(item_to_match, Matcher)
+            }
+            for item_index, item in enumerate(container):
+                if item_index in matched:
+                    matched[item_index].matched_to = [item]
 
             return True
 
         return False
 
     @classmethod
-    def _solve(cls, unsolved: tuple, solved: list):
-        """Get the first solution as a mapping from match to item index.
+    def _find_solution(cls, container, items_to_match, predicates):
+        """Get the index of the container item each item to match pairs with.
+
+        :param container: Collection of items to match against
+        :param items_to_match: List of items to match
+        :param predicates: A function for each item to match, which tells if
+            a container item is a match for it
+        :return: Tuple of container indices, or None if there's no solution
+        """
+        if (solution := cls._pair_literals(container, items_to_match)) is None:
+            return None
+
+        match_indices = [
+            index for index in range(len(items_to_match)) if index not in solution
+        ]
+        used = set(solution.values())
+
+        # Create a list containing, for each item to match, the list of
+        # possible indices of items from the container which could be a match.
+        # From here on in, we deal entirely with indices, no matcher matching
+        # will happen again.
+
+        # An item with as many possibilities as there are items to match can
+        # always find one which is free, so we can stop looking after that.
+        limit = len(match_indices)
+        possibilities = [
+            list(
+                islice(
+                    (
+                        item_index
+                        for item_index, item in enumerate(container)
+                        if item_index not in used and predicates[match_index](item)
+                    ),
+                    limit,
+                )
+            )
+            for match_index in match_indices
+        ]
+
+        if (matched := cls._solve(possibilities)) is None:
+            return None
+
+        solution.update(zip(match_indices, matched))
+
+        return tuple(
+            solution[match_index] for match_index in range(len(items_to_match))
+        )
+
+    @classmethod
+    def _pair_literals(cls, container, items_to_match):
+        """Pair literal items to match with identical container items.
 
-        :param unsolved: Tuple of match indicies to set of target indicies
-        :param solved: Tuple of match indicies to target indicies
-        :return: Tuple of matching target indices
+        Plain literals like strings and ints can be paired up by counting
+        them, without comparing them to every item in the container. This is
+        only done for a literal when every container item equal to it has the
+        same type. Any of those can then be swapped for another in a
+        solution, so it doesn't matter which we pick.
+
+        :return: A dict of match index to item index for the paired
+            literals, or None if a literal can't be found
         """
+        if not (literals := cls._index_literals(items_to_match)):
+            return {}
+
+        # A map from value, to type, to the indices of container items. As
+        # `1 == True` this groups equal values of different types together.
+        available = defaultdict(lambda: defaultdict(list))
+        values = {value for _type, value in literals}
+        for item_index, item in enumerate(container):
+            if type(item) in _LITERAL_TYPES:
+                if item in values:
+                    available[item][type(item)].append(item_index)
+
+            else:
+                # Anything else could be equal to anything
+                values.difference_update([value for value in values if item == value])
+
+        solution = {}
+        for (literal_type, value), match_indices in literals.items():
+            by_type = available.get(value, {})
+            if value not in values or by_type.keys() - {literal_type}:
+                # We can't be sure which container items this can pair with
+                continue
+
+            item_indices = by_type.get(literal_type, ())
+            if len(item_indices) < len(match_indices):
+                return None
+
+            solution.update(zip(match_indices, item_indices))
+
+        return solution
+
+    @staticmethod
+    def _index_literals(items_to_match):
+        """Get a map of (type, value) to match indices for literal items."""
+        literals = defaultdict(list)
+        for match_index, item in enumerate(items_to_match):
+            if type(item) in _LITERAL_TYPES:
+                literals[(type(item), item)].append(match_index)
+
+        return literals
 
-        # If there are no more unsolved parts, we are done! This is the recusion
-        # base case.
-        if not unsolved:
-            return tuple(item_index for _match_index, item_index in sorted(solved))
-
-        # Sort our unsolved parts by the number of possibilities they have.
-        # Solve those with fewer possibilities first as they are less free.
-        # Separate out the head as the most constrained.
-        head, *tail = sorted(unsolved, key=lambda item: len(item[1]))
-        head_pos, head_possibilities = head
-
-        for chosen_match in head_possibilities:
-            # For every possible match from the head we recurse in...
-
-            if result := cls._solve(
-                # Create a new unsolved tuple by removing the match from all the
-                # other unsolved parts. It's no longer a possibility for them
-                # another part has matched it against the head.
-                unsolved=tuple(
-                    (pos, possibility - {chosen_match}) for pos, possibility in tail
-                ),
-                # Extend the solved parts with the new solution
-                solved=solved + [(head_pos, chosen_match)],
-            ):
-                return result
+    @classmethod
+    def _solve(cls, possibilities: list):
+        """Get the first solution as a mapping from match to item index.
 
-        return None
+        :param possibilities: List of lists of possible item indices for each
+            item to match
+        :return: Tuple of matching item indices, or None if there is no way
+            to match every item
+        """
+        return _BipartiteMatching(possibilities).solve()
 
 
 class AnyMappingWithItems(Matcher):
     """Matches any mapping contains specified key value pairs."""
 
     def __init__(self, key_values):
-        super().__init__(
-            f"* contains {key_values} *",
-            lambda other: self._contains_values(other, key_values),
-        )
+        self.key_values = key_values
+        self._keyed_items = self._get_keyed_items(key_values)
+
+        super().__init__(f"* contains {key_values} *", self._contains_values)
+
+    def _compile(self):
+        flat_key_values = self._normalise_items(self.key_values)
+        keyed_predicates = None
+        if self._keyed_items is not None:
+            keyed_predicates = [
+                (key, compile_value(value)) for key, value in self._keyed_items
+            ]
+        items_predicate = AnyIterableWithItems(
+            [_AnyPair(key, value) for key, value in flat_key_values]
+        ).compile()
+
+        def call(value_predicate, other):
+            return value_predicate(other)
+
+        def predicate(container):
+            if keyed_predicates is not None and isinstance(container, dict):
+                return self._dict_comparison(container, keyed_predicates, call)
+
+            if not hasattr(container, "items"):
+                return False
 
-    @classmethod
-    def _contains_values(cls, container, key_values):
-        # Direct dict comparison is 200-300x faster than the more generic
+            items = self._normalise_items(container)
+            if keyed_predicates is not None and (
+                (values := self._values_by_key(items)) is not None
+            ):
+                return self._keyed_comparison(values, keyed_predicates, call)
+
+            return items_predicate(items)
+
+        return predicate
+
+    def _contains_values(self, container):
+        # Looking up keys directly is 200-300x faster than the more generic
         # fallback, which runs a search algorithm. So if we are comparing
-        # to a plain dict, it's much better
-        if isinstance(container, dict):
-            return cls._dict_comparison(container, key_values)
+        # to a dict, it's much better. Other mappings (like case-insensitive
+        # or multi-value dicts) can find keys their items don't have, so we
+        # read their items into a dict once, and look keys up in that
+        if self._keyed_items is not None and isinstance(container, dict):
+            return self._dict_comparison(container, self._keyed_items, eq)
 
-        if hasattr(container, "items"):
-            return cls._mapping_comparison(container, key_values)
+        if not hasattr(container, "items"):
+            return False
 
-        return False
+        items = self._normalise_items(container)
+        if self._keyed_items is not None and (
+            (values := self._values_by_key(items)) is not None
+        ):
+            return self._keyed_comparison(values, self._keyed_items, eq)
+
+        return self._mapping_comparison(items, self.key_values)
 
     @classmethod
-    def _dict_comparison(cls, container, key_values):
-        for key, value in key_values.items():
-            if key not in container:
+    def _get_keyed_items(cls, key_values):
+        """Get the key value pairs if we can look them up by key, or None.
+
+        Looking keys up only gives the same answer as searching the items if
+        every key is a plain hashable value, and no key appears twice.
+        """
+        items = cls._normalise_items(key_values)
+        keys = set()
+
+        for key, _ in items:
+            if isinstance(key, Matcher):
+                return None
+
+            try:
+                keys.add(key)
+            except TypeError:
+                return None
+
+        if len(keys) != len(items):
+            return None
+
+        return items
+
+    @staticmethod
+    def _dict_comparison(container, items, compare):
+        """Look up each key in a dict and compare its value.
+
+        We use the plain `dict` methods, so subclasses which change how keys
+        are looked up find the same keys as searching their items would.
+
+        :param container: The dict to check
+        :param items: Key and value (or predicate) pairs to look for
+        :param compare: A function taking our value and the container's value
+        """
+        for key, value in items:
+            # Do the comparison backwards to give matchers a chance to kick in
+            if not dict.__contains__(container, key) or not compare(
+                value, dict.__getitem__(container, key)
+            ):
                 return False
 
+        return True
+
+    @staticmethod
+    def _values_by_key(items):
+        """Get a dict of the values for each key, or None if we can't.
+
+        :param items: Key value pairs, where keys may be repeated
+        :return: A dict of lists of values, or None if a key can't be hashed
+        """
+        values = {}
+
+        try:
+            for key, value in items:
+                values.setdefault(key, []).append(value)
+        except TypeError:
+            return None
+
+        return values
+
+    @staticmethod
+    def _keyed_comparison(values, items, compare):
+        """Look up each key and compare its values.
+
+        Keys with more than one value (like in multi-dicts) match if any of
+        the values do.
+
+        :param values: A dict of lists of values from `_values_by_key()`
+        :param items: Key and value (or predicate) pairs to look for
+        :param compare: A function taking our value and the container's value
+        """
+        for key, value in items:
             # Do the comparison backwards to give matchers a chance to kick in
-            if value != container[key]:
+            if not any(compare(value, other) for other in values.get(key, ())):
                 return False
 
         return True
 
     @classmethod
-    def _mapping_comparison(cls, container, key_values):
+    def _mapping_comparison(cls, items_to_compare, key_values):
         flat_key_values = cls._normalise_items(key_values)
-        items_to_compare = cls._normalise_items(container)
 
         return items_to_compare == AnyIterableWithItems(flat_key_values)
 
@@ -176,3 +450,163 @@ class AnyMappingWithItems(Matcher):
     def _normalise_items(cls, mapping):
         """Handle badly behaved items() implementations returning lists."""
         return tuple((k, v) for k, v in mapping.items())
+
+
+class _AnyPair(Matcher):
+    """Matches a key value pair, where either may be a matcher."""
+
+    def __init__(self, key, value):
+        self.pair = (key, value)
+
+        super().__init__(f"{self.pair}", self._is_pair)
+
+    def _is_pair(self, other):
+        return other == self.pair
+
+    def _compile(self):
+        key_predicate = compile_value(self.pair[0])
+        value_predicate = compile_value(self.pair[1])
+
+        return (
+            lambda other: isinstance(other, tuple)
+            and len(other) == 2
+            and key_predicate(other[0])
+            and value_predicate(other[1])
+        )
+
+
+class _BipartiteMatching:
+    """Match items to match with container items using Hopcroft-Karp.
+
+    This finds a maximum bipartite matching in O(E * sqrt(V)) time for E
+    possibilities and V items. See `containment.md` for more details.
+    """
+
+    def __init__(self, possibilities):
+        self.possibilities = possibilities
+
+        # Map from match index to item index and back again
+        self.match_to_item = [None] * len(possibilities)
+        self.item_to_match = {}
+
+        # The distance to each item to match along alternating paths, and the
+        # length of the shortest augmenting path in the current phase
+        self.distance = None
+        self.limit = inf
+
+    def solve(self):
+        """Get the item index for each item to match, or None if impossible."""
+        if not all(self.possibilities):
+            return None
+
+        matching = self.maximum()
+        if None in matching:
+            return None
+
+        return matching
+
+    def maximum(self):
+        """Match as many items to match as possible.
+
+        :return: A tuple of the item index for each item to match, or None
+            for those which couldn't be matched
+        """
+        self._match_greedily()
+
+        # Stop when there are no augmenting paths left, as this is the best
+        # we can do, even if it doesn't match everything
+        while None in self.match_to_item and self._layer():
+            for match_index, item_index in enumerate(self.match_to_item):
+                if item_index is None:
+                    self._augment(match_index)
+
+        return tuple(self.match_to_item)
+
+    def _match_greedily(self):
+        """Start with a greedy matching, most constrained first.
+
+        For most real world inputs this is a complete solution, and we never
+        need to search.
+        """
+        for match_index in sorted(
+            range(len(self.possibilities)),
+            key=lambda index: len(self.possibilities[index]),
+        ):
+            for item_index in self.possibilities[match_index]:
+                if item_index not in self.item_to_match:
+                    self._pair(match_index, item_index)
+                    break
+
+    def _layer(self):
+        """Breadth first search from the unmatched items to match.
+
+        :return: True if there are any augmenting paths
+        """
+        self.distance = [inf] * len(self.possibilities)
+        self.limit = inf
+
+        queue = deque()
+        for match_index, item_index in enumerate(self.match_to_item):
+            if item_index is None:
+                self.distance[match_index] = 0
+                queue.append(match_index)
+
+        while queue:
+            match_index = queue.popleft()
+            if self.distance[match_index] >= self.limit:
+                continue
+
+            for item_index in self.possibilities[match_index]:
+                next_match_index = self.item_to_match.get(item_index)
+
+                if next_match_index is None:
+                    self.limit = min(self.limit, self.distance[match_index] + 1)
+
+                elif self.distance[next_match_index] == inf:
+                    self.distance[next_match_index] = self.distance[match_index] + 1
+                    queue.append(next_match_index)
+
+        return self.limit != inf
+
+    def _augment(self, root):
+        """Depth first search for a shortest augmenting path and apply it.
+
+        This is iterative rather than recursive, so long paths don't hit the
+        recursion limit.
+        """
+        stack = [(root, iter(self.possibilities[root]))]
+        path = []
+
+        while stack:
+            match_index, item_indices = stack[-1]
+            next_distance = self.distance[match_index] + 1
+
+            for item_index in item_indices:
+                next_match_index = self.item_to_match.get(item_index)
+
+                if next_match_index is None:
+                    if next_distance == self.limit:
+                        # Found a free item: flip every edge along the path
+                        path.append((match_index, item_index))
+                        for path_match_index, path_item_index in path:
+                            self._pair(path_match_index, path_item_index)
+
+                        return
+
+                elif self.distance[next_match_index] == next_distance:
+                    path.append((match_index, item_index))
+                    stack.append(
+                        (next_match_index, iter(self.possibilities[next_match_index]))
+                    )
+                    break
+
+            else:
+                # Dead end, don't come this way again in this phase
+                self.distance[match_index] = inf
+                stack.pop()
+                if path:
+                    path.pop()
+
+    def _pair(self, match_index, item_index):
+        self.match_to_item[match_index] = item_index
+        self.item_to_match[item_index] = match_index
@@ -1,37 +1,121 @@
 """Matchers formed of combinations of other things."""
 
-from h_matchers.matcher.core import Matcher
+from h_matchers.matcher.core import Matcher, compile_value
+
+# Values of these types are only ever equal to values of the same types, and
+# equal values always hash the same. This means a set lookup gives the same
+# answer as `==` (including `True == 1`) as long as the thing being compared
+# is one of these types too.
+_HASHABLE_LITERAL_TYPES = frozenset((str, bytes, int, bool, float, complex, type(None)))
 
 
 class AnyOf(Matcher):
-    """Match any one of a series of options."""
+    """Match any one of a series of options.
+
+    Plain literal options (strings, numbers, `None` etc.) are kept in a set,
+    so matching against a large number of them doesn't require comparing to
+    each one in turn.
+    """
 
     def __init__(self, options):
-        options = list(options)  # Coerce generators into concrete list
+        self.options = list(options)  # Coerce generators into concrete list
 
-        super().__init__(
-            f"* any of {options} *",
-            lambda other: other in options,
+        self._literals = frozenset(
+            option for option in self.options if type(option) in _HASHABLE_LITERAL_TYPES
         )
+        self._others = [
+            option
+            for option in self.options
+            if type(option) not in _HASHABLE_LITERAL_TYPES
+        ]
+
+        super().__init__(f"* any of {self.options} *", self._is_any_of)
+
+    def _is_any_of(self, other):
+        if type(other) in _HASHABLE_LITERAL_TYPES:
+            return other in self._literals or other in self._others
+
+        # Other types can have arbitrary `__eq__` methods, so give them the
+        # chance to compare against every option
+        return other in self.options
+
+    def _compile(self):
+        literals = self._literals
+        # Keep plain values in a list, so we get the same semantics as `in`
+        values = [option for option in self.options if not isinstance(option, Matcher)]
+        other_values = [
+            option for option in self._others if not isinstance(option, Matcher)
+        ]
+        predicates = [option.compile() for option in self._child_matchers()]
+
+        def predicate(other):
+            if type(other) in _HASHABLE_LITERAL_TYPES:
+                if other in literals or other in other_values:
+                    return True
+
+            elif other in values:
+                return True
+
+            for option_predicate in predicates:
+                if option_predicate(other):
+                    return True
+
+            return False
+
+        return predicate
+
+    def _match_many(self, items):
+        if self._others:
+            return super()._match_many(items)
+
+        # With only literal options, literal objects need just a set lookup
+        literals = self._literals
+        predicate = self.compile()
+
+        return [
+            (
+                item in literals
+                if type(item) in _HASHABLE_LITERAL_TYPES
+                else predicate(item)
+            )
+            for item in items
+        ]
 
 
 class AllOf(Matcher):
     """Match only when all of a series of options match."""
 
     def __init__(self, options):
-        options = list(options)  # Coerce generators into concrete list
+        self.options = list(options)  # Coerce generators into concrete list
 
-        super().__init__(
-            f"* all of {options} *",
-            lambda other: all(option == other for option in options),
-        )
+        super().__init__(f"* all of {self.options} *", self._matches_all)
+
+    def _matches_all(self, other):
+        return all(option == other for option in self.options)
+
+    def _compile(self):
+        predicates = [compile_value(option) for option in self.options]
+
+        def predicate(other):
+            for option_predicate in predicates:
+                if not option_predicate(other):
+                    return False
+
+            return True
+
+        return predicate
 
 
 class NamedMatcher(Matcher):
     """Wrap a matcher with a custom description for nice stringification."""
 
     def __init__(self, description, matcher):
+        self.matcher = matcher
+
         super().__init__(description, matcher.__eq__)
 
+    def _compile(self):
+        return self.matcher.compile()
+
     def __repr__(self):
         return self._description
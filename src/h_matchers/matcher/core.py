@@ -3,8 +3,296 @@
 These are not intended to be used directly.
 """
 
+import copy
+from functools import partial
+from importlib import import_module
+from types import MethodType
+from weakref import WeakValueDictionary
 
-class Matcher:
+from h_matchers.matcher.cache import CacheInfo, ResultCache, cache_key
+from h_matchers.matcher.history import History
+
+
+class MatchResult:
+    """The result of comparing a matcher with an object.
+
+    This is truthy when there was a match, and falsy when there wasn't. When
+    there isn't a match, `reason` explains why. The reason is only formatted
+    when it's asked for, as most failures are never looked at.
+    """
+
+    __slots__ = ("matched", "_reason", "_args")
+
+    def __init__(self, matched, reason, *args):
+        """Create a new result.
+
+        :param matched: Whether there was a match
+        :param reason: A description of why there was no match (or None).
+            If `args` are provided this is a template for `str.format()`
+        :param args: Arguments to format into the reason
+        """
+        self.matched = bool(matched)
+        self._reason = reason
+        self._args = args
+
+    @property
+    def reason(self):
+        """Get the reason there was no match (or None if there was)."""
+        if self._args:
+            self._reason = self._reason.format(*self._args)
+            self._args = ()
+
+        return self._reason
+
+    def __bool__(self):
+        return self.matched
+
+    def __str__(self):
+        return "Matched" if self.matched else str(self.reason)
+
+    def __repr__(self):
+        return f"<MatchResult {self}>"
+
+
+MATCH = MatchResult(True, None)
+"""A shared result for successful matches."""
+
+
+class Sentinel:
+    """A unique marker object, which is still the same object when pickled.
+
+    Sentinels must be stored as a module level variable with the name they
+    are given, so they can be found again when unpickled.
+    """
+
+    def __init__(self, module, name):
+        """Create a new sentinel.
+
+        :param module: The name of the module the sentinel is stored in
+        :param name: The name of the variable the sentinel is stored in
+        """
+        self._module = module
+        self._name = name
+
+    def __reduce__(self):
+        return _find_sentinel, (self._module, self._name)
+
+    def __repr__(self):
+        return f"<{self._name}>"
+
+
+def _find_sentinel(module, name):
+    return getattr(import_module(module), name)
+
+
+def match_value(value, other):
+    """Compare an object to a value which may be a matcher.
+
+    :param value: A matcher, or any plain value to compare with `==`
+    :param other: The object to compare to
+    :return: A `MatchResult`
+    """
+    if isinstance(value, Matcher):
+        return value.match(other)
+
+    if value == other:
+        return MATCH
+
+    return MatchResult(False, "{!r} != {!r}", other, value)
+
+
+def compile_value(value):
+    """Get a predicate which compares objects to a value.
+
+    :param value: A matcher, or any plain value to compare with `==`
+    :return: A function which takes an object and returns whether it matches
+    """
+    if isinstance(value, Matcher):
+        return value.compile()
+
+    return lambda other: value == other
+
+
+def freeze_value(value):
+    """Get a version of a value which can't be changed.
+
+    Lists, tuples, dicts and sets are copied into read only versions, and any
+    matchers in them are frozen in place.
+
+    :param value: Part of a matcher's configuration
+    :return: The value, or a read only copy of it
+    """
+    if isinstance(value, Matcher):
+        value._freeze()  # pylint: disable=protected-access
+        return value
+
+    if isinstance(value, MethodType):
+        # The test function of a matcher is usually a method of a matcher
+        freeze_value(value.__self__)
+        return value
+
+    if isinstance(value, partial):
+        return partial(
+            freeze_value(value.func),
+            *freeze_value(value.args),
+            **{key: freeze_value(item) for key, item in value.keywords.items()},
+        )
+
+    if (frozen_type := _FROZEN_TYPES.get(type(value))) is None:
+        return value
+
+    if isinstance(value, dict):
+        return frozen_type((key, freeze_value(item)) for key, item in value.items())
+
+    return frozen_type(freeze_value(item) for item in value)
+
+
+def _immutable(self, *_args, **_kwargs):
+    raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+
+class _FrozenList(list):
+    """A list which can't be changed, for sharing safely."""
+
+    __slots__ = ()
+    _THAWED_TYPE = list
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+class _FrozenDict(dict):
+    """A dict which can't be changed, for sharing safely."""
+
+    __slots__ = ()
+    _THAWED_TYPE = dict
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class _FrozenSet(set):
+    """A set which can't be changed, for sharing safely."""
+
+    __slots__ = ()
+    _THAWED_TYPE = set
+
+    __iand__ = __ior__ = __isub__ = __ixor__ = _immutable
+    add = clear = discard = pop = remove = _immutable
+    difference_update = intersection_update = _immutable
+    symmetric_difference_update = update = _immutable
+
+    def __reduce__(self):
+        return type(self), (set(self),)
+
+
+# The read only versions of the types `freeze_value()` copies
+_FROZEN_TYPES = {
+    list: _FrozenList,
+    tuple: tuple,
+    dict: _FrozenDict,
+    set: _FrozenSet,
+    frozenset: frozenset,
+    _FrozenList: _FrozenList,
+    _FrozenDict: _FrozenDict,
+    _FrozenSet: _FrozenSet,
+}
+
+
+def _thawed_type(value):
+    # Read only copies count as the type they were copied from, so freezing
+    # doesn't change a fingerprint
+    return getattr(type(value), "_THAWED_TYPE", type(value))
+
+
+class _Identity:
+    """Wraps an unhashable value so it's hashed and compared by identity."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.value is self.value
+
+    def __hash__(self):
+        return id(self.value)
+
+
+def _find_matchers(value):
+    """Get the matchers in a value, including inside lists, dicts and sets."""
+    if isinstance(value, Matcher):
+        yield value
+
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _find_matchers(key)
+            yield from _find_matchers(item)
+
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            yield from _find_matchers(item)
+
+
+def _fingerprint_value(value, owner):  # pylint: disable=too-many-return-statements
+    """Get a hashable summary of part of a matcher's configuration.
+
+    :param value: The value to summarise
+    :param owner: The matcher the value belongs to
+    """
+    if isinstance(value, Matcher):
+        return value.fingerprint()
+
+    if isinstance(value, MethodType):
+        # Most matchers pass one of their own methods as their test function
+        target = value.__self__
+        return (
+            MethodType,
+            value.__func__,
+            None if target is owner else _fingerprint_value(target, owner),
+        )
+
+    if isinstance(value, partial):
+        return (
+            partial,
+            _fingerprint_value(value.func, owner),
+            _fingerprint_value(value.args, owner),
+            _fingerprint_value(value.keywords, owner),
+        )
+
+    if isinstance(value, dict):
+        return _thawed_type(value), frozenset(
+            (_fingerprint_value(key, owner), _fingerprint_value(item, owner))
+            for key, item in value.items()
+        )
+
+    if isinstance(value, (list, tuple)):
+        return _thawed_type(value), tuple(
+            _fingerprint_value(item, owner) for item in value
+        )
+
+    if isinstance(value, (set, frozenset)):
+        return _thawed_type(value), frozenset(
+            _fingerprint_value(item, owner) for item in value
+        )
+
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(value)
+
+    # Include the type, so options like `1` and `True` aren't the same
+    return type(value), value
+
+
+class Matcher:  # pylint: disable=too-many-instance-attributes
     """Used as the base class for concrete matching classes.
 
     Implements a base class for use in the testing pattern where an object
@@ -17,12 +305,46 @@ class Matcher:
     Enable raising on comparison instead of returning False.
 
     This can be very useful for debugging as we can fail fast and return a
-    message about why we can't match. We might want to think about making this
-    a more general feature. It is up to individual matchers to support it.
+    message about why we can't match.
+    """
+
+    history = History.last(1)
+    """
+    The policy for how many matched objects to remember.
+
+    This can be set on the class to change the default for all matchers, or
+    on an individual matcher with `keep_history()`. See
+    `h_matchers.matcher.history` for the available policies.
     """
 
-    matched_to: list
-    """A list of all matched objects."""
+    _results = None
+    """The cache of match results, if `cache_results()` has turned it on."""
+
+    # How many times this matcher has been changed. Cached results are dropped
+    # when this moves on, for this matcher or any matcher inside it
+    _generation = 0
+
+    _frozen = False
+    """Whether this is a shared matcher from `interned()`, which can't change."""
+
+    # The predicate and fingerprint of a frozen matcher, once worked out
+    _compiled = None
+    _fingerprint = None
+
+    # Attributes which don't change what a matcher matches
+    _UNMATCHED_ATTRIBUTES = frozenset(
+        (
+            "history",
+            "_results",
+            "_frozen",
+            "_compiled",
+            "_fingerprint",
+            "_generation",
+        )
+    )
+
+    # Interned matchers by fingerprint, kept for as long as they are in use
+    _interned = WeakValueDictionary()
 
     def __init__(self, description, test_function):
         self._description = description
@@ -30,17 +352,322 @@ class Matcher:
         self.reset()
 
     def __eq__(self, other):
+        result = self.match(other)
+
+        if not result and self.assert_on_comparison:
+            raise AssertionError(result.reason)
+
+        return result.matched
+
+    def __hash__(self):
+        # A hash has to stay the same, so only matchers which can't change
+        # have one
+        if not self._frozen:
+            raise TypeError(
+                f"unhashable type: '{type(self).__name__}' (use interned() for a "
+                "hashable matcher)"
+            )
+
+        return hash(self.fingerprint())
+
+    def fingerprint(self):
+        """Get a hashable summary of how this matcher is configured.
+
+        Matchers of the same type which are configured in the same way have
+        equal fingerprints, even if they are separate objects. Note that `==`
+        still matches, rather than comparing configuration, so use this to
+        compare matchers.
+
+        The fingerprint changes if the matcher is changed, so matchers can't
+        be kept in sets or used as keys in dicts, unless they are interned.
+
+        Values without a hash (other than lists, dicts and sets) are compared
+        by identity.
+
+        :return: A hashable value
+        """
+        if self._fingerprint is not None:
+            return self._fingerprint
+
+        fingerprint = type(self), frozenset(
+            (name, _fingerprint_value(value, self))
+            for name, value in self.__getstate__().items()
+            if name not in self._UNMATCHED_ATTRIBUTES
+        )
+        if self._frozen:
+            # This can't change, so there's no need to work it out again
+            self._fingerprint = fingerprint
+
+        return fingerprint
+
+    def interned(self):
+        """Get a shared, unchangeable copy of this matcher.
+
+        Every matcher with the same fingerprint gets the same copy, so
+        thousands of identical matchers only take up the space of one, and
+        are only compiled once. Interned matchers don't record any history,
+        and raise `TypeError` if you try to change them, or any matcher or
+        list, dict or set inside them. As they can't change, they can be kept
+        in sets or used as keys in dicts.
+
+        :return: A matcher which matches the same things as this one
+        """
+        fingerprint = self.fingerprint()
+
+        if (shared := self._interned.get(fingerprint)) is None:
+            shared = copy.deepcopy(self)
+            shared._freeze()  # pylint: disable=protected-access
+            # The copy has the same configuration, but unhashable values in
+            # it are different objects, so they wouldn't give the same result
+            shared._fingerprint = fingerprint  # pylint: disable=protected-access
+            self._interned[fingerprint] = shared
+
+        return shared
+
+    def _freeze(self):
+        """Stop this matcher, and anything in it, from being changed.
+
+        Matchers with configuration `freeze_value()` can't make read only
+        should override this.
+        """
+        if self._frozen:
+            return
+
+        self.keep_history(History.off())
+        self._fingerprint = self.fingerprint()
+        self._frozen = True
+
+        for name, value in self.__getstate__().items():
+            if name not in self._UNMATCHED_ATTRIBUTES:
+                self.__dict__[name] = freeze_value(value)
+
+    def match(self, other):
+        """Compare this matcher with another object.
+
+        This is what `==` uses, but instead of a boolean you get a
+        `MatchResult`, which can tell you why there was no match.
+
+        :param other: The object to compare to
+        :return: A `MatchResult`
+        """
+        result = self._cached_match(other)
+
+        if result:
+            self._history.append(other)
+
+        return result
+
+    def assert_equal_to(self, other):
+        """Assert that this matcher matches another object.
+
+        :raise AssertionError: If no match is found with details of why
+        :return: True if equal
+        """
+        result = self._cached_match(other)
+        if not result:
+            raise AssertionError(result.reason)
+
+        return True
+
+    def cache_results(self, size=128, eviction="lru"):
+        """Remember the results of matching values which can't change.
+
+        See `h_matchers.matcher.cache` for which values are cached. Matchers
+        inside this one don't record any history for cached results.
+
+        The results are dropped when this matcher, or one inside it, is
+        changed with a fluent method. Changing anything else this matcher was
+        given (like a list of options) isn't noticed, so don't.
+
+        :param size: The number of results to keep, or 0 to stop caching
+        :param eviction: Drop the least recently used result ("lru") or the
+            oldest result ("fifo") when the cache is full
+        :raise ValueError: If the size is negative or the eviction policy
+            isn't known
+        :return: self - for fluent chaining
+        """
+        self._check_not_frozen()
+
+        if size < 0:
+            raise ValueError("The cache size can't be negative")
+
+        self._results = ResultCache(size, eviction) if size else None
+
+        return self
+
+    def cache_info(self):
+        """Get statistics about the results cache.
+
+        :return: A `CacheInfo` with `hits`, `misses`, `maxsize`, `currsize`
+            and `hit_rate`. Everything is 0 if results aren't being cached.
+        """
+        if self._results is None:
+            return CacheInfo(0, 0, 0, 0)
+
+        return self._results.info()
+
+    def _on_reconfigure(self):
+        """Clear anything which depends on how this matcher is configured.
+
+        Anything which changes what this matcher matches should call this
+        before making the change.
+
+        :raise TypeError: If this matcher is interned, so can't be changed
+        """
+        self._check_not_frozen()
+
+        self._generation += 1
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise TypeError("Interned matchers can't be changed")
+
+    def _cached_match(self, other):
+        """Get a `MatchResult` from the cache, or by calling `_match()`."""
+        if self._results is None or (key := cache_key(other)) is None:
+            return self._match(other)
+
+        self._results.clear_if_stale(self._changeable_matchers)
+        if (result := self._results.get(key)) is None:
+            result = self._match(other)
+            self._results.put(key, result)
+
+        return result
+
+    def _match(self, other):
+        """Get a `MatchResult` for comparing with another object.
+
+        Matchers should override this to avoid raising exceptions when there
+        is no match. By default we call the test function, which can return
+        a `MatchResult`, a boolean or raise `AssertionError`.
+        """
         try:
-            matches = self._test_function(other)
-        except AssertionError:
-            if self.assert_on_comparison:
-                raise
-            matches = False
+            result = self._test_function(other)
+        except AssertionError as err:
+            return MatchResult(False, "{}", err)
+
+        if isinstance(result, MatchResult):
+            return result
+
+        if result:
+            return MATCH
+
+        return MatchResult(False, "{!r} does not match {}", other, self)
+
+    def compile(self):
+        """Compile this matcher into a single predicate function.
+
+        The returned function takes an object and returns True or False to
+        say whether it matches, without the overhead of comparing with `==`.
+        Matchers nested inside this one are compiled too, so the whole tree
+        is flattened into one call.
+
+        Compiled predicates don't record any history, don't raise on
+        mismatches, and don't reflect any later changes to the matcher.
+
+        Interned matchers are only compiled once, and return the same
+        predicate every time.
 
-        if matches:
-            self.matched_to.append(other)
+        :return: A function which takes an object and returns a boolean
+        """
+        if not self._frozen:
+            return self._compile()
+
+        if self._compiled is None:
+            self._compiled = self._compile()
+
+        return self._compiled
+
+    def match_many(self, items, indices=False):
+        """Check many objects against this matcher at once.
+
+        This is quicker than comparing each object with `==`. Like compiled
+        predicates, it doesn't record any history or raise on mismatches.
+
+        :param items: An iterable of objects to check
+        :param indices: Get the indices of the matching objects instead
+        :return: A list of booleans, one for each object, or a list of the
+            indices of the objects which matched
+        """
+        results = self._match_many(items)
+
+        if indices:
+            return [index for index, matched in enumerate(results) if matched]
+
+        return results
+
+    def match_many_parallel(self, items, indices=False, **kwargs):
+        """Check a very large number of objects using a pool of processes.
+
+        This is the same as `match_many()`, but shares the work out between
+        processes. See `h_matchers.matcher.parallel` for details.
+
+        :param items: An iterable of objects to check
+        :param indices: Get the indices of the matching objects instead
+        :param kwargs: Options for `match_many_parallel()` in
+            `h_matchers.matcher.parallel`
+        :return: The same as `match_many()`
+        """
+        # This pulls in `multiprocessing`, which is slow to import
+        # pylint: disable=import-outside-toplevel
+        from h_matchers.matcher.parallel import match_many_parallel
+
+        return match_many_parallel(self, items, indices=indices, **kwargs)
+
+    def filter(self, items):
+        """Get the objects which match, reading them only as needed.
+
+        :param items: An iterable of objects to check
+        :return: A generator of the matching objects
+        """
+        predicate = self.compile()
+
+        return (item for item in items if predicate(item))
+
+    def first_match(self, items, default=None):
+        """Get the first object which matches, without reading any further.
+
+        :param items: An iterable of objects to check
+        :param default: What to return if nothing matches
+        """
+        return next(self.filter(items), default)
+
+    def _match_many(self, items):
+        """Get a list of booleans saying whether each object matches.
+
+        Matchers which can check lots of objects quicker than one at a time
+        should override this.
+        """
+        predicate = self.compile()
+
+        return [predicate(item) for item in items]
+
+    def _compile(self):
+        """Get a predicate function for this matcher.
+
+        Matchers which can do better than wrapping their test function should
+        override this.
+        """
+        test_function = self._test_function
 
-        return matches
+        def predicate(other):
+            try:
+                return bool(test_function(other))
+            except AssertionError:
+                return False
+
+        return predicate
+
+    @property
+    def matched_to(self) -> list:
+        """A list of the matched objects retained by the history policy."""
+        return list(self._history)
+
+    @matched_to.setter
+    def matched_to(self, items):
+        self.reset()
+        for item in items:
+            self._history.append(item)
 
     def last_matched(self, default=None):
         """Get the last matched object, if any.
@@ -48,12 +675,97 @@ class Matcher:
         :param default: Default to return on no match. This can be used to
             distinguish between not matching and matching None.
         """
-        return self.matched_to[-1] if self.matched_to else default
+        matched_to = self.matched_to
+        return matched_to[-1] if matched_to else default
+
+    def keep_history(self, policy):
+        """Set the history policy for this matcher.
+
+        This will clear any existing history.
+
+        :param policy: A policy from `h_matchers.matcher.history.History`
+        :return: self - for fluent chaining
+        """
+        self._check_not_frozen()
+
+        self.history = policy
+        self.reset()
+
+        return self
+
+    def stateless(self):
+        """Stop this matcher, and any it contains, from recording history.
+
+        This is useful for matchers which are shared, for example as class
+        attributes, which would otherwise hold on to whatever they have
+        matched against.
+
+        :return: self - for fluent chaining
+        """
+        if self._frozen:
+            # Interned matchers are stateless already
+            return self
+
+        self.keep_history(History.off())
+
+        for child in self._child_matchers():
+            child.stateless()
+
+        return self
+
+    def _child_matchers(self):
+        """Get any matchers contained within this one.
+
+        By default these are found in the configuration of this matcher,
+        including inside lists, tuples, sets and dicts. Matchers which keep
+        other matchers anywhere else should override this.
+        """
+        return list(
+            _find_matchers(
+                [
+                    value
+                    for name, value in self.__getstate__().items()
+                    if name not in self._UNMATCHED_ATTRIBUTES
+                ]
+            )
+        )
+
+    def _changeable_matchers(self):
+        """Get this matcher and any inside it which could be changed."""
+        # Matchers can be shared, so each is only listed (and searched) once
+        matchers = {}
+        pending = [self]
+
+        # pylint: disable=protected-access
+        while pending:
+            matcher = pending.pop()
+            if id(matcher) not in matchers:
+                matchers[id(matcher)] = matcher
+                pending.extend(
+                    child for child in matcher._child_matchers() if not child._frozen
+                )
+
+        return list(matchers.values())
 
     def reset(self):
         """Clear any stored data (like `last_matched`)."""
 
-        self.matched_to = []
+        self._history = self.history()
+
+    def __getstate__(self):
+        # History can hold anything at all (including weak references), and
+        # isn't part of what the matcher matches, so it isn't pickled
+        state = self.__dict__.copy()
+        state.pop("_history", None)
+        # Compiled predicates can't be pickled, but can be made again
+        state.pop("_compiled", None)
+        state.pop("_fingerprint", None)
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.reset()
 
     def __str__(self):
         return self._description  # pragma: no cover
@@ -0,0 +1,106 @@
+"""Policies for how much of their match history matchers keep.
+
+Every matcher records the objects it has successfully matched against so
+that they can be retrieved with `last_matched()`. Left unchecked this list
+grows forever and holds a strong reference to everything ever matched, so
+the amount kept is controlled by a policy.
+
+A policy is called with no arguments to create an empty store. A store needs
+to support `append()` and iteration in the order items were added. The policies provided here are:
+
+ * `History.last(size)` - Keep the last `size` items (the default keeps 1)
+ * `History.unbounded()` - Keep everything
+ * `History.weak(size=1)` - Keep weak references to the last `size` items
+ * `History.off()` - Keep nothing at all
+"""
+
+import weakref
+from collections import deque
+from functools import partial
+
+
+class _Policy:
+    """A named factory for history stores."""
+
+    def __init__(self, description, factory):
+        self._description = description
+        self._factory = factory
+
+    def __call__(self):
+        return self._factory()
+
+    def __repr__(self):
+        return f"<History {self._description}>"
+
+
+class _NoHistory:
+    """A store which discards everything."""
+
+    def append(self, item):
+        """Discard the item."""
+
+    def __iter__(self):
+        return iter(())
+
+
+class _WeakHistory:
+    """A store which keeps weak references to the items it is given.
+
+    Items which can't be weakly referenced (like strings, ints, lists and
+    dicts) can't be kept without keeping them alive, so they are not recorded
+    at all. Items are silently dropped from the history when they are garbage
+    collected.
+    """
+
+    def __init__(self, size):
+        self._refs = deque(maxlen=size)
+
+    def append(self, item):
+        """Store a weak reference to the item if possible."""
+        try:
+            self._refs.append(weakref.ref(item))
+        except TypeError:
+            pass
+
+    def __iter__(self):
+        for ref in self._refs:
+            if (item := ref()) is not None:
+                yield item
+
+
+class History:
+    """Factories for the history policies which can be given to matchers."""
+
+    @staticmethod
+    def last(size):
+        """Keep strong references to the last `size` matched objects.
+
+        :param size: The number of objects to keep
+        :raise ValueError: If the size is less than 1
+        """
+        if size < 1:
+            raise ValueError("The history size must be at least 1")
+
+        return _Policy(f"last {size}", partial(deque, maxlen=size))
+
+    @staticmethod
+    def unbounded():
+        """Keep strong references to every matched object."""
+        return _Policy("unbounded", list)
+
+    @staticmethod
+    def weak(size=1):
+        """Keep weak references to the last `size` matched objects.
+
+        :param size: The number of references to keep
+        :raise ValueError: If the size is less than 1
+        """
+        if size < 1:
+            raise ValueError("The history size must be at least 1")
+
+        return _Policy(f"weak {size}", partial(_WeakHistory, size))
+
+    @staticmethod
+    def off():
+        """Keep no history at all."""
+        return _Policy("off", _NoHistory)
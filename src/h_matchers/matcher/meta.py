@@ -1,7 +1,5 @@
 """Matchers for comparing to functions and classes etc."""
 
-from inspect import isclass
-
 from h_matchers.matcher.core import Matcher
 
 __all__ = ["AnyCallable", "AnyFunction"]
@@ -13,11 +11,19 @@ class AnyCallable(Matcher):
     def __init__(self):
         super().__init__("* any callable *", callable)
 
+    def _compile(self):
+        return callable
+
 
 class AnyFunction(Matcher):
     """Matches any function, but not classes."""
 
     def __init__(self):
-        super().__init__(
-            "* any function *", lambda item: callable(item) and not isclass(item)
-        )
+        super().__init__("* any function *", self._is_function)
+
+    @staticmethod
+    def _is_function(item):
+        return callable(item) and not isinstance(item, type)
+
+    def _compile(self):
+        return self._is_function
@@ -1,8 +1,29 @@
 """A collection of matchers for various number types."""
 
+import operator
 from decimal import Decimal
+from functools import partial
 
-from h_matchers.matcher.core import Matcher
+from h_matchers.matcher.core import MATCH, Matcher, MatchResult
+
+# Conditions are module level functions (rather than lambdas) so matchers
+# can be pickled
+
+
+def _compare(comparison, value, other):
+    return comparison(other, value)
+
+
+def _is_multiple_of(value, other):
+    return not other % value
+
+
+def _is_odd(other):
+    return other % 2 == 1
+
+
+def _is_approximately(value, error_factor, other):
+    return abs(value - other) <= error_factor * float(value)
 
 
 class AnyNumber(Matcher):
@@ -14,25 +35,44 @@ class AnyNumber(Matcher):
     def __init__(self):
         self.conditions = []
 
-        super().__init__("dummy", self.assert_equal_to)
+        super().__init__("dummy", self._match)
 
-    def assert_equal_to(self, other):
+    def _match(self, other):
         # Ints are also booleans
-        assert other is not True and other is not False, "Not a boolean"
+        if other is True or other is False:
+            return MatchResult(False, "Not a boolean")
 
         # Check it's the right type
-        assert isinstance(other, self._types)
+        if not isinstance(other, self._types):
+            return MatchResult(False, "{!r} is not a {}", other, self._type_description)
 
         # Apply all the different conditions
         for label, test in self.conditions:
-            assert test(other), label
+            if not test(other):
+                return MatchResult(False, label)
+
+        return MATCH
+
+    def _compile(self):
+        types = self._types
+        tests = [test for _, test in self.conditions]
+
+        def predicate(other):
+            if other is True or other is False or not isinstance(other, types):
+                return False
 
-        return True
+            for test in tests:
+                if not test(other):
+                    return False
+
+            return True
+
+        return predicate
 
     def not_equal_to(self, value):
         """Constrain this number to be not equal to a number."""
 
-        return self._add_condition(f"!= {value}", lambda other: other != value)
+        return self._add_condition(f"!= {value}", partial(_compare, operator.ne, value))
 
     def truthy(self):
         """Constrain this number to be truthy."""
@@ -42,10 +82,12 @@ class AnyNumber(Matcher):
     def falsy(self):
         """Constrain this number to be falsy."""
 
-        return self._add_condition("falsy", lambda other: not bool(other))
+        return self._add_condition("falsy", operator.not_)
 
     def _add_condition(self, description, test):
+        self._on_reconfigure()
         self.conditions.append((description, test))
+
         return self
 
     def __str__(self):
@@ -70,28 +112,28 @@ class AnyReal(AnyNumber):
     def less_than(self, value):
         """Constrain this number to be less than a number."""
 
-        return self._add_condition(f"<{value}", lambda other: other < value)
+        return self._add_condition(f"<{value}", partial(_compare, operator.lt, value))
 
     def less_than_or_equal_to(self, value):
         """Constrain this number to be less than or equal a number."""
 
-        return self._add_condition(f">={value}", lambda other: other <= value)
+        return self._add_condition(f">={value}", partial(_compare, operator.le, value))
 
     def greater_than(self, value):
         """Constrain this number to be greater than a number."""
 
-        return self._add_condition(f">{value}", lambda other: other > value)
+        return self._add_condition(f">{value}", partial(_compare, operator.gt, value))
 
     def greater_than_or_equal_to(self, value):
         """Constrain this number to be greater than or equal to a number."""
 
-        return self._add_condition(f">={value}", lambda other: other >= value)
+        return self._add_condition(f">={value}", partial(_compare, operator.ge, value))
 
     def multiple_of(self, value):
         """Constrain this number to be a multiple of a number."""
 
         return self._add_condition(
-            f"multiple of {value}", lambda other: not other % value
+            f"multiple of {value}", partial(_is_multiple_of, value)
         )
 
     def even(self):
@@ -102,14 +144,14 @@ class AnyReal(AnyNumber):
     def odd(self):
         """Constrain this number to be odd."""
 
-        return self._add_condition("odd", lambda other: other % 2 == 1)
+        return self._add_condition("odd", _is_odd)
 
     def approximately(self, value, error_factor=0.05):
         """Constrain this number to be approximately a number."""
 
         return self._add_condition(
             f"~ {value} ({error_factor})",
-            lambda other: abs(value - other) <= error_factor * float(value),
+            partial(_is_approximately, value, error_factor),
         )
 
     def __lt__(self, value):
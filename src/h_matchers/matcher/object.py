@@ -1,7 +1,7 @@
 """Matchers for simple objects."""
 
 from h_matchers.decorator import fluent_entrypoint
-from h_matchers.matcher.core import Matcher
+from h_matchers.matcher.core import MATCH, Matcher, MatchResult, compile_value
 
 # pylint: disable=function-redefined
 
@@ -34,7 +34,7 @@ class AnyObject(Matcher):  # pragma: no cover
         self.__type = type_
         self.__attributes = attributes
 
-        super().__init__("dummy", self.assert_equal_to)
+        super().__init__("dummy", self._match)
 
     @staticmethod
     def of_type(type_):
@@ -74,30 +74,54 @@ class AnyObject(Matcher):  # pragma: no cover
 
         self.__attributes = attributes
 
-    def assert_equal_to(self, other):
-        """Assert that the object is equal to another object.
-
-        :raise AssertionError: If no match is found with details of why
-        :return: True if equal
-        """
-
+    def _match(self, other):
         if self.__type is not None and not isinstance(other, self.__type):
-            raise AssertionError(
-                f"Expected other object to be of type '{self.__type}', found: '{type(other)}'"
+            return MatchResult(
+                False,
+                "Expected other object to be of type '{}', found: '{}'",
+                self.__type,
+                type(other),
             )
 
         if self.__attributes is not None:
             for key, value in self.__attributes.items():
                 if not hasattr(other, key):
-                    raise AssertionError(f"Expected attribute '{key}' on {other}")
+                    return MatchResult(
+                        False, "Expected attribute '{}' on {}", key, other
+                    )
 
                 other_value = getattr(other, key)
                 if other_value != value:
-                    raise AssertionError(
-                        f"Expected attribute '{key}' == '{value}', found: '{other_value}"
+                    return MatchResult(
+                        False,
+                        "Expected attribute '{}' == '{}', found: '{}'",
+                        key,
+                        value,
+                        other_value,
                     )
 
-        return True
+        return MATCH
+
+    def _compile(self):
+        type_ = self.__type
+        attributes = [
+            (key, compile_value(value))
+            for key, value in (self.__attributes or {}).items()
+        ]
+        missing = object()
+
+        def predicate(other):
+            if type_ is not None and not isinstance(other, type_):
+                return False
+
+            for key, value_predicate in attributes:
+                other_value = getattr(other, key, missing)
+                if other_value is missing or not value_predicate(other_value):
+                    return False
+
+            return True
+
+        return predicate
 
     def __getattr__(self, item):
         """Allow our attributes spec to be accessed as attributes."""
@@ -0,0 +1,90 @@
+"""Check very large numbers of objects against a matcher in parallel.
+
+The objects are read in chunks which are shared out between a pool of
+worker processes, with only a few chunks in flight at once so memory use is
+bounded however many objects there are. The matcher is pickled once, and
+sent to each worker when it starts, rather than with every chunk. Each worker
+runs `match_many()` on its chunks, and the results are put back together in
+the order the objects were read.
+
+Starting processes is slow, so anything which fits in a single chunk is
+checked in this process instead.
+
+This is used through `Matcher.match_many_parallel()`.
+"""
+
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, count, islice
+
+#: The default number of objects sent to a worker at once
+CHUNK_SIZE = 10_000
+
+# The matcher used by a worker process, set when the process starts
+_worker_matcher = None  # pylint: disable=invalid-name
+
+
+def match_many_parallel(
+    matcher, items, indices=False, max_workers=None, chunk_size=CHUNK_SIZE
+):
+    """Check many objects against a matcher using a pool of processes.
+
+    :param matcher: The matcher to check with (it must be picklable)
+    :param items: An iterable of objects to check (they must be picklable)
+    :param indices: Get the indices of the matching objects instead
+    :param max_workers: The number of processes to use (defaults to the
+        number of CPUs)
+    :param chunk_size: The number of objects to send to a worker at once
+    :return: The same as `Matcher.match_many()`
+    :raise ValueError: If `max_workers` or `chunk_size` is less than 1
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1")
+
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("The number of workers must be at least 1")
+
+    items = iter(items)
+    first_chunk = list(islice(items, chunk_size))
+
+    if len(first_chunk) < chunk_size:
+        return matcher.match_many(first_chunk, indices=indices)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    chunks = chain([first_chunk], iter(lambda: list(islice(items, chunk_size)), []))
+
+    results = []
+    pending = deque()
+
+    with ProcessPoolExecutor(
+        max_workers, initializer=_start_worker, initargs=(pickle.dumps(matcher),)
+    ) as executor:
+        for offset, chunk in zip(count(0, chunk_size), chunks):
+            # Keep each worker busy, without reading everything at once
+            if len(pending) >= max_workers * 2:
+                results.extend(pending.popleft().result())
+
+            pending.append(executor.submit(_match_chunk, chunk, indices, offset))
+
+        while pending:
+            results.extend(pending.popleft().result())
+
+    return results
+
+
+def _start_worker(pickled_matcher):
+    global _worker_matcher  # pylint: disable=global-statement
+
+    _worker_matcher = pickle.loads(pickled_matcher)
+
+
+def _match_chunk(chunk, indices, offset):
+    results = _worker_matcher.match_many(chunk, indices=indices)
+
+    if indices:
+        return [offset + index for index in results]
+
+    return results
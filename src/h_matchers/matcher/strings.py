@@ -11,10 +11,17 @@ class AnyStringContaining(Matcher):
     """Matches any string with a certain substring."""
 
     def __init__(self, sub_string):
-        super().__init__(
-            f"*{sub_string}*",
-            lambda other: isinstance(other, str) and sub_string in other,
-        )
+        self._sub_string = sub_string
+
+        super().__init__(f"*{sub_string}*", self._contains)
+
+    def _contains(self, other):
+        return isinstance(other, str) and self._sub_string in other
+
+    def _compile(self):
+        sub_string = self._sub_string
+
+        return lambda other: isinstance(other, str) and sub_string in other
 
 
 class AnyStringMatching(Matcher):
@@ -26,10 +33,17 @@ class AnyStringMatching(Matcher):
         :param pattern: The raw pattern to compile into a regular expression
         :param flags: Flags `re` e.g. `re.IGNORECASE`
         """
-        regex = re.compile(pattern, flags)
-        super().__init__(
-            pattern, lambda other: isinstance(other, str) and regex.match(other)
-        )
+        self._regex = re.compile(pattern, flags)
+
+        super().__init__(pattern, self._matches)
+
+    def _matches(self, other):
+        return isinstance(other, str) and self._regex.match(other)
+
+    def _compile(self):
+        regex = self._regex
+
+        return lambda other: isinstance(other, str) and bool(regex.match(other))
 
 
 class AnyString(Matcher):
@@ -39,4 +53,14 @@ class AnyString(Matcher):
     containing = AnyStringContaining
 
     def __init__(self):
-        super().__init__("* any string *", lambda other: isinstance(other, str))
+        super().__init__("* any string *", self._is_string)
+
+    @staticmethod
+    def _is_string(other):
+        return isinstance(other, str)
+
+    def _compile(self):
+        return self._is_string
+
+    def _match_many(self, items):
+        return [isinstance(item, str) for item in items]
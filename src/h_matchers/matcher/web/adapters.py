@@ -0,0 +1,293 @@
+"""Adapters which let `AnyRequest` read requests from different libraries.
+
+An adapter is a function (or class) which takes a request object and returns
+something with `method`, `url` and `headers` attributes. Ideally these are
+read from the request as they are used, rather than copied up front.
+
+Adapters are registered against the full name of a class, like
+`"pyramid.request.Request"`, rather than the class itself. This means the
+library never has to be imported by us: a request matches an adapter if
+any class in its MRO has a registered name. The adapter can also be given as
+a `"module:attribute"` string, which is only imported the first time a
+request of that type is seen:
+
+    ADAPTERS.register("httpx.Request", "my_project.adapters:HTTPXRequest")
+
+The adapter found for each type is cached, so looking it up again is a
+single dict lookup.
+
+WSGI environ dicts aren't a type of their own, so they are recognised by
+their keys instead.
+"""
+
+from collections.abc import Mapping
+from importlib import import_module
+from urllib.parse import quote
+
+
+class AdapterRegistry:
+    """Finds the adapter for a request, by the names of its classes."""
+
+    def __init__(self):
+        self._adapters = {}
+        self._by_type = {}
+
+    def register(self, type_name, adapter):
+        """Register an adapter for a type of request.
+
+        Subclasses of the type will use the adapter too, unless they have one
+        of their own.
+
+        :param type_name: The full name of the class (`module.QualName`)
+        :param adapter: A callable which takes a request and returns an object
+            with `method`, `url` and `headers`, or a `"module:attribute"`
+            string to import it from when first needed
+        """
+        self._adapters[type_name] = adapter
+        self._by_type.clear()
+
+    def adapt(self, other):
+        """Get an adapted version of a request, or None if it isn't one.
+
+        :param other: The object to adapt
+        """
+        try:
+            adapter = self._by_type[type(other)]
+        except KeyError:
+            adapter = self._by_type[type(other)] = self._find_adapter(type(other))
+
+        if adapter is not None:
+            return adapter(other)
+
+        if _EnvironRequest.is_environ(other):
+            return _EnvironRequest(other)
+
+        return None
+
+    def types(self):
+        """Get the classes which have adapters, importing their modules.
+
+        Modules which aren't installed are skipped.
+
+        :return: A tuple of classes
+        """
+        types = []
+        for type_name in self._adapters:
+            module_name, _, qual_name = type_name.rpartition(".")
+            try:
+                types.append(getattr(import_module(module_name), qual_name))
+            except (ImportError, AttributeError):
+                pass
+
+        return tuple(types)
+
+    def _find_adapter(self, type_):
+        for class_ in type_.__mro__:
+            type_name = f"{class_.__module__}.{class_.__qualname__}"
+
+            if (adapter := self._adapters.get(type_name)) is None:
+                continue
+
+            if isinstance(adapter, str):
+                module_name, _, attribute = adapter.partition(":")
+                adapter = getattr(import_module(module_name), attribute)
+                self._adapters[type_name] = adapter
+
+            return adapter
+
+        return None
+
+
+def _as_is(request):
+    """Use requests which already have the attributes we want directly."""
+    return request
+
+
+class _WebObRequest:
+    """A WebOb based request (like Pyramid's), without the `Host` header."""
+
+    __slots__ = ("_request",)
+
+    def __init__(self, request):
+        self._request = request
+
+    @property
+    def method(self):
+        """Get the request method."""
+        return self._request.method
+
+    @property
+    def url(self):
+        """Get the request URL."""
+        return self._request.url
+
+    @property
+    def headers(self):
+        """Get the headers, without `Host`."""
+        return _HeadersWithoutHost(self._request.headers)
+
+
+class _HeadersWithoutHost(Mapping):
+    """A read only view of request headers which hides `Host`.
+
+    WebOb (and so Pyramid) adds `Host` to its headers, and it's mostly noise.
+    This hides it without copying the headers (which for WebOb means copying
+    the whole WSGI environ).
+    """
+
+    __slots__ = ("_headers", "_len")
+
+    def __init__(self, headers):
+        self._headers = headers
+        # Views are made for each comparison, so the headers can't change
+        # while one is in use, and we only count them once
+        self._len = None
+
+    def __getitem__(self, key):
+        if self._is_host(key):
+            raise KeyError(key)
+
+        return self._headers[key]
+
+    def __contains__(self, key):
+        return not self._is_host(key) and key in self._headers
+
+    def __iter__(self):
+        return (key for key in self._headers if not self._is_host(key))
+
+    def __len__(self):
+        if self._len is None:
+            self._len = sum(1 for _ in self)
+
+        return self._len
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    @staticmethod
+    def _is_host(key):
+        return isinstance(key, str) and key.lower() == "host"
+
+
+class _EnvironHeaders(Mapping):
+    """A read only, case-insensitive view of the headers in a WSGI environ.
+
+    Headers are read from the `HTTP_*` keys (and `CONTENT_TYPE` and
+    `CONTENT_LENGTH`) when they are asked for, rather than being copied.
+    """
+
+    __slots__ = ("_environ", "_len")
+
+    _CGI_KEYS = {"CONTENT_TYPE": "Content-Type", "CONTENT_LENGTH": "Content-Length"}
+
+    def __init__(self, environ):
+        self._environ = environ
+        # As for `_HeadersWithoutHost`, we only count the headers once
+        self._len = None
+
+    def __getitem__(self, key):
+        if (environ_key := self._environ_key(key)) is None:
+            raise KeyError(key)
+
+        return self._environ[environ_key]
+
+    def __contains__(self, key):
+        return (environ_key := self._environ_key(key)) is not None and (
+            environ_key in self._environ
+        )
+
+    def __iter__(self):
+        for key in self._environ:
+            if key.startswith("HTTP_"):
+                yield key[5:].replace("_", "-").title()
+            elif key in self._CGI_KEYS:
+                yield self._CGI_KEYS[key]
+
+    def __len__(self):
+        if self._len is None:
+            self._len = sum(1 for _ in self)
+
+        return self._len
+
+    def _environ_key(self, key):
+        if not isinstance(key, str):
+            return None
+
+        key = key.upper().replace("-", "_")
+        if key in self._CGI_KEYS:
+            return key
+
+        return f"HTTP_{key}"
+
+
+class _EnvironRequest:
+    """A raw WSGI environ, with the attributes of a request object.
+
+    Each attribute is read from the environ when it's used, so checking the
+    method doesn't build the URL or look at the headers.
+    """
+
+    __slots__ = ("_environ",)
+
+    _DEFAULT_PORTS = {"http": "80", "https": "443"}
+    _PATH_SAFE = "/~!$&'()*+,;=:@"
+
+    def __init__(self, environ):
+        self._environ = environ
+
+    @staticmethod
+    def is_environ(other):
+        """Check if an object looks like a WSGI environ."""
+        return (
+            isinstance(other, Mapping)
+            and "REQUEST_METHOD" in other
+            and "wsgi.url_scheme" in other
+        )
+
+    @property
+    def method(self):
+        """Get the request method."""
+        return self._environ["REQUEST_METHOD"]
+
+    @property
+    def url(self):
+        """Get the URL, rebuilt the same way as WebOb does it."""
+        environ = self._environ
+        scheme = environ["wsgi.url_scheme"]
+
+        if host := environ.get("HTTP_HOST"):
+            port = None
+            if ":" in host and not host.endswith("]"):
+                host, port = host.rsplit(":", 1)
+        else:
+            host, port = environ["SERVER_NAME"], environ["SERVER_PORT"]
+
+        url = f"{scheme}://{host}"
+        if port and port != self._DEFAULT_PORTS.get(scheme):
+            url += f":{port}"
+
+        # WSGI strings are bytes smuggled through latin-1
+        for key in ("SCRIPT_NAME", "PATH_INFO"):
+            url += quote(environ.get(key, "").encode("latin-1"), self._PATH_SAFE)
+
+        if query := environ.get("QUERY_STRING"):
+            url += f"?{query}"
+
+        return url
+
+    @property
+    def headers(self):
+        """Get the headers, without `Host` as for other WSGI requests."""
+        return _HeadersWithoutHost(_EnvironHeaders(self._environ))
+
+    def __repr__(self):
+        return f"<WSGI environ {self.method} {self.url}>"
+
+
+ADAPTERS = AdapterRegistry()
+"""The adapters used by `AnyRequest`."""
+
+ADAPTERS.register("requests.models.Request", _as_is)
+ADAPTERS.register("requests.models.PreparedRequest", _as_is)
+ADAPTERS.register("pyramid.testing.DummyRequest", _as_is)
+ADAPTERS.register("webob.request.BaseRequest", _WebObRequest)
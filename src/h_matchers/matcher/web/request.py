@@ -1,38 +1,139 @@
 """A matcher that matches various request objects in HTTP type libraries."""
 
-from copy import deepcopy
+from collections import defaultdict
 
 from h_matchers.decorator import fluent_entrypoint
 from h_matchers.matcher.collection import AnyMapping
-from h_matchers.matcher.core import Matcher
+from h_matchers.matcher.collection.containment import _BipartiteMatching
+from h_matchers.matcher.core import (
+    MATCH,
+    Matcher,
+    MatchResult,
+    compile_value,
+    match_value,
+)
 from h_matchers.matcher.strings import AnyString
+from h_matchers.matcher.web.adapters import ADAPTERS
 from h_matchers.matcher.web.url import AnyURL
+from h_matchers.matcher.web.url.core import AnyURLCore
 
 # pylint: disable=too-few-public-methods
 
 
-class _LibraryNotAvailable:
-    """Substitute for missing libraries."""
+class _SupportedTypes:
+    """A class attribute with the request types, imported on first use."""
 
+    def __get__(self, instance, owner):
+        return ADAPTERS.types()
 
-try:
-    # We don't require our clients to install every request library we support
-    # so we will enable it if it's around, and carry on without if it's not
-    from requests import PreparedRequest as RequestsPreparedRequest
-    from requests import Request as RequestsRequest
 
-except ImportError:  # pragma: no cover
-    RequestsRequest, RequestsPreparedRequest = (
-        _LibraryNotAvailable,
-        _LibraryNotAvailable,
-    )
+class RequestBatchMatch:
+    """The result of matching expected requests with captured requests.
 
-try:
-    from pyramid.request import Request as PyramidRequest
-    from pyramid.testing import DummyRequest as PyramidDummyRequest
+    This is truthy when every expected request was matched.
+    """
+
+    def __init__(self, pairs, unmatched_expected, unmatched_captured):
+        """Create a new result.
+
+        :param pairs: A list of (expected, captured) pairs which matched
+        :param unmatched_expected: Expected requests with no match
+        :param unmatched_captured: Captured requests which weren't matched
+        """
+        self.pairs = pairs
+        self.unmatched_expected = unmatched_expected
+        self.unmatched_captured = unmatched_captured
+
+    def __bool__(self):
+        return not self.unmatched_expected
+
+    def __str__(self):
+        total = len(self.pairs) + len(self.unmatched_expected)
+        lines = [f"Matched {len(self.pairs)} of {total} expected requests"]
+
+        if self.unmatched_expected:
+            lines.append("Expected but not captured:")
+            lines.extend(f"  * {expected}" for expected in self.unmatched_expected)
+
+        if self.unmatched_captured:
+            lines.append("Captured but not expected:")
+            lines.extend(
+                f"  * {self._describe(captured)}"
+                for captured in self.unmatched_captured
+            )
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _describe(request):
+        if (adapted := ADAPTERS.adapt(request)) is None:
+            return repr(request)
+
+        return f"{adapted.method} {adapted.url}"
+
+
+# A key for expectations which don't have a literal method or host
+_ANY = object()
+# A key for captured requests where we can't tell the method or host
+_UNKNOWN = object()
+
+
+class _RequestIndex:
+    """Captured requests grouped by their method and host."""
+
+    def __init__(self, captured):
+        self._all = range(len(captured))
+        self._by_method = defaultdict(list)
+        self._by_host = defaultdict(list)
+        self._by_method_and_host = defaultdict(list)
+
+        for position, request in enumerate(captured):
+            method, host = self._method_and_host(request)
+
+            self._by_method[method].append(position)
+            self._by_host[host].append(position)
+            self._by_method_and_host[(method, host)].append(position)
+
+    def candidates(self, expected):
+        """Get the positions of requests which could match an expectation."""
+        method, host = _ANY, _ANY
+
+        if isinstance(expected, AnyRequest):
+            if isinstance(expected.method, str):
+                method = expected.method
+
+            if isinstance(expected.url, AnyURLCore):
+                url_host = expected.url.parts["host"]
+                if url_host is None or isinstance(url_host, str):
+                    host = url_host
+
+        if method is _ANY and host is _ANY:
+            return self._all
+
+        if host is _ANY:
+            return self._by_method.get(method, ())
+
+        if method is _ANY:
+            return self._by_host.get(host, ())
+
+        return self._by_method_and_host.get((method, host), ())
+
+    @staticmethod
+    def _method_and_host(request):
+        if (adapted := ADAPTERS.adapt(request)) is None:
+            return _UNKNOWN, _UNKNOWN
 
-except ImportError:  # pragma: no cover
-    PyramidDummyRequest, PyramidRequest = _LibraryNotAvailable, _LibraryNotAvailable
+        method, url = adapted.method, adapted.url
+
+        return (
+            method.upper() if isinstance(method, str) else _UNKNOWN,
+            # pylint: disable=protected-access
+            (
+                AnyURLCore._parse_url_cached(url)["host"]
+                if isinstance(url, str)
+                else _UNKNOWN
+            ),
+        )
 
 
 # pylint: disable=function-redefined
@@ -45,15 +146,15 @@ class AnyRequest(Matcher):  # pragma: no cover
 
      * `requests.Request`
      * `requests.PreparedRequest`
-     * `pyramid.request.Request`
+     * `pyramid.request.Request` (and other WebOb requests)
      * `pyramid.testing.Request`
+     * WSGI environ dicts (with `REQUEST_METHOD` and `wsgi.url_scheme`)
+
+    Support for other types can be added with `register_adapter()`.
     """
 
-    # Use a set here as an optimisation for when many of these items are
-    # instances of `_LibraryNotAvailable`
-    SUPPORTED_TYPES = tuple(
-        {RequestsRequest, RequestsPreparedRequest, PyramidRequest, PyramidDummyRequest}
-    )
+    SUPPORTED_TYPES = _SupportedTypes()
+    """The classes with adapters which can be imported (for compatibility)."""
 
     method = None
     url = None
@@ -64,7 +165,87 @@ class AnyRequest(Matcher):  # pragma: no cover
         self.with_url(url)
         self.with_headers(headers)
 
-        super().__init__("*dummy*", self.assert_equal_to)
+        super().__init__("*dummy*", self._match)
+
+    @staticmethod
+    def register_adapter(type_name, adapter):
+        """Add support for another type of request.
+
+        See `h_matchers.matcher.web.adapters` for details.
+
+        :param type_name: The full name of the class (`module.QualName`)
+        :param adapter: A callable which takes a request and returns an object
+            with `method`, `url` and `headers`, or a `"module:attribute"`
+            string to import it from when first needed
+        """
+        ADAPTERS.register(type_name, adapter)
+
+    @staticmethod
+    def match_all(expected, captured):
+        """Match expected requests with captured requests, one to one.
+
+        Each expected request (usually an `AnyRequest`) is paired with a
+        different captured request, matching as many as possible. Captured
+        requests are grouped by method and host first, so each expectation is
+        only compared with requests it could match.
+
+        :param expected: An iterable of expected requests
+        :param captured: An iterable of captured requests
+        :return: A `RequestBatchMatch`
+        """
+        expected, captured = list(expected), list(captured)
+        index = _RequestIndex(captured)
+
+        possibilities = []
+        for expectation in expected:
+            predicate = compile_value(expectation)
+            possibilities.append(
+                [
+                    position
+                    for position in index.candidates(expectation)
+                    if predicate(captured[position])
+                ]
+            )
+
+        matching = _BipartiteMatching(possibilities).maximum()
+        used = set(matching)
+
+        return RequestBatchMatch(
+            pairs=[
+                (expected[match_index], captured[position])
+                for match_index, position in enumerate(matching)
+                if position is not None
+            ],
+            unmatched_expected=[
+                expected[match_index]
+                for match_index, position in enumerate(matching)
+                if position is None
+            ],
+            unmatched_captured=[
+                request
+                for position, request in enumerate(captured)
+                if position not in used
+            ],
+        )
+
+    @classmethod
+    def assert_all_made(cls, expected, captured, exact=False):
+        """Assert that every expected request was captured.
+
+        See `match_all()` for how requests are matched.
+
+        :param expected: An iterable of expected requests
+        :param captured: An iterable of captured requests
+        :param exact: Also fail if any captured requests weren't expected
+        :raise AssertionError: With details of the unmatched requests
+        :return: A `RequestBatchMatch`
+        """
+        result = cls.match_all(expected, captured)
+
+        if not result or (exact and result.unmatched_captured):
+            raise AssertionError(str(result))
+
+        return result
 
     @classmethod
     def containing_headers(cls, headers):
@@ -138,40 +319,54 @@ class AnyRequest(Matcher):  # pragma: no cover
         elif url is not None:
             self.url = url
 
-    def assert_equal_to(self, other):
-        """Assert that the request object is equal to another object.
-
-        :raise AssertionError: If no match is found with details of why
-        :return: True if equal
-        """
-        if not isinstance(other, self.SUPPORTED_TYPES):
-            raise AssertionError(
-                f"Unknown request type '{type(other)}'. For a request type to be "
-                "compared it must be supported and loaded."
+    def _match(self, other):
+        if (request := ADAPTERS.adapt(other)) is None:
+            return MatchResult(
+                False,
+                "Unknown request type '{}'. For a request type to be "
+                "compared it must be supported and loaded.",
+                type(other),
             )
 
-        if self.method is not None and self.method != other.method.upper():
-            raise AssertionError(f"Method '{other.method}' != '{self.method}'")
+        if self.method is not None and self.method != request.method.upper():
+            return MatchResult(
+                False, "Method '{}' != '{}'", request.method, self.method
+            )
 
-        if self.url is not None:
-            self.url.assert_equal_to(other.url)
+        if self.url is not None and not (result := match_value(self.url, request.url)):
+            return result
 
         if self.headers is not None:
-            other_headers = self._comparison_headers(other)
+            other_headers = request.headers
             if self.headers != other_headers:
-                raise AssertionError(f"Headers {other_headers} != {self.headers}")
+                return MatchResult(
+                    False, "Headers {} != {}", other_headers, self.headers
+                )
 
-        return True
+        return MATCH
 
-    @classmethod
-    def _comparison_headers(cls, other):
-        if isinstance(other, PyramidRequest):
-            headers = deepcopy(other.headers)
-            headers.pop("Host")
+    def _compile(self):
+        adapt = ADAPTERS.adapt
+        method = self.method
+        method_predicate = None if method is None else compile_value(method)
+        url_predicate = None if self.url is None else compile_value(self.url)
+        headers_predicate = (
+            None if self.headers is None else compile_value(self.headers)
+        )
+
+        def predicate(other):
+            if (request := adapt(other)) is None:
+                return False
+
+            if method_predicate and not method_predicate(request.method.upper()):
+                return False
+
+            if url_predicate and not url_predicate(request.url):
+                return False
 
-            return headers
+            return not (headers_predicate and not headers_predicate(request.headers))
 
-        return other.headers
+        return predicate
 
     def __str__(self):
         details = ""
@@ -1,3 +1,4 @@
 """A matcher that matches URLs."""
 
 from h_matchers.matcher.web.url.fluent import AnyURL
+from h_matchers.matcher.web.url.router import AnyURLSet
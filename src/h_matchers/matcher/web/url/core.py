@@ -56,24 +56,80 @@ For example:
     Any.url(path="foo") == "http://example.com/foo"        # True
     Any.url(path="/foo") == "foo"                          # True
     Any.url(path="foo") == "/foo"                          # True
+
+## Parse caching
+
+Matching a URL string requires parsing it first. The results are kept in a
+least recently used cache shared by every URL matcher, so comparing the same
+string to many matchers only parses it once. You can change the size of the
+cache, and see how well it's working with:
+
+    AnyURLCore.set_parse_cache_size(10000)
+    AnyURLCore.parse_cache_info()  # Stats for the URL and query caches
+
+Before parsing, strings are checked against any plain scheme, host and query
+keys the matcher has. A string which doesn't start with the scheme, or doesn't
+contain the host or `key=` for every query key can't match, so is rejected
+straight away. Strings where this can't be told for certain (like those with
+percent encoding) are always parsed.
 """
 
-import re
-from collections import Counter
+from collections import Counter, namedtuple
+from functools import lru_cache
 from urllib.parse import parse_qsl, urlparse
 
 from h_matchers.matcher.collection import AnyMapping
 from h_matchers.matcher.combination import AnyOf, NamedMatcher
-from h_matchers.matcher.core import Matcher
-from h_matchers.matcher.strings import AnyString, AnyStringMatching
+from h_matchers.matcher.core import (
+    MATCH,
+    Matcher,
+    MatchResult,
+    _FrozenDict,
+    compile_value,
+    freeze_value,
+)
+from h_matchers.matcher.strings import AnyString
+
+
+class _Default(NamedMatcher):
+    """A default shared by every URL matcher.
+
+    We tell defaults apart from other values by identity, so these are
+    pickled as a reference to the shared instance rather than a copy.
+    """
+
+    def __init__(self, name, description, matcher):
+        self._name = name
+
+        super().__init__(description, matcher)
+
+    def __reduce__(self):
+        return getattr, (AnyURLCore, self._name)
+
+    def _freeze(self):
+        # Interning a URL matcher shouldn't freeze the defaults every other
+        # URL matcher is using
+        return
+
+
+class ParseCacheInfo(namedtuple("ParseCacheInfo", ["urls", "queries"])):
+    """Statistics about the URL and query string parse caches."""
+
+    __slots__ = ()
 
 
 class AnyURLCore(Matcher):
     """Matches any URL."""
 
     APPLY_DEFAULT = object()
-    STRING_OR_NONE = NamedMatcher("<AnyStringOrNone>", AnyOf([None, AnyString()]))
-    MAP_OR_NONE = NamedMatcher("<AnyMappingOrNone>", AnyOf([None, AnyMapping()]))
+
+    # These are shared by every URL matcher, so they must not record history
+    STRING_OR_NONE = _Default(
+        "STRING_OR_NONE", "<AnyStringOrNone>", AnyOf([None, AnyString()])
+    ).stateless()
+    MAP_OR_NONE = _Default(
+        "MAP_OR_NONE", "<AnyMappingOrNone>", AnyOf([None, AnyMapping()])
+    ).stateless()
 
     DEFAULTS = {
         "scheme": STRING_OR_NONE,
@@ -84,6 +140,13 @@ class AnyURLCore(Matcher):
         "fragment": STRING_OR_NONE,
     }
 
+    #: The default number of parsed URLs to keep
+    PARSE_CACHE_SIZE = 1024
+
+    # The order to check parts in, roughly cheapest and most likely to differ
+    # first. The query is last, as it has to be parsed before comparing.
+    _PART_ORDER = ("scheme", "host", "fragment", "params", "path", "query")
+
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     # I can't see a way around it. We could use kwargs, but then auto complete
     # would be hard
@@ -107,16 +170,22 @@ class AnyURLCore(Matcher):
         :param query: Query to match (string, dict or matcher)
         :param fragment: Anchor fragment to match (e.g. "name" for "#name")
         """
-        self.parts = {
-            # https://tools.ietf.org/html/rfc7230#section-2.7.3
-            # scheme and host are case-insensitive
-            "scheme": self._lower_if_string(scheme),
-            "host": self._lower_if_string(host),
-            # `path`, `query` and `fragment` are case-sensitive
-            "path": self._get_path_matcher(path, scheme, host),
-            "params": params,
-            "fragment": fragment,
-        }
+        self.parts = _Parts(
+            {
+                # https://tools.ietf.org/html/rfc7230#section-2.7.3
+                # scheme and host are case-insensitive
+                "scheme": self._lower_if_string(scheme),
+                "host": self._lower_if_string(host),
+                # `path`, `query` and `fragment` are case-sensitive
+                "path": self._get_path_matcher(path, scheme, host),
+                "params": params,
+                "fragment": fragment,
+            }
+        )
+        self._constraints = None
+        self._constraints_version = None
+        self._string_filter = None
+        self._query_keys = (None, ())
 
         self._set_query(query)
 
@@ -126,7 +195,30 @@ class AnyURLCore(Matcher):
             # Apply default matchers for everything not provided
             self._apply_defaults(self.parts, self.DEFAULTS)
 
-        super().__init__("dummy", self.assert_equal_to)
+        super().__init__("dummy", self._match)
+
+    @property
+    def parts(self):
+        """Get the parts of a URL this matches, keyed by name."""
+        return self._parts
+
+    @parts.setter
+    def parts(self, parts):
+        self._on_reconfigure()
+
+        # The parts keep count of changes to them, so we can tell when to
+        # work out the constraints again. `parts |= ...` sets them to
+        # themselves, which has been counted already.
+        if parts is not getattr(self, "_parts", None):
+            self._parts = _Parts(parts)
+            self._constraints_version = None
+
+    def __getstate__(self):
+        # These are worked out again from the parts when they are needed
+        state = super().__getstate__()
+        state.update(_constraints=None, _constraints_version=None, _string_filter=None)
+
+        return state
 
     def __str__(self):
         contraints = {
@@ -152,6 +244,55 @@ class AnyURLCore(Matcher):
         :raise ValueError: If scheme is mandatory and not provided
         :return: A normalised string of comparison values
         """
+        # The cached results are shared, so we give out a copy which can be
+        # changed safely
+        parsed = dict(AnyURLCore._parse_url_cached(url_string))
+        parsed["query"] = MultiValueQuery.normalise(parsed["query"])
+
+        return parsed
+
+    @classmethod
+    def set_parse_cache_size(cls, maxsize):
+        """Set how many parsed URLs to keep, and empty the cache.
+
+        :param maxsize: The number of URLs to keep. 0 disables caching, and
+            None keeps everything.
+        """
+        AnyURLCore._parse_url_cached = staticmethod(
+            lru_cache(maxsize=maxsize)(AnyURLCore._parse_url)
+        )
+        AnyURLCore._parse_query_cached = staticmethod(
+            lru_cache(maxsize=maxsize)(AnyURLCore._parse_query)
+        )
+
+    @staticmethod
+    def parse_cache_info():
+        """Get statistics about the URL and query string parse caches.
+
+        Query strings are only parsed when a matcher checks the query, so
+        they have a cache of their own, which is the same size.
+
+        :return: A `ParseCacheInfo` of `urls` and `queries`, each a named
+            tuple of `hits`, `misses`, `maxsize` and `currsize`
+        """
+        return ParseCacheInfo(
+            urls=AnyURLCore._parse_url_cached.cache_info(),
+            queries=AnyURLCore._parse_query_cached.cache_info(),
+        )
+
+    @staticmethod
+    def clear_parse_cache():
+        """Empty the URL parse cache and reset the statistics."""
+        AnyURLCore._parse_url_cached.cache_clear()
+        AnyURLCore._parse_query_cached.cache_clear()
+
+    @classmethod
+    def _parse_url(cls, url_string):
+        """Parse a URL into a read only dict for comparison.
+
+        The query is left as a string, to be parsed by `_parse_query()` only
+        if something needs it.
+        """
         url = urlparse(url_string)
 
         if not url.scheme and not url.netloc:
@@ -161,14 +302,77 @@ class AnyURLCore(Matcher):
             host, path = cls._guess_hostname_and_path(url.path)
             url = url._replace(netloc=host, path=path)
 
-        return {
-            "scheme": url.scheme.lower() if url.scheme else None,
-            "host": url.netloc.lower() if url.netloc else None,
-            "path": url.path or None,
-            "params": url.params or None,
-            "query": MultiValueQuery.normalise(url.query),
-            "fragment": url.fragment or None,
-        }
+        return _FrozenDict(
+            scheme=url.scheme.lower() if url.scheme else None,
+            host=url.netloc.lower() if url.netloc else None,
+            path=url.path or None,
+            params=url.params or None,
+            query=url.query,
+            fragment=url.fragment or None,
+        )
+
+    @staticmethod
+    def _parse_query(query_string):
+        """Parse a query string into a read only form for comparison."""
+        query = MultiValueQuery.normalise(query_string)
+
+        if isinstance(query, MultiValueQuery):
+            return _FrozenMultiValueQuery(query)
+
+        return None if query is None else _FrozenDict(query)
+
+    @classmethod
+    def _parsed_part(cls, parsed, key):
+        """Get a part for comparison from the result of `_parse_url()`."""
+        if key == "query":
+            return AnyURLCore._parse_query_cached(parsed["query"])
+
+        return parsed[key]
+
+    def _freeze(self):
+        super()._freeze()
+
+        self._parts = _FrozenParts(
+            (key, freeze_value(value)) for key, value in self.parts.items()
+        )
+        self._constraints_version = None
+
+    def _constrained_parts(self):
+        """Get the parts which aren't defaults, in the order to check them.
+
+        This is worked out once, and again whenever `parts` changes.
+        """
+        if self._constraints_version != self.parts.version:
+            self._constraints = sorted(
+                (
+                    (key, value)
+                    for key, value in self.parts.items()
+                    if value is not self.DEFAULTS[key]
+                ),
+                # Plain values are quicker to compare than matchers
+                key=lambda item: (
+                    isinstance(item[1], Matcher),
+                    self._PART_ORDER.index(item[0]),
+                ),
+            )
+            self._string_filter = self._get_string_filter()
+            self._constraints_version = self.parts.version
+
+        return self._constraints
+
+    def _get_string_filter(self):
+        """Get a filter for the plain scheme, host and query keys, if any."""
+        query, query_keys = self._query_keys
+        if query is not self.parts.get("query"):
+            # The query has been replaced without us seeing it
+            query_keys = ()
+
+        # Parts can be removed, in which case they aren't checked at all
+        return _StringFilter.create(
+            scheme=self.parts.get("scheme"),
+            host=self.parts.get("host"),
+            query_keys=query_keys,
+        )
 
     @staticmethod
     def _get_path_matcher(path, scheme, host):
@@ -182,20 +386,11 @@ class AnyURLCore(Matcher):
         if scheme is None and host is None:
             return path
 
-        # If we got None, we need to allow ourselves to match either slash, ''
-        # or None
-        if path in (None, "/", ""):
-            return NamedMatcher("<Path '/'>", AnyOf([None, AnyStringMatching(r"^/?$")]))
-
-        # Otherwise construct a matcher which doesn't care about leading
-        # slashes
-        return NamedMatcher(
-            f"'<Path '{path}'>", AnyStringMatching(f"^/?{re.escape(path)}$")
-        )
+        return _LiteralPath.for_path(path)
 
     def _set_query(self, query, exact_match=True):
         if query is not self.APPLY_DEFAULT:
-            query = MultiValueQuery.normalise(query)
+            query = query_items = MultiValueQuery.normalise(query)
             if query and not isinstance(query, Matcher):
                 # MultiValueQuery is guaranteed to return something we can
                 # provide to AnyMapping for comparison
@@ -203,6 +398,8 @@ class AnyURLCore(Matcher):
                 if exact_match:
                     query = query.only()
 
+                self._query_keys = (query, _StringFilter.query_keys(query_items))
+
         self.parts["query"] = query
 
     def _set_base_url(self, base_url):
@@ -252,25 +449,196 @@ class AnyURLCore(Matcher):
 
         return None, path
 
-    def assert_equal_to(self, other):
-        """Assert that the URL object is equal to another object.
+    def _match(self, other):
+        if not isinstance(other, str):
+            return MatchResult(False, "Other URL is not a string")
+
+        if (rejection := self._reject_string(other)) is not None:
+            return rejection
+
+        return self._match_parsed(self._parse_url_cached(other))
 
-        :raise AssertionError: If no match is found with details of why
-        :return: True if equal
+    def _reject_string(self, url_string):
+        """Get a failed match result if the string can't match, or None.
+
+        This only looks at the string, so it should be checked before
+        `_match_parsed()`.
         """
+        self._constrained_parts()  # Brings the string filter up to date
+        if self._string_filter:
+            return self._string_filter.reject(url_string)
 
-        if not isinstance(other, str):
-            raise AssertionError("Other URL is not a string")
+        return None
 
-        comparison = self.parse_url(other)
+    def _match_parsed(self, parsed):
+        """Match against a URL which has already been parsed.
 
-        for key, self_value in self.parts.items():
-            other_value = comparison.get(key)
+        :param parsed: The result of `_parse_url()`
+        """
+        for key, self_value in self._constrained_parts():
+            other_value = self._parsed_part(parsed, key)
 
             if self_value != other_value:
-                raise AssertionError(f"Other '{key}' {other_value} != {self_value}")
+                return MatchResult(
+                    False, "Other '{}' {} != {}", key, other_value, self_value
+                )
+
+        return MATCH
+
+    def _compile(self):
+        parse_url = self._parse_url_cached
+        parsed_part = self._parsed_part
+        part_predicates = [
+            (key, compile_value(value)) for key, value in self._constrained_parts()
+        ]
+        string_filter = self._string_filter
+
+        def predicate(other):
+            if not isinstance(other, str):
+                return False
 
-        return True
+            if string_filter and string_filter.reject(other) is not None:
+                return False
+
+            parsed = parse_url(other)
+
+            for key, part_predicate in part_predicates:
+                if not part_predicate(parsed_part(parsed, key)):
+                    return False
+
+            return True
+
+        return predicate
+
+
+class _StringFilter:
+    """Rejects URL strings which can't match, without parsing them.
+
+    This must never reject a string which could match once parsed, so it
+    gives up on strings which `urlparse()` or `parse_qsl()` would change
+    before comparing:
+
+     * Non-ASCII strings, as lower casing them can change their length
+     * Strings with tabs or new lines, which `urlparse()` removes
+     * Query keys in strings with percent encoding, which could hide them
+    """
+
+    # `urlparse()` removes these from the start of URLs
+    _LEADING_JUNK = "".join(chr(i) for i in range(33))
+
+    def __init__(self, scheme, host, query_keys):
+        self._scheme_prefix = f"{scheme}:" if scheme else None
+        self._host = host
+        self._query_keys = [f"{key}=" for key in query_keys]
+
+    @classmethod
+    def create(cls, scheme, host, query_keys):
+        """Get a filter for the plain values given, or None if there are none.
+
+        :param scheme: The scheme to match (only used if a string)
+        :param host: The host to match (only used if a string)
+        :param query_keys: Keys which must be in the query
+        """
+        scheme = scheme.lower() if isinstance(scheme, str) else None
+        host = host.lower() if isinstance(host, str) else None
+
+        if not scheme and not host and not query_keys:
+            return None
+
+        return cls(scheme, host, query_keys)
+
+    @staticmethod
+    def query_keys(query_items):
+        """Get the keys from a query spec which must be in a URL string.
+
+        Keys with spaces are skipped, as they could be written with `+`.
+
+        :param query_items: A mapping or `MultiValueQuery`
+        """
+        return tuple(
+            key
+            for key, _ in query_items.items()
+            if isinstance(key, str) and " " not in key
+        )
+
+    def reject(self, url_string):
+        """Get a failed match result if the string can't match, or None."""
+        if not url_string.isascii() or any(char in url_string for char in "\t\r\n"):
+            return None
+
+        lowered = url_string.lower()
+
+        if self._scheme_prefix and not lowered.lstrip(self._LEADING_JUNK).startswith(
+            self._scheme_prefix
+        ):
+            return MatchResult(
+                False,
+                "Other URL {!r} doesn't start with {!r}",
+                url_string,
+                self._scheme_prefix,
+            )
+
+        if self._host and self._host not in lowered:
+            return MatchResult(
+                False,
+                "Other URL {!r} doesn't contain host {!r}",
+                url_string,
+                self._host,
+            )
+
+        if "%" not in url_string:
+            for key in self._query_keys:
+                if key not in url_string:
+                    return MatchResult(
+                        False, "Other URL {!r} doesn't contain {!r}", url_string, key
+                    )
+
+        return None
+
+
+class _LiteralPath(Matcher):
+    """Matches a literal path, with or without a leading slash.
+
+    Use `for_path()` rather than creating these directly, so URL matchers
+    with the same path share one stateless instance.
+    """
+
+    #: The number of path matchers to keep for sharing
+    CACHE_SIZE = 4096
+
+    def __init__(self, path):
+        self.path = path
+
+        # If we got None, we need to allow ourselves to match either slash, ''
+        # or None
+        if path in (None, "/", ""):
+            self._accepted = frozenset((None, "", "/"))
+            description = "<Path '/'>"
+
+        # Otherwise we don't care about leading slashes
+        else:
+            self._accepted = frozenset((path, f"/{path}"))
+            description = f"'<Path '{path}'>"
+
+        super().__init__(description, self._is_accepted)
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def for_path(path):
+        """Get a shared, stateless matcher for a path.
+
+        :param path: The path to match (a string or None)
+        """
+        return _LiteralPath(path).stateless()
+
+    def _is_accepted(self, other):
+        return (other is None or isinstance(other, str)) and other in self._accepted
+
+    def _compile(self):
+        return self._is_accepted
+
+    def __repr__(self):
+        return self._description
 
 
 class MultiValueQuery(list):
@@ -320,3 +688,79 @@ class MultiValueQuery(list):
 
     def __repr__(self):
         return f"<MultiValueQuery {super().__repr__()}>"
+
+
+class _Parts(dict):
+    """The parts of a URL matcher, which count how often they are changed."""
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self.version += 1
+        return self
+
+    def update(self, *args, **kwargs):
+        """Update the parts, counting it as a change."""
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        """Get a part, setting it if it's missing, counting it as a change."""
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        """Remove a part and return it, counting it as a change."""
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        """Remove the last part and return it, counting it as a change."""
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        """Remove every part, counting it as a change."""
+        super().clear()
+        self.version += 1
+
+    def __reduce__(self):
+        # Pickling a dict sets each item, which counts as a change before
+        # there's a version to change
+        return type(self), (dict(self),)
+
+
+class _FrozenParts(_FrozenDict, _Parts):
+    """The parts of an interned URL matcher, which can't be changed."""
+
+    __slots__ = ()
+    _THAWED_TYPE = _Parts
+
+
+class _FrozenMultiValueQuery(tuple):
+    """A `MultiValueQuery` which can't be changed, for sharing safely."""
+
+    __slots__ = ()
+
+    def items(self):
+        """Iterate over contained items as if a dict."""
+        yield from self
+
+    def __repr__(self):
+        return f"<MultiValueQuery {list(self)!r}>"
+
+
+AnyURLCore.set_parse_cache_size(AnyURLCore.PARSE_CACHE_SIZE)
@@ -11,13 +11,14 @@ class AnyURL(AnyURLCore):
 
     # pylint: disable=function-redefined
 
+    # These are shared by every URL matcher, so they must not record history
     PRESENT_DEFAULT = {
-        "scheme": AnyString(),
-        "host": AnyString(),
-        "path": AnyString(),
-        "params": AnyString(),
-        "query": AnyMapping(),
-        "fragment": AnyString(),
+        "scheme": AnyString().stateless(),
+        "host": AnyString().stateless(),
+        "path": AnyString().stateless(),
+        "params": AnyString().stateless(),
+        "query": AnyMapping().stateless(),
+        "fragment": AnyString().stateless(),
     }
 
     def _apply_field_default(self, field, value):
@@ -0,0 +1,161 @@
+r"""A matcher for checking a URL against many URL matchers at once.
+
+Checking a URL against hundreds of URL matchers one at a time is slow. This
+groups URL matchers by their literal scheme and host, and the first segment
+of their literal path, so a URL is only compared to the matchers which could
+possibly match it:
+
+    allowed = AnyURLSet(
+        [
+            AnyURL("https://example.com/api/users"),
+            AnyURL(scheme="https", host="cdn.example.com"),
+            AnyURL(host=Any.string.matching(r".*\.example\.org")),
+        ]
+    )
+
+    allowed == "https://example.com/api/users"  # True
+    allowed.matching("https://cdn.example.com/a.png")  # [AnyURL(...)]
+
+Any matcher can be added, but only URL matchers are indexed. Anything else
+is compared to every URL. Changing a URL matcher after it has been added
+isn't supported, as it won't be indexed again.
+"""
+
+from collections import defaultdict
+from functools import partial
+
+from h_matchers.matcher.core import MATCH, Matcher, MatchResult, Sentinel
+from h_matchers.matcher.web.url.core import AnyURLCore, _LiteralPath
+
+# A key for parts which aren't literal values, so can match anything
+_ANY = Sentinel(__name__, "_ANY")
+
+
+class AnyURLSet(Matcher):
+    """Matches any URL which matches one of a set of matchers."""
+
+    def __init__(self, matchers=()):
+        self._matchers = []
+
+        # (scheme, host) -> first path segment -> indices of URL matchers
+        self._index = defaultdict(partial(defaultdict, list))
+        # Indices of matchers which aren't URL matchers
+        self._unindexed = []
+
+        for matcher in matchers:
+            self.add(matcher)
+
+        super().__init__("dummy", self._match)
+
+    def add(self, matcher):
+        """Add a matcher to the set.
+
+        :param matcher: The matcher to add
+        :return: self - for fluent chaining
+        """
+        self._on_reconfigure()
+
+        position = len(self._matchers)
+        self._matchers.append(matcher)
+
+        if isinstance(matcher, AnyURLCore):
+            host_key = (
+                self._literal(matcher.parts["scheme"]),
+                self._literal(matcher.parts["host"]),
+            )
+            path_key = self._literal_path(matcher.parts["path"])
+            self._index[host_key][path_key].append(position)
+        else:
+            self._unindexed.append(position)
+
+        return self
+
+    def matching(self, url):
+        """Get every matcher in the set which matches a URL.
+
+        :param url: The URL to check
+        :return: A list of matchers, in the order they were added
+        """
+        parsed = self._parse(url)
+
+        return [
+            self._matchers[position]
+            for position in sorted(self._candidates(parsed))
+            if self._matches(self._matchers[position], url, parsed)
+        ]
+
+    @property
+    def matchers(self):
+        """Get all of the matchers in the set, in the order they were added."""
+        return tuple(self._matchers)
+
+    def __str__(self):
+        return f"* any URL matching one of {len(self._matchers)} matchers *"
+
+    def _match(self, other):
+        parsed = self._parse(other)
+
+        for position in self._candidates(parsed):
+            if self._matches(self._matchers[position], other, parsed):
+                return MATCH
+
+        return MatchResult(False, "No matchers in the set match {!r}", other)
+
+    @staticmethod
+    def _parse(url):
+        """Parse a URL once for every matcher, or get None if it isn't one."""
+        if not isinstance(url, str):
+            return None
+
+        return AnyURLCore._parse_url_cached(url)  # pylint: disable=protected-access
+
+    @staticmethod
+    def _matches(matcher, url, parsed):
+        if isinstance(matcher, AnyURLCore):
+            # pylint: disable=protected-access
+            if (rejection := matcher._reject_string(url)) is not None:
+                return rejection
+
+            return matcher._match_parsed(parsed)
+
+        return matcher == url
+
+    def _candidates(self, parsed):
+        """Get the positions of matchers which could match a parsed URL."""
+        yield from self._unindexed
+
+        if parsed is None:
+            return
+
+        scheme, host = parsed["scheme"], parsed["host"]
+        segment = self._first_segment(parsed["path"])
+
+        for host_key in ((scheme, host), (scheme, _ANY), (_ANY, host), (_ANY, _ANY)):
+            if paths := self._index.get(host_key):
+                yield from paths.get(segment, ())
+                yield from paths.get(_ANY, ())
+
+    @staticmethod
+    def _literal(value):
+        """Get a key for a part which is a literal value, or `_ANY`."""
+        if value is None or isinstance(value, str):
+            return value
+
+        return _ANY
+
+    @classmethod
+    def _literal_path(cls, path):
+        """Get a key for a path which is a literal value, or `_ANY`."""
+        if isinstance(path, _LiteralPath):
+            path = path.path
+
+        if path is None or isinstance(path, str):
+            return cls._first_segment(path)
+
+        return _ANY
+
+    @staticmethod
+    def _first_segment(path):
+        # Path matchers accept paths with or without a leading slash, so
+        # ignore them when indexing
+        return (path or "").lstrip("/").split("/", 1)[0]
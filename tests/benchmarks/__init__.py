@@ -0,0 +1,6 @@
+"""Benchmarks for h-matchers.
+
+These are not run as part of the test suite. Run them individually with:
+
+    python -m tests.benchmarks.<name> --help
+"""
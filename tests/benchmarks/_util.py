@@ -0,0 +1,21 @@
+"""Shared helpers for the benchmarks."""
+
+import resource
+import sys
+
+
+def rss_mb():
+    """Get the current resident set size of this process in MB.
+
+    Falls back to the peak RSS where the current value isn't available.
+    """
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as handle:
+            pages = int(handle.read().split()[1])
+
+        return pages * resource.getpagesize() / 2**20
+
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux reports KB
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
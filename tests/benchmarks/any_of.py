@@ -0,0 +1,35 @@
+"""Time `Any.of()` with a large number of literal options.
+
+python -m tests.benchmarks.any_of --options 10000 --count 10000
+"""
+
+import argparse
+import timeit
+
+from h_matchers import Any
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--options", type=int, default=10_000)
+    parser.add_argument("--count", type=int, default=10_000)
+    args = parser.parse_args()
+
+    options = [f"id-{i}" for i in range(args.options)] + [200, 404, None]
+    matcher = Any.of(options).stateless()
+    predicate = matcher.compile()
+    hit, miss = f"id-{args.options - 1}", "id-missing"
+
+    for label, function in (
+        ("== hit", lambda: matcher == hit),
+        ("== miss", lambda: matcher == miss),
+        ("compiled hit", lambda: predicate(hit)),
+        ("compiled miss", lambda: predicate(miss)),
+        ("list scan", lambda: miss in options),
+    ):
+        seconds = timeit.timeit(function, number=args.count)
+        print(f"{label:<14} {seconds / args.count * 1e6:10.2f} µs per match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare matching with `==` against a compiled matcher.
+
+python -m tests.benchmarks.compile --count 20000
+"""
+
+import argparse
+import timeit
+
+from h_matchers import Any
+
+
+def make_matcher():
+    return Any.dict.containing(
+        {
+            "id": Any.int().greater_than(0),
+            "name": Any.string.containing("user"),
+            "status": Any.of(["active", "disabled"]),
+            "profile": Any.object.with_attrs({"email": Any.string()}),
+            "tags": Any.list.comprised_of(Any.string()).of_size(at_least=1),
+            "links": Any.list.containing([Any.url(scheme="https", host="example.com")]),
+            "scores": Any.list.containing([Any.number() >= 10, Any.float()]),
+        }
+    )
+
+
+class Profile:
+    email = "user@example.com"
+
+
+PAYLOAD = {
+    "id": 12,
+    "name": "a user",
+    "status": "active",
+    "profile": Profile(),
+    "tags": ["a", "b", "c"],
+    "links": ["http://other.example.com", "https://example.com/path"],
+    "scores": [1, 2.5, 20],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    matcher = make_matcher()
+    predicate = matcher.compile()
+    assert matcher == PAYLOAD
+    assert predicate(PAYLOAD)
+
+    equals = timeit.timeit(lambda: matcher == PAYLOAD, number=args.count)
+    compiled = timeit.timeit(lambda: predicate(PAYLOAD), number=args.count)
+
+    print(f"==        {equals / args.count * 1e6:8.2f} µs per match")
+    print(f"compiled  {compiled / args.count * 1e6:8.2f} µs per match")
+    print(f"speed up  {equals / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Time matching items in any order as containers grow.
+
+Plain literal items are paired up by counting them first. The solver should
+grow roughly linearly with the number of possibilities, including for
+inputs which would make a backtracking search explode.
+
+python -m tests.benchmarks.containment --sizes 1000 2000 5000 10000
+"""
+
+import argparse
+import random
+import timeit
+
+from h_matchers import Any
+from h_matchers.matcher.collection.containment import AnyIterableWithItems
+
+
+def chain(size):
+    """Get possibilities where the greedy choice is wrong for every item."""
+    possibilities = [[index + 1, index] for index in range(size - 1)]
+    possibilities.append([size - 1])
+    # Put the most constrained item last so it's matched last
+    return possibilities[::-1]
+
+
+def sparse(size):
+    """Get possibilities with a few random choices for each item."""
+    generator = random.Random(size)
+    return [generator.sample(range(size), 3) for _ in range(size)]
+
+
+def impossible(size):
+    """Get possibilities with one more item to match than there are items."""
+    return [list(range(index, min(index + 3, size))) for index in range(size)] + [
+        [size - 1]
+    ]
+
+
+def time_it(function, count):
+    return timeit.timeit(function, number=count) / count * 1e3
+
+
+def time_size(size, count):
+    """Get timings in ms for each kind of input at a given size."""
+    # pylint: disable=protected-access
+    solve = AnyIterableWithItems._solve
+
+    container = list(range(size))
+    random.Random(size).shuffle(container)
+    predicate = Any.list.containing([Any.int()] * 100 + [0, size - 1]).compile()
+    literals = Any.list.containing(list(range(size))).only()
+
+    timings = [
+        time_it(lambda case=case: solve(case), count)
+        for case in (chain(size), sparse(size), impossible(size))
+    ]
+    timings.append(time_it(lambda: predicate(container), count))
+    timings.append(time_it(lambda: literals == container, count))
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--count", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>8} {'chain':>10} {'sparse':>10} {'impossible':>10}"
+        f" {'matcher':>10} {'literals':>10}"
+    )
+    for size in args.sizes:
+        timings = time_size(size, args.count)
+        print(f"{size:>8}" + "".join(f" {timing:>8.1f}ms" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Measure the memory allocated while matching large collections.
+
+Collections are used as they are, so the peak should be tiny compared to
+the size of a copy of the container. Only generators need copying.
+
+python -m tests.benchmarks.copies --size 1000000
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+from h_matchers import Any
+
+
+def peak_mb(function):
+    """Get the peak memory allocated while running a function in MB."""
+    tracemalloc.start()
+    try:
+        assert function()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    container = list(range(args.size))
+    as_set = set(container)
+    last = args.size - 1
+
+    cases = {
+        "list in order": (
+            Any.list.containing([0, last]).in_order().of_size(args.size),
+            container,
+        ),
+        "list any order": (Any.list.containing([last, Any.int()]), container),
+        "list items": (Any.list.comprised_of(Any.int()), container),
+        "set any order": (Any.set.containing([last, 0]), as_set),
+        "generator": (
+            Any.iterable.containing([last]),
+            (item for item in container),
+        ),
+    }
+
+    print(f"A list copy is {sys.getsizeof(container) / 2**20:.1f}MB")
+    for label, (matcher, other) in cases.items():
+        peak = peak_mb(lambda matcher=matcher, other=other: matcher == other)
+        print(f"{label:<16} {peak:8.2f}MB peak")
+
+
+if __name__ == "__main__":
+    main()
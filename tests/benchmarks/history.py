@@ -0,0 +1,47 @@
+"""Show that matcher memory use stays flat over many comparisons.
+
+python -m tests.benchmarks.history --count 10000000 --policy last
+"""
+
+import argparse
+import time
+
+from h_matchers import Any
+from h_matchers.matcher.history import History
+from tests.benchmarks._util import rss_mb
+
+POLICIES = {
+    "last": History.last(1),
+    "weak": History.weak(),
+    "off": History.off(),
+    "unbounded": History.unbounded(),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10_000_000)
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--policy", choices=POLICIES, default="last")
+    args = parser.parse_args()
+
+    matcher = Any.string().keep_history(POLICIES[args.policy])
+    sample_every = max(args.count // args.samples, 1)
+
+    print(f"policy={args.policy} count={args.count:,}")
+    print(f"{'comparisons':>14} {'rss (MB)':>10}")
+    print(f"{0:>14,} {rss_mb():>10.1f}")
+
+    start = time.perf_counter()
+    for i in range(1, args.count + 1):
+        # Make a new object every time, so anything retained costs memory
+        matcher == str(i)  # pylint: disable=expression-not-assigned
+
+        if not i % sample_every:
+            print(f"{i:>14,} {rss_mb():>10.1f}")
+
+    print(f"{time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Time how long it takes to `import h_matchers` in a fresh interpreter.
+
+This uses `python -X importtime`, and exits with an error if the import
+takes longer than `--max-ms`, or imports optional libraries.
+
+python -m tests.benchmarks.import_time --repeat 10 --max-ms 100
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+#: Modules which should only be imported when they are used
+LAZY_MODULES = ("requests", "pyramid", "h_matchers.matcher.web")
+
+
+def import_time():
+    """Import `h_matchers` in a new process.
+
+    :return: A tuple of the cumulative import time in ms, and the names of
+        all modules imported
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import h_matchers"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+
+    # Lines look like: "import time: self [us] | cumulative | imported package"
+    times = {}
+    for line in stderr.splitlines()[1:]:
+        _self, cumulative, name = line.split(":", 1)[1].split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times["h_matchers"] / 1000, list(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    timings = []
+    for _ in range(args.repeat):
+        timing, modules = import_time()
+        timings.append(timing)
+
+    median = statistics.median(timings)
+    print(f"import h_matchers: {median:.1f}ms median of {args.repeat}")
+
+    if unexpected := [module for module in modules if module.startswith(LAZY_MODULES)]:
+        sys.exit(f"Imported modules which should be lazy: {unexpected}")
+
+    if args.max_ms is not None and median > args.max_ms:
+        sys.exit(f"Import took longer than {args.max_ms}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Measure the memory used by many identical matchers, with and without interning.
+
+python -m tests.benchmarks.interning --count 10000
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from h_matchers import Any
+
+
+def make_matcher():
+    return Any.list.containing(
+        [Any.dict.containing({"id": Any.int(), "url": Any.url(host="example.com")})]
+    ).only()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10_000)
+    args = parser.parse_args()
+
+    other = [{"id": 1, "url": "http://example.com/path"}]
+
+    for label, make in (
+        ("plain", make_matcher),
+        ("interned", lambda: make_matcher().interned()),
+    ):
+        tracemalloc.start()
+        matchers = [make() for _ in range(args.count)]
+        memory = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+
+        seconds = timeit.timeit(
+            lambda matchers=matchers: [
+                matcher.compile()(other) for matcher in matchers
+            ],
+            number=1,
+        )
+
+        print(
+            f"{label:<9} {memory:8.2f}MB for {args.count} matchers, "
+            f"{seconds / args.count * 1e6:8.1f} µs to compile and match each"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Time checking lots of records with `match_many()` and in parallel.
+
+python -m tests.benchmarks.parallel --records 1000000 --workers 4
+"""
+
+import argparse
+import timeit
+
+from h_matchers import Any
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    matcher = Any.dict.containing(
+        {"id": Any.int(), "tags": Any.list.containing([1, 2]), "score": Any.float()}
+    )
+    records = [
+        {"id": i, "tags": [i % 3, 1, 2], "score": i / 3} for i in range(args.records)
+    ]
+
+    for name, function in (
+        ("match_many()", matcher.match_many),
+        (
+            "match_many_parallel()",
+            lambda items: matcher.match_many_parallel(items, max_workers=args.workers),
+        ),
+    ):
+        seconds = timeit.timeit(lambda f=function: f(records), number=1)
+        print(f"{name:>22}: {seconds:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measure the size of pickled matchers, and how long they take to load.
+
+Matchers don't pickle their match history, so a matcher which has matched
+many objects should pickle to the same size as a fresh one.
+
+python -m tests.benchmarks.pickle_size --repeat 10000
+"""
+
+import argparse
+import pickle
+import timeit
+
+from h_matchers import Any
+from h_matchers.matcher.history import History
+from h_matchers.matcher.web.request import AnyRequest
+from h_matchers.matcher.web.url import AnyURLSet
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10_000)
+    args = parser.parse_args()
+
+    cases = {
+        "string": Any.string(),
+        "regex": Any.string.matching(r"^\d+-[a-z]+$"),
+        "number": Any.int().greater_than(0).less_than(100).even(),
+        "list": Any.list.containing([1, Any.int()]).only(),
+        "mapping": Any.dict.containing({"id": Any.int(), "name": Any.string()}),
+        "object": Any.object.of_type(ValueError).with_attrs({"args": Any()}),
+        "url": Any.url("https://example.com/api/users?page=1"),
+        "request": AnyRequest(
+            "POST", url=Any.url(host="example.com"), headers={"Accept": Any()}
+        ),
+        "url set": AnyURLSet(
+            Any.url(f"https://example.com/api/{index}") for index in range(100)
+        ),
+    }
+
+    print(f"{'matcher':<10} {'bytes':>8} {'load us':>8}")
+    for label, matcher in cases.items():
+        pickled = pickle.dumps(matcher)
+        seconds = timeit.timeit(
+            lambda data=pickled: pickle.loads(data), number=args.repeat
+        )
+        print(f"{label:<10} {len(pickled):8} {seconds / args.repeat * 1e6:8.1f}")
+
+    matcher = Any.string().keep_history(History.unbounded())
+    before = len(pickle.dumps(matcher))
+    for index in range(100_000):
+        assert matcher == str(index)
+
+    print(
+        f"\nA string matcher with 100,000 matches in its history pickles to "
+        f"{len(pickle.dumps(matcher))} bytes ({before} bytes before matching)"
+    )
+
+
+if __name__ == "__main__":
+    main()
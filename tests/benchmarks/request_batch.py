@@ -0,0 +1,53 @@
+"""Time matching expected requests to captured requests.
+
+Compares checking every expectation against every captured request with
+`==`, to `AnyRequest.match_all()`.
+
+python -m tests.benchmarks.request_batch --expected 200 --captured 2000
+"""
+
+import argparse
+import timeit
+
+from requests import Request
+
+from h_matchers.matcher.web.request import AnyRequest
+
+
+def compare_every_pair(expected, captured):
+    """Pair each expectation with the first unused request it matches."""
+    used = set()
+    for expectation in expected:
+        for position, request in enumerate(captured):
+            if position not in used and expectation == request:
+                used.add(position)
+                break
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--expected", type=int, default=200)
+    parser.add_argument("--captured", type=int, default=2000)
+    args = parser.parse_args()
+
+    captured = [
+        Request(("GET", "POST")[i % 2], f"https://host-{i % 20}.example.com/items/{i}")
+        for i in range(args.captured)
+    ]
+    expected = [
+        AnyRequest(
+            ("GET", "POST")[i % 2], f"https://host-{i % 20}.example.com/items/{i}"
+        )
+        for i in range(0, args.captured, args.captured // args.expected)
+    ]
+
+    for name, function in (
+        ("every pair", compare_every_pair),
+        ("match_all()", AnyRequest.match_all),
+    ):
+        seconds = timeit.timeit(lambda f=function: f(expected, captured), number=1)
+        print(f"{name:>12}: {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
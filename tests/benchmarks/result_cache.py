@@ -0,0 +1,58 @@
+"""Time comparing the same few values to matchers with and without caching.
+
+python -m tests.benchmarks.result_cache --values 100000 --distinct 50
+"""
+
+import argparse
+import timeit
+from collections import namedtuple
+
+from h_matchers import Any
+
+Event = namedtuple("Event", ["kind", "status"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--values", type=int, default=100_000)
+    parser.add_argument("--distinct", type=int, default=50)
+    args = parser.parse_args()
+
+    statuses = [f"status-{i}" for i in range(args.distinct)]
+    cases = {
+        "status": (
+            lambda: Any.of([Any.string.matching(r"status-\d*[05]$"), "unknown"]),
+            statuses,
+        ),
+        "url": (
+            lambda: Any.url(host="example.com", query=Any.mapping.containing(["a"])),
+            [f"https://example.com/{i}?a={i}" for i in range(args.distinct)],
+        ),
+        "record": (
+            lambda: Any.tuple.containing(["click", Any.of(statuses[:10])]),
+            [Event("click", status) for status in statuses],
+        ),
+    }
+
+    for label, (make_matcher, distinct) in cases.items():
+        values = [distinct[i % len(distinct)] for i in range(args.values)]
+
+        for size in (0, args.distinct):
+            matcher = make_matcher().stateless().cache_results(size)
+            seconds = timeit.timeit(
+                lambda matcher=matcher, values=values: [
+                    matcher == value for value in values
+                ],
+                number=1,
+            )
+            info = matcher.cache_info()
+
+            print(
+                f"{label:<7} cache size {size:>5}: "
+                f"{seconds / args.values * 1e6:6.2f} µs per value"
+                f" ({info.hit_rate:.0%} hits)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Time matching URLs against many URL matchers with and without caching.
+
+python -m tests.benchmarks.url_parse --matchers 100 --urls 1000
+"""
+
+import argparse
+import timeit
+
+from h_matchers import Any
+from h_matchers.matcher.web.url.core import AnyURLCore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--matchers", type=int, default=100)
+    parser.add_argument("--urls", type=int, default=1000)
+    args = parser.parse_args()
+
+    matcher = Any.of(
+        [
+            Any.url(host=f"host-{i}.example.com", query=Any.mapping.containing(["a"]))
+            for i in range(args.matchers)
+        ]
+    ).stateless()
+    urls = [
+        f"https://host-{i % (args.matchers * 2)}.example.com/path/{i}?a={i}&b=2"
+        for i in range(args.urls)
+    ]
+
+    for cache_size in (0, AnyURLCore.PARSE_CACHE_SIZE):
+        AnyURLCore.set_parse_cache_size(cache_size)
+        seconds = timeit.timeit(lambda: [matcher == url for url in urls], number=1)
+        info = AnyURLCore.parse_cache_info()
+
+        print(
+            f"cache size {cache_size:>5}: {seconds / args.urls * 1e6:8.1f} µs per URL"
+            f" (URLs: {info.urls.hits} hits, {info.urls.misses} misses;"
+            f" queries: {info.queries.hits} hits, {info.queries.misses} misses)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Time matching URLs against an allow-list with `Any.of()` and `AnyURLSet`.
+
+python -m tests.benchmarks.url_set --matchers 500 --urls 1000
+"""
+
+import argparse
+import timeit
+
+from h_matchers import Any
+from h_matchers.matcher.web.url import AnyURLSet
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--matchers", type=int, default=500)
+    parser.add_argument("--urls", type=int, default=1000)
+    args = parser.parse_args()
+
+    patterns = [
+        Any.url(f"https://host-{i % 50}.example.com/api-{i}/items")
+        for i in range(args.matchers)
+    ]
+    urls = [
+        f"https://host-{i % 100}.example.com/api-{i % (args.matchers * 2)}/items"
+        for i in range(args.urls)
+    ]
+
+    for name, matcher in (
+        ("Any.of()", Any.of(patterns).stateless()),
+        ("AnyURLSet", AnyURLSet(patterns).stateless()),
+    ):
+        seconds = timeit.timeit(lambda m=matcher: [m == url for url in urls], number=1)
+        print(f"{name:>10}: {seconds / args.urls * 1e6:8.1f} µs per URL")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+import pickle
+import re
+
+import pytest
+
+from h_matchers import Any
+from h_matchers.matcher.history import History
+from h_matchers.matcher.web.request import AnyRequest
+from h_matchers.matcher.web.url import AnyURLSet
+
+# Functions which make the same matcher each time they are called
+SPECS = {
+    "anything": Any,
+    "string": Any.string,
+    "string containing": lambda: Any.string.containing("a"),
+    "string matching": lambda: Any.string.matching("a.*", re.IGNORECASE),
+    "number": lambda: Any.int().greater_than(2).odd(),
+    "approximately": lambda: Any.float().approximately(1.5),
+    "function": Any.function,
+    "callable": Any.callable,
+    "any of": lambda: Any.of([None, 1, Any.string()]),
+    "list in order": lambda: Any.list.containing([1, 2]).in_order(),
+    "list only": lambda: Any.list.containing([1, Any.int()]).only(),
+    "mapping": lambda: Any.dict.containing({"a": [1, 2], "b": Any.int()}),
+    "iterable": lambda: Any.iterable.comprised_of(Any.int()).of_size(at_least=1),
+    "object": lambda: Any.object.of_type(ValueError).with_attrs({"args": Any()}),
+    "url": lambda: Any.url("http://example.com/path?a=1"),
+    "url fluent": lambda: Any.url.with_host("example.com").with_path(Any.string()),
+    "request": lambda: AnyRequest("GET", url="http://example.com", headers={"A": "a"}),
+    "url set": lambda: AnyURLSet([Any.url(host="a.com"), Any.string()]),
+}
+
+
+class TestFingerprints:
+    @pytest.mark.parametrize("make", SPECS.values(), ids=SPECS.keys())
+    def test_identical_matchers_have_the_same_fingerprint(self, make):
+        matcher, other = make(), make()
+
+        assert matcher.fingerprint() == other.fingerprint()
+        assert hash(matcher.interned()) == hash(other.interned())
+
+    @pytest.mark.parametrize("make", SPECS.values(), ids=SPECS.keys())
+    def test_only_interned_matchers_are_hashable(self, make):
+        matcher = make()
+
+        with pytest.raises(TypeError):
+            hash(matcher)
+
+        assert matcher.interned() in {matcher.interned()}
+
+    def test_different_matchers_have_different_fingerprints(self):
+        fingerprints = {make().fingerprint() for make in SPECS.values()}
+
+        assert len(fingerprints) == len(SPECS)
+
+    @pytest.mark.parametrize(
+        "matcher,other",
+        (
+            (Any.int().greater_than(2), Any.int().greater_than(3)),
+            (Any.of([1]), Any.of([True])),
+            (Any.list.containing([1, 2]), Any.list.containing([1, 2]).only()),
+            (Any.url(host="a.com"), Any.url(host="b.com")),
+            (Any.string.matching("a"), Any.string.matching("a", re.IGNORECASE)),
+        ),
+    )
+    def test_configuration_changes_the_fingerprint(self, matcher, other):
+        assert matcher.fingerprint() != other.fingerprint()
+
+    @pytest.mark.parametrize("make", SPECS.values(), ids=SPECS.keys())
+    def test_fingerprints_survive_pickling(self, make):
+        matcher = make()
+
+        assert pickle.loads(pickle.dumps(matcher)).fingerprint() == (
+            matcher.fingerprint()
+        )
+
+    def test_matching_does_not_change_the_fingerprint(self):
+        matcher = Any.url(host="example.com")
+        fingerprint = matcher.fingerprint()
+
+        assert matcher == "http://example.com/path"
+
+        assert matcher.fingerprint() == fingerprint
+
+
+class TestInterning:
+    @pytest.mark.parametrize("make", SPECS.values(), ids=SPECS.keys())
+    def test_identical_matchers_share_one_instance(self, make):
+        matcher = make().interned()
+
+        assert make().interned() is matcher
+        assert matcher.compile() is make().interned().compile()
+
+    def test_interned_matchers_match_like_the_original(self):
+        matcher = Any.list.containing([1, Any.int()]).only().interned()
+
+        assert matcher == [2, 1]
+        assert matcher != [1, 2, 3]
+        assert matcher.compile()([2, 1])
+        assert not matcher.matched_to
+
+    @pytest.mark.parametrize(
+        "change",
+        (
+            lambda matcher: matcher.containing([3]),
+            lambda matcher: matcher.of_size(2),
+            lambda matcher: matcher.only(),
+            lambda matcher: matcher.keep_history(None),
+        ),
+    )
+    def test_interned_matchers_cant_be_changed(self, change):
+        matcher = Any.list.containing([1, 2]).interned()
+
+        with pytest.raises(TypeError):
+            change(matcher)
+
+        assert matcher == [2, 1, 3]
+
+    @pytest.mark.parametrize(
+        "make,change",
+        (
+            (
+                lambda: AnyRequest("GET", url="http://example.com"),
+                lambda matcher: matcher.url.with_host("other.com"),
+            ),
+            (
+                lambda: AnyRequest("GET", headers={"A": "a"}),
+                lambda matcher: matcher.headers.only(),
+            ),
+            (
+                lambda: Any.url("http://example.com"),
+                lambda matcher: matcher.parts.__setitem__("host", "other.com"),
+            ),
+            (
+                lambda: Any.url("http://example.com"),
+                lambda matcher: matcher.parts.update(host="other.com"),
+            ),
+            (
+                lambda: Any.url("http://example.com?a=1"),
+                lambda matcher: matcher.parts["query"].update(a="2"),
+            ),
+            (
+                lambda: Any.object.with_attrs({"a": Any.int()}),
+                lambda matcher: matcher.a.greater_than(1),
+            ),
+            (
+                lambda: Any.of([1, Any.int()]),
+                lambda matcher: matcher.options.append(2),
+            ),
+            (
+                lambda: Any.of([1, Any.int()]),
+                lambda matcher: matcher.options[1].greater_than(1),
+            ),
+            (
+                lambda: Any.dict.containing({"a": [1, Any.int()]}),
+                # pylint: disable=protected-access
+                lambda matcher: matcher._items["a"].append(3),
+            ),
+            (
+                lambda: AnyURLSet([Any.url(host="a.com")]),
+                lambda matcher: matcher.matchers[0].with_path("/path"),
+            ),
+        ),
+    )
+    def test_matchers_inside_interned_matchers_cant_be_changed(self, make, change):
+        matcher = make().interned()
+        predicate = matcher.compile()
+        fingerprint = matcher.fingerprint()
+
+        with pytest.raises(TypeError):
+            change(matcher)
+
+        assert matcher.fingerprint() == make().fingerprint() == fingerprint
+        assert matcher.compile() is predicate
+
+    @pytest.mark.parametrize("make", SPECS.values(), ids=SPECS.keys())
+    def test_interned_matchers_can_be_pickled(self, make):
+        matcher = make().interned()
+
+        unpickled = pickle.loads(pickle.dumps(matcher))
+
+        assert unpickled.fingerprint() == matcher.fingerprint()
+        assert hash(unpickled) == hash(matcher)
+
+    def test_it_does_not_freeze_shared_url_defaults(self):
+        Any.url(host="example.com").interned()
+
+        Any.url.STRING_OR_NONE.keep_history(History.off())
+
+    def test_it_does_not_change_the_original(self):
+        matcher = Any.list.containing([1, 2])
+        matcher.interned()
+
+        matcher.only()
+
+        assert matcher != [2, 1, 3]
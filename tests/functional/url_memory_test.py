@@ -0,0 +1,33 @@
+from h_matchers import Any
+from h_matchers.matcher.web.url.core import AnyURLCore
+from h_matchers.matcher.web.url.fluent import AnyURL
+
+
+class TestSharedURLMatchers:
+    def test_shared_matchers_retain_nothing_after_many_matches(self):
+        # This is a regression test for shared class level matchers which
+        # slowly collected every URL part they were ever compared to. Shared
+        # matchers keep no history at all, so a few thousand URLs are enough
+        # to catch them keeping anything.
+        matcher = Any.url.with_scheme().with_host().with_query()
+
+        for i in range(5_000):
+            assert matcher == f"http://example.com/{i};params?a={i}#fragment-{i}"
+
+        for shared_matcher in self.shared_matchers():
+            assert not shared_matcher.matched_to
+
+    @classmethod
+    def shared_matchers(cls):
+        matchers = [
+            AnyURLCore.STRING_OR_NONE,
+            AnyURLCore.MAP_OR_NONE,
+            *AnyURL.PRESENT_DEFAULT.values(),
+        ]
+
+        while matchers:
+            matcher = matchers.pop()
+            # pylint: disable=protected-access
+            matchers.extend(matcher._child_matchers())
+
+            yield matcher
@@ -0,0 +1,7 @@
+from h_matchers.exception import NoMatch
+
+
+class TestNoMatch:
+    def test_it_can_still_be_imported_and_raised(self):
+        assert issubclass(NoMatch, Exception)
+        assert str(NoMatch("reason")) == "reason"
@@ -1,8 +1,13 @@
+import subprocess
+import sys
+
 import pytest
 
-from h_matchers.interface import All, Any
+from h_matchers.interface import All, Any, _Lazy
 from h_matchers.matcher.anything import AnyThing
 from h_matchers.matcher.combination import AllOf
+from h_matchers.matcher.web.request import AnyRequest
+from h_matchers.matcher.web.url import AnyURL
 
 
 class TestAny:
@@ -32,6 +37,58 @@ class TestAny:
     def test_it_has_expected_attributes(self, attribute):
         assert hasattr(Any, attribute)
 
+    @pytest.mark.parametrize(
+        "attribute,value", (("url", AnyURL), ("request", AnyRequest))
+    )
+    def test_it_loads_web_matchers_lazily(self, attribute, value):
+        class Namespace:
+            lazy = _Lazy(value.__module__, value.__name__)
+
+        assert isinstance(Namespace.__dict__["lazy"], _Lazy)
+        assert Namespace.lazy is value
+        # Once loaded, the real value replaces the lazy attribute
+        assert Namespace.__dict__["lazy"] is value
+        assert getattr(Any, attribute) is value
+
+    # Modules which should only be imported when a matcher needs them
+    LAZY_MODULES = (
+        "h_matchers.matcher.web",
+        "h_matchers.matcher.web.url",
+        "h_matchers.matcher.web.request",
+        "requests",
+        "pyramid",
+        "webob",
+    )
+
+    def test_importing_does_not_import_optional_libraries(self):
+        self.assert_in_fresh_interpreter(
+            "import sys, h_matchers",
+            f"loaded = [name for name in {self.LAZY_MODULES!r} if name in sys.modules]",
+            "assert not loaded, loaded",
+        )
+
+    def test_using_web_matchers_imports_them(self):
+        # Check the test above would notice the modules being imported
+        self.assert_in_fresh_interpreter(
+            "import sys, h_matchers",
+            "h_matchers.Any.url, h_matchers.Any.request",
+            "assert 'h_matchers.matcher.web.url' in sys.modules",
+            "assert 'h_matchers.matcher.web.request' in sys.modules",
+        )
+
+    @staticmethod
+    def assert_in_fresh_interpreter(*lines):
+        # This needs a fresh interpreter, as the tests will have imported
+        # everything already
+        result = subprocess.run(
+            [sys.executable, "-c", "\n".join(lines)],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+        assert not result.returncode, result.stderr
+
     def test_is_subclass_of_AnyThing(self):
         assert issubclass(Any, AnyThing)
 
@@ -9,3 +9,4 @@ class TestAnything:
     def test_it_matches(self, item, _):
         assert AnyThing() == item
         assert item == AnyThing()
+        assert AnyThing().compile()(item)
@@ -0,0 +1,160 @@
+import pickle
+from collections import namedtuple
+from dataclasses import dataclass
+from decimal import Decimal
+
+import pytest
+
+from h_matchers.matcher.cache import CacheInfo, ResultCache, cache_key
+from h_matchers.matcher.core import Matcher
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+@dataclass(frozen=True)
+class FrozenRecord:
+    name: object
+
+
+@dataclass
+class MutableRecord:
+    name: object
+
+
+@dataclass(frozen=True, eq=False)
+class IdentityRecord:
+    name: object
+
+
+class String(str):
+    pass
+
+
+class TestCacheKey:
+    @pytest.mark.parametrize(
+        "value",
+        (
+            "string",
+            b"bytes",
+            1,
+            1.5,
+            1j,
+            True,
+            Decimal("1.5"),
+            None,
+            (1, "a"),
+            Point(1, 2),
+            frozenset((1, 2)),
+            FrozenRecord(name="a"),
+            FrozenRecord(name=(1, FrozenRecord(name=None))),
+        ),
+    )
+    def test_it_gives_keys_for_values_which_cant_change(self, value):
+        key = cache_key(value)
+
+        assert key is not None
+        assert hash(key) == hash(cache_key(value))
+
+    @pytest.mark.parametrize(
+        "value",
+        (
+            [1],
+            {"a": 1},
+            {1},
+            object(),
+            String("string"),
+            (1, [2]),
+            frozenset(((1, String("a")),)),
+            MutableRecord(name="a"),
+            IdentityRecord(name="a"),
+            FrozenRecord(name=[1]),
+        ),
+    )
+    def test_it_gives_None_for_values_which_can_change(self, value):
+        assert cache_key(value) is None
+
+    @pytest.mark.parametrize(
+        "value,other",
+        (
+            (1, True),
+            (1, 1.0),
+            ((1,), (True,)),
+            ((1, 2), Point(1, 2)),
+            (frozenset((1,)), frozenset((1.0,))),
+        ),
+    )
+    def test_it_includes_the_type_in_the_key(self, value, other):
+        assert value == other
+        assert cache_key(value) != cache_key(other)
+
+
+class TestCacheInfo:
+    @pytest.mark.parametrize(
+        "hits,misses,hit_rate", ((0, 0, 0.0), (3, 1, 0.75), (0, 2, 0.0))
+    )
+    def test_hit_rate(self, hits, misses, hit_rate):
+        assert CacheInfo(hits, misses, 10, 0).hit_rate == hit_rate
+
+
+class TestResultCache:
+    def test_it_stores_results(self):
+        cache = ResultCache(2)
+
+        cache.put("key", "result")
+
+        assert cache.get("key") == "result"
+        assert cache.get("missing") is None
+        assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    @pytest.mark.parametrize(
+        "eviction,kept", (("lru", ["a", "c"]), ("fifo", ["b", "c"]))
+    )
+    def test_it_evicts_results_when_full(self, eviction, kept):
+        cache = ResultCache(2, eviction)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        cache.put("c", 3)
+
+        assert [key for key in "abc" if cache.get(key) is not None] == kept
+
+    def test_clear_keeps_the_statistics(self):
+        cache = ResultCache(2)
+        cache.put("key", "result")
+        cache.get("key")
+
+        cache.clear()
+
+        assert cache.get("key") is None
+        assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=0)
+
+    def test_clear_if_stale_clears_when_a_matcher_changes(self):
+        matcher = Matcher("description", bool)
+        cache = ResultCache(2)
+        cache.clear_if_stale(lambda: [matcher])
+        cache.put("key", "result")
+
+        cache.clear_if_stale(lambda: [matcher])
+        assert cache.get("key") == "result"
+
+        matcher._on_reconfigure()  # pylint: disable=protected-access
+        cache.clear_if_stale(lambda: [matcher])
+        assert cache.get("key") is None
+
+    def test_it_pickles_without_the_results(self):
+        cache = ResultCache(2, "fifo")
+        cache.put("key", "result")
+
+        cache = pickle.loads(pickle.dumps(cache))
+
+        assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+        assert cache.eviction == "fifo"
+
+    @pytest.mark.parametrize("maxsize,eviction", ((0, "lru"), (1, "random")))
+    def test_it_raises_for_bad_settings(self, maxsize, eviction):
+        with pytest.raises(ValueError):
+            ResultCache(maxsize, eviction)
+
+    def test_repr(self):
+        assert repr(ResultCache(10, "fifo")) == "<ResultCache fifo 10>"
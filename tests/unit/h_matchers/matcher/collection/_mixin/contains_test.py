@@ -1,18 +1,16 @@
 import pytest
 
-from h_matchers.exception import NoMatch
 from h_matchers.matcher.collection._mixin.contains import ContainsMixin
 
 
 class HostClass(ContainsMixin):
-    def __eq__(self, other):
-        try:
-            self._check_contains(list(other), other)
+    reconfigured = 0
 
-        except NoMatch:
-            return False
+    def __eq__(self, other):
+        return bool(self._check_contains(list(other), other))
 
-        return True
+    def _on_reconfigure(self):
+        self.reconfigured += 1
 
 
 class TestContainsMixin:
@@ -20,6 +18,15 @@ class TestContainsMixin:
         with pytest.raises(ValueError):
             HostClass().in_order()
 
+    @pytest.mark.parametrize("method", ("in_order", "only"))
+    def test_it_tells_the_host_it_has_been_reconfigured(self, method):
+        matcher = HostClass.containing(["a"])
+
+        getattr(matcher, method)()
+
+        # Once for `containing()` and once for the method
+        assert matcher.reconfigured == 2
+
     def test_it_extracts_items_from_other_ContainsMixin_children(self):
         doner = HostClass.containing(["a", "b", "c"])
 
@@ -86,6 +93,16 @@ class TestContainsMixin:
         assert matcher == [2, 1]
         assert matcher != [0, 1, 2]
 
+    @pytest.mark.parametrize("in_order", (True, False))
+    def test_it_can_match_iterators(self, in_order):
+        matcher = HostClass.containing([1, 2])
+        if in_order:
+            matcher.in_order()
+
+        assert matcher == iter([1, 2])
+        assert matcher == (item for item in [1, 2])
+        assert matcher != iter([1])
+
     def test_only_fails_with_no_items(self):
         with pytest.raises(ValueError):
             HostClass().only()
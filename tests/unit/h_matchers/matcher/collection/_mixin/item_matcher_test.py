@@ -1,17 +1,10 @@
 from h_matchers import Any
-from h_matchers.exception import NoMatch
 from h_matchers.matcher.collection._mixin.item_matcher import ItemMatcherMixin
 
 
 class HostClass(ItemMatcherMixin):
     def __eq__(self, other):
-        try:
-            self._check_item_matcher(list(other), None)
-
-        except NoMatch:
-            return False
-
-        return True
+        return bool(self._check_item_matcher(list(other), None))
 
 
 class TestItemMatcherMixin:
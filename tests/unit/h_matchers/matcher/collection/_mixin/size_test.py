@@ -1,18 +1,11 @@
 import pytest
 
-from h_matchers.exception import NoMatch
 from h_matchers.matcher.collection._mixin.size import SizeMixin
 
 
 class HostClass(SizeMixin):
     def __eq__(self, other):
-        try:
-            self._check_size(list(other))
-
-        except NoMatch:
-            return False
-
-        return True
+        return bool(self._check_size(list(other)))
 
 
 class TestSizeMixin:
@@ -1,16 +1,9 @@
-from h_matchers.exception import NoMatch
 from h_matchers.matcher.collection._mixin.type import TypeMixin
 
 
 class HostClass(TypeMixin):
     def __eq__(self, other):
-        try:
-            self._check_type(None, original=other)
-
-        except NoMatch:
-            return False
-
-        return True
+        return bool(self._check_type(None, original=other))
 
 
 class TestTypeMixin:
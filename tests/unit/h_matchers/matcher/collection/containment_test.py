@@ -1,14 +1,33 @@
+from random import Random
+
 import pytest
+from pytest import param
+from requests.structures import CaseInsensitiveDict
+from webob.multidict import MultiDict as WebObMultiDict
 
 from h_matchers import Any
 from h_matchers.matcher.collection.containment import (
     AnyIterableWithItems,
     AnyIterableWithItemsInOrder,
     AnyMappingWithItems,
+    _AnyPair,
+    as_collection,
 )
 from tests.unit.data_types import DataTypes
 
 
+class LowerCaseKeyDict(dict):
+    """A dict which finds keys in any case, with a custom `__getitem__`."""
+
+    def __contains__(self, key):
+        return any(key.lower() == other.lower() for other in self)
+
+    def __getitem__(self, key):
+        return next(
+            value for other, value in self.items() if key.lower() == other.lower()
+        )
+
+
 class MultiDict(list):
     """Very bare bones implementation of a multi-dict."""
 
@@ -20,6 +39,7 @@ class TestAnyMappableWithItems:
     @pytest.mark.parametrize("item,_", DataTypes.parameters())
     def test_it_fails_gracefully(self, item, _):
         assert item != AnyMappingWithItems({"a": 1})
+        assert not AnyMappingWithItems({"a": 1}).compile()(item)
 
     def test_it_can_match_values(self):
         matcher = AnyMappingWithItems({"a": 1})
@@ -31,6 +51,11 @@ class TestAnyMappableWithItems:
         assert {"a": 2} != matcher
         assert {"b": 2} != matcher
 
+        predicate = matcher.compile()
+        assert predicate({"a": 1, "b": 2})
+        assert not predicate({"a": 2})
+        assert not predicate({"b": 2})
+
     def test_it_can_match_multi_dicts(self):
         multi_dict = MultiDict((("a", 2), ["a", 1], ("b", 2)))
 
@@ -39,6 +64,9 @@ class TestAnyMappableWithItems:
         assert multi_dict == AnyMappingWithItems({"a": 1, "b": 2})
         assert multi_dict != AnyMappingWithItems({"d": 1})
 
+        assert AnyMappingWithItems({"a": 1, "b": Any.int()}).compile()(multi_dict)
+        assert not AnyMappingWithItems({"d": 1}).compile()(multi_dict)
+
     def test_it_can_match_with_multi_dicts(self):
         multi_dict = MultiDict((("a", 2), ["a", 1], ("b", 2)))
 
@@ -48,11 +76,128 @@ class TestAnyMappableWithItems:
         assert {"a": 1, "b": 2} != matcher
         assert MultiDict((("a", 2), ["a", 1], ("b", 2), ["c", 3])) == matcher
 
+    @pytest.mark.parametrize(
+        "key_values,matches",
+        (
+            # Items are compared exactly, whatever the mapping does with keys
+            ({"content-type": "text/html"}, False),
+            ({"Content-Type": "text/html"}, True),
+            ({"Content-Type": Any.string.containing("html")}, True),
+            ({"Content-Type": "text/plain"}, False),
+            ({"Accept": "text/html"}, False),
+            ({1: "text/html"}, False),
+        ),
+    )
+    @pytest.mark.parametrize(
+        "mapping_class", (CaseInsensitiveDict, dict, LowerCaseKeyDict)
+    )
+    def test_it_looks_up_keys_in_mappings(self, mapping_class, key_values, matches):
+        headers = mapping_class({"Content-Type": "text/html", "X": "y"})
+        matcher = AnyMappingWithItems(key_values)
+
+        assert (headers == matcher) is matches
+        assert matcher.compile()(headers) is matches
+        # Looking up the keys gives the same answer as searching the items
+        assert (list(headers.items()) == AnyIterableWithItems(key_values.items())) is (
+            matches
+        )
+
+    @pytest.mark.parametrize(
+        "container",
+        (
+            CaseInsensitiveDict({"a": 1, "b": 2}),
+            WebObMultiDict([("a", 0), ("a", 1), ("b", 2)]),
+            MultiDict([("a", 1), ("b", 2)]),
+        ),
+    )
+    def test_it_reads_other_mappings_once_rather_than_searching(self, container, patch):
+        mapping_comparison = patch(
+            "h_matchers.matcher.collection.containment"
+            ".AnyMappingWithItems._mapping_comparison"
+        )
+
+        assert container == AnyMappingWithItems({"a": 1, "b": Any.int()})
+        assert container != AnyMappingWithItems({"a": 2})
+        assert container != AnyMappingWithItems({"A": 1})
+        mapping_comparison.assert_not_called()
+
+    def test_it_searches_mappings_with_unhashable_keys(self):
+        container = MultiDict([(["a"], 1), ("b", 2)])
+        matcher = AnyMappingWithItems({"b": 2})
+
+        assert container == matcher
+        assert matcher.compile()(container)
+        assert container != AnyMappingWithItems({"b": 3})
+        assert not AnyMappingWithItems({"b": 3}).compile()(container)
+
+    def test_it_ignores_custom_key_lookups_in_dict_subclasses(self):
+        headers = LowerCaseKeyDict({"Content-Type": "text/html"})
+        assert "content-type" in headers
+        assert headers["content-type"] == "text/html"
+
+        matcher = AnyMappingWithItems({"content-type": "text/html"})
+
+        assert headers != matcher
+        assert not matcher.compile()(headers)
+
+    @pytest.mark.parametrize(
+        "key_values,matches",
+        (
+            ({"a": 1}, True),
+            ({"a": 2, "b": 3}, True),
+            ({"a": Any.int().greater_than(1)}, True),
+            ({"a": 3}, False),
+            ({"c": 1}, False),
+        ),
+    )
+    def test_it_checks_every_value_in_multi_dicts(self, key_values, matches):
+        multi_dict = WebObMultiDict([("a", 1), ("a", 2), ("b", 3)])
+        matcher = AnyMappingWithItems(key_values)
+
+        assert (multi_dict == matcher) is matches
+        assert matcher.compile()(multi_dict) is matches
+
+    @pytest.mark.parametrize(
+        "key_values,matches",
+        (
+            param(MultiDict([("a", Any.int()), ("a", 1)]), False, id="duplicate keys"),
+            param(MultiDict([(Any.string(), 1)]), True, id="matcher keys"),
+            param(MultiDict([(["a"], 1)]), False, id="unhashable keys"),
+        ),
+    )
+    @pytest.mark.parametrize("container", ({"a": 1}, CaseInsensitiveDict({"a": 1})))
+    def test_it_searches_if_keys_cannot_be_looked_up(
+        self, container, key_values, matches
+    ):
+        matcher = AnyMappingWithItems(key_values)
+
+        assert (container == matcher) is matches
+        assert matcher.compile()(container) is matches
+
+
+class TestAsCollection:
+    @pytest.mark.parametrize(
+        "value", ([1, 2], (1, 2), {1, 2}, {1: 2}, {1: 2}.keys(), "12", range(2))
+    )
+    def test_it_returns_collections_unchanged(self, value):
+        assert as_collection(value) is value
+
+    @pytest.mark.parametrize(
+        "value", (iter([1, 2]), (item for item in [1, 2]), reversed([2, 1]))
+    )
+    def test_it_copies_iterators(self, value):
+        assert as_collection(value) == [1, 2]
+
+    def test_it_raises_for_non_iterables(self):
+        with pytest.raises(TypeError):
+            as_collection(1)
+
 
 class TestAnyIterableWithItemsInOrder:
     @pytest.mark.parametrize("item,_", DataTypes.parameters())
     def test_it_fails_gracefully(self, item, _):
         assert item != AnyIterableWithItemsInOrder(["a"])
+        assert not AnyIterableWithItemsInOrder(["a"]).compile()(item)
 
     def test_it_matches_in_order(self):
         matcher = AnyIterableWithItemsInOrder([1, 1, 2])
@@ -63,6 +208,10 @@ class TestAnyIterableWithItemsInOrder:
         assert matcher != [0, 2, 1, 1, 3]
         assert matcher != [1, 2, 2]
 
+        predicate = matcher.compile()
+        assert predicate([2, 1, 1, 2, 3])
+        assert not predicate([0, 2, 1, 1, 3])
+
     def test_it_matches_generators_in_order(self):
         matcher = AnyIterableWithItemsInOrder([0, 1, 2])
 
@@ -72,11 +221,32 @@ class TestAnyIterableWithItemsInOrder:
         assert matcher != iter(range(2))
         assert iter(range(2)) != matcher
 
+    @pytest.mark.parametrize(
+        "container,matches",
+        (
+            ((0, 1, 2), True),
+            (range(3), True),
+            ("012", False),
+            ({0: 0, 1: 1, 2: 2}, True),
+        ),
+    )
+    def test_it_matches_other_iterables(self, container, matches):
+        matcher = AnyIterableWithItemsInOrder([0, 1, 2])
+
+        assert (matcher == container) == matches
+        assert matcher.compile()(container) == matches
+
+    def test_it_matches_strings_by_character(self):
+        assert AnyIterableWithItemsInOrder(["b", "c"]) == "abc"
+        assert AnyIterableWithItemsInOrder(["bc"]) != "abc"
+        assert AnyIterableWithItemsInOrder([1]) != "abc"
+
 
 class TestAnyIterableWithItems:
     @pytest.mark.parametrize("item,_", DataTypes.parameters())
     def test_it_fails_gracefully(self, item, _):
         assert item != AnyIterableWithItems(["a"])
+        assert not AnyIterableWithItems(["a"]).compile()(item)
 
     def test_it_matches_out_of_order(self):
         matcher = AnyIterableWithItems([1, 2])
@@ -128,6 +298,7 @@ class TestAnyIterableWithItems:
 
         assert matcher == ["aaaa", "a", "", None]
         assert ["aaaa", "a", "", None] == matcher
+        assert matcher.compile()(["aaaa", "a", "", None])
 
     def test_it_detects_incompatible_matches(self):
         matcher = AnyIterableWithItems(
@@ -140,6 +311,143 @@ class TestAnyIterableWithItems:
 
         assert ["a", "aa", None] != matcher
         assert matcher != ["a", "aa", None]
+        assert not matcher.compile()(["a", "aa", None])
+
+    def test_it_matches_when_there_is_nothing_to_match(self):
+        matcher = AnyIterableWithItems([])
+
+        assert matcher == [1, 2]
+        assert matcher.compile()([1, 2])
+
+    def test_it_fails_quickly_with_too_many_items_to_match(self):
+        # Backtracking would try every permutation here before giving up
+        matcher = AnyIterableWithItems([Any.int()] * 201)
+
+        assert matcher != list(range(200))
+        assert not matcher.compile()(list(range(200)))
+
+    def test_it_handles_long_augmenting_paths(self):
+        # A greedy choice here leaves the last item without a partner, and
+        # fixing that requires reassigning every other item in a long chain
+        size = 5000
+        possibilities = [[index + 1, index] for index in range(size - 1)]
+        possibilities.append([size - 1, size - 1])
+
+        solution = AnyIterableWithItems._solve(  # pylint: disable=protected-access
+            possibilities
+        )
+
+        assert solution == tuple(range(size))
+
+    @pytest.mark.parametrize("seed", range(200))
+    def test_it_agrees_with_a_simple_search(self, seed):
+        random = Random(seed)
+        items, matches = random.randint(1, 12), random.randint(0, 12)
+        possibilities = [
+            sorted(random.sample(range(items), random.randint(1, min(items, 3))))
+            for _ in range(matches)
+        ]
+
+        solution = AnyIterableWithItems._solve(  # pylint: disable=protected-access
+            possibilities
+        )
+
+        if self._can_match_everything(possibilities):
+            assert len(set(solution)) == matches
+            for item_index, options in zip(solution, possibilities):
+                assert item_index in options
+        else:
+            assert solution is None
+
+    @staticmethod
+    def _can_match_everything(possibilities):
+        # Kuhn's algorithm: find an augmenting path for each item in turn
+        owners = {}
+
+        def augment(match_index, seen):
+            for item_index in possibilities[match_index]:
+                if item_index not in seen:
+                    seen.add(item_index)
+                    if item_index not in owners or augment(owners[item_index], seen):
+                        owners[item_index] = match_index
+                        return True
+            return False
+
+        return all(augment(index, set()) for index in range(len(possibilities)))
+
+    @pytest.mark.parametrize(
+        "items_to_match,container,matches",
+        (
+            ([1, 2, 2, "a", None], [None, 2, "a", 2, 1, 5], True),
+            ([1, 1], [1], False),
+            ([1, 1], [1, 2, 1], True),
+            # Values of different types can still be equal
+            ([1], [True], True),
+            ([1, True], [True, 1], True),
+            ([1, True], [1, 1], True),
+            ([1], [1.0], True),
+            ([0, 0], [False, 0], True),
+            ([0, 0, 0], [False, 0], False),
+            ([b"a"], ["a"], False),
+            # Items in the container could be matchers
+            (["a", "a"], ["a", Any.string()], True),
+            (["a", "a"], [Any.int(), "a"], False),
+            # A literal and a matcher may compete for the same items
+            ([Any.instance_of(bool), 1], [1, True], True),
+            ([Any.instance_of(bool), 1], [True, 2], False),
+            ([1, Any.int()], [1, 1], True),
+            ([1, Any.int()], [1, "1"], False),
+        ),
+    )
+    def test_it_pairs_literals(self, items_to_match, container, matches):
+        matcher = AnyIterableWithItems(items_to_match)
+
+        assert (matcher == container) == matches
+        assert matcher.compile()(container) == matches
+
+    def test_it_only_compares_matchers_to_unpaired_items(self):
+        compared = []
+
+        class Spy:
+            def __eq__(self, other):
+                compared.append(other)
+                return True
+
+        matcher = AnyIterableWithItems([1, "a", Spy()])
+
+        assert matcher == [1, "a", 2]
+        assert compared == [2]
+
+    def test_it_stops_looking_once_there_are_enough_possibilities(self):
+        compared = []
+
+        class Spy:
+            def __eq__(self, other):
+                compared.append(other)
+                return True
+
+        matcher = AnyIterableWithItems([Spy(), Spy()])
+
+        assert matcher == range(100)
+        assert compared == [0, 1, 0, 1]
+
+    def test_it_handles_many_literals(self):
+        matcher = AnyIterableWithItems(list(range(10000)))
+
+        assert matcher == list(reversed(range(10001)))
+        assert matcher != list(range(9999))
+
+    @pytest.mark.parametrize(
+        "container",
+        ({2, 0, 1}, {0: 0, 1: 1, 2: 2}.keys(), {0: 0, 1: 1, 2: 2}.values()),
+    )
+    def test_it_matches_collections(self, container):
+        sub_matcher = Any.int().greater_than(1)
+        matcher = AnyIterableWithItems([0, sub_matcher, Any.int()])
+
+        assert matcher == container
+        assert matcher.compile()(container)
+        assert sub_matcher.matched_to == [2]
 
     def test_it_remaps_matched_items(self):
         # This matcher will match against loads of things during the initial
@@ -152,3 +460,15 @@ class TestAnyIterableWithItems:
         # It's not clear our algorithm is deterministic, but hopefully the first
         # match is the one we'll hit.
         assert sub_matcher.matched_to == [None]
+
+
+class TestAnyPair:
+    @pytest.mark.parametrize(
+        "other,matches",
+        ((("a", 1), True), (("a", 2), False), (("b", 1), False), (1, False)),
+    )
+    def test_it_matches_pairs(self, other, matches):
+        matcher = _AnyPair("a", Any.int().less_than(2))
+
+        assert (matcher == other) == matches
+        assert matcher.compile()(other) == matches
@@ -1,10 +1,10 @@
+import pickle
 from types import GeneratorType
 from unittest.mock import Mock, create_autospec
 
 import pytest
 
 from h_matchers import Any
-from h_matchers.exception import NoMatch
 from h_matchers.matcher.collection import (
     AnyCollection,
     AnyDict,
@@ -14,6 +14,7 @@ from h_matchers.matcher.collection import (
     AnySet,
     AnyTuple,
 )
+from h_matchers.matcher.core import MatchResult
 from tests.unit.data_types import DataTypes
 
 
@@ -28,6 +29,7 @@ class TestAnyCollection:
     def test_it_matches(self, item, _):
         assert AnyCollection() == item
         assert item == AnyCollection()
+        assert AnyCollection().compile()(item)
 
     @pytest.mark.parametrize(
         "item,_", DataTypes.parameters(exclude=DataTypes.Groups.ITERABLES)
@@ -35,6 +37,7 @@ class TestAnyCollection:
     def test_it_does_not_match(self, item, _):
         assert AnyCollection() != item
         assert item != AnyCollection()
+        assert not AnyCollection().compile()(item)
 
     # Other ---------------------------------------------------------------- #
 
@@ -42,20 +45,41 @@ class TestAnyCollection:
         matcher = TestableAnyCollection()
 
         other = {1, 2}
-        list_other = list(other)
 
         assert matcher == other
 
-        matcher._check_type.assert_called_once_with(matcher, list_other, other)
-        matcher._check_size.assert_called_once_with(matcher, list_other, other)
-        matcher._check_item_matcher.assert_called_once_with(matcher, list_other, other)
-        matcher._check_contains.assert_called_once_with(matcher, list_other, other)
+        matcher._check_type.assert_called_once_with(matcher, other, other)
+        matcher._check_size.assert_called_once_with(matcher, other, other)
+        matcher._check_item_matcher.assert_called_once_with(matcher, other, other)
+        matcher._check_contains.assert_called_once_with(matcher, other, other)
 
-    def test_it_respects_the_mixins_raising_NoMatch(self, TestableAnyCollection):
+    @pytest.mark.parametrize(
+        "other", ([1, 2], (1, 2), {1, 2}, {1: 2}.keys(), {1: 2}.items(), "12")
+    )
+    def test_it_does_not_copy_collections(self, TestableAnyCollection, other):
+        matcher = TestableAnyCollection()
+
+        assert matcher == other
+
+        copy = matcher._check_type.call_args[0][1]
+        assert copy is other
+
+    def test_it_copies_iterators(self, TestableAnyCollection):
+        matcher = TestableAnyCollection()
+        other = iter([1, 2])
+
+        assert matcher == other
+
+        matcher._check_type.assert_called_once_with(matcher, [1, 2], other)
+
+    def test_it_respects_the_mixins_not_matching(self, TestableAnyCollection):
         matcher = TestableAnyCollection()
-        matcher._check_type = Mock(side_effect=NoMatch())
+        matcher._check_type = Mock(return_value=MatchResult(False, "Wrong type"))
 
-        assert matcher != []
+        result = matcher.match([])
+
+        assert not result
+        assert result.reason == "Wrong type"
 
     @pytest.fixture
     def TestableAnyCollection(self):
@@ -96,6 +120,92 @@ class TestAnyCollection:
         assert matcher._items == [1, 2]
         assert matcher._exact_type == list
 
+    @pytest.mark.parametrize(
+        "matcher,other,reason",
+        (
+            (AnyCollection(), None, "Object is not iterable"),
+            (AnyCollection.of_type(list), (), "Wrong type"),
+            (AnyCollection.of_size(at_least=2), [1], "Too small"),
+            (AnyCollection.of_size(at_most=1), [1, 2], "Too big"),
+            (AnyCollection.comprised_of(1), [2], "Item does not match item matcher"),
+            (AnyCollection.containing([1]).only(), [1, 2], "Items of different size"),
+            (AnyCollection.containing([1]), [2], "Items not found"),
+            (AnyMapping(), [], "Mapping object needs items()"),
+        ),
+    )
+    def test_it_explains_mismatches(self, matcher, other, reason):
+        assert matcher.match(other).reason == reason
+
+    @pytest.mark.parametrize(
+        "matcher,reason",
+        (
+            (AnyCollection.of_size(at_most=3), "Too big"),
+            (AnyCollection.of_size(3), "Too big"),
+            (AnyCollection.containing([0, 1, 2]).only(), "Items of different size"),
+            (
+                AnyCollection.containing([0, 1, 2]).only().of_size(at_most=5),
+                "Items of different size",
+            ),
+        ),
+    )
+    def test_it_stops_reading_iterators_once_they_are_too_big(self, matcher, reason):
+        pulled = []
+
+        def numbers():
+            # An infinite stream
+            while True:
+                pulled.append(len(pulled))
+                yield pulled[-1]
+
+        assert matcher.match(numbers()).reason == reason
+        assert pulled == [0, 1, 2, 3]
+
+        pulled.clear()
+        assert not matcher.compile()(numbers())
+        assert pulled == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "matcher",
+        (
+            AnyCollection.of_size(at_most=3),
+            AnyCollection.containing([0, 1, 2]).only(),
+        ),
+    )
+    def test_it_still_matches_bounded_iterators(self, matcher):
+        assert matcher == iter(range(3))
+        assert matcher.compile()(iter(range(3)))
+
+    @pytest.mark.parametrize(
+        "matcher,reason",
+        (
+            (AnyCollection.of_size(at_most=1), "Too big"),
+            (AnyCollection.of_type(list), "Wrong type"),
+        ),
+    )
+    def test_it_checks_sized_objects_before_iterating(self, matcher, reason):
+        class SizedOnly:
+            def __len__(self):
+                return 2
+
+            def __iter__(self):  # pragma: no cover
+                raise AssertionError("We should not iterate")
+
+        assert matcher.match(SizedOnly()).reason == reason
+        assert not matcher.compile()(SizedOnly())
+
+    def test_it_matches_sized_iterables(self):
+        class SizedIterable:
+            def __len__(self):
+                return 2
+
+            def __iter__(self):
+                return iter([1, 2])
+
+        matcher = AnyCollection.of_size(2).containing([2])
+
+        assert matcher == SizedIterable()
+        assert matcher.compile()(SizedIterable())
+
     def test_it_matches_generators(self):
         matcher = AnyCollection.containing([2])
 
@@ -110,6 +220,68 @@ class TestAnyCollection:
         assert matcher != bad_gen()
 
 
+class TestAnyCollectionCompile:
+    MATCHERS = (
+        AnyCollection(),
+        AnyCollection.of_type(list),
+        AnyCollection.of_size(2),
+        AnyCollection.of_size(at_least=3),
+        AnyCollection.of_size(at_most=1),
+        AnyCollection.containing([1, 2]),
+        AnyCollection.containing([2, 1]).in_order(),
+        AnyCollection.containing([1, 2]).only(),
+        AnyCollection.containing({"a": 1}),
+        AnyCollection.comprised_of(Any.int()),
+        AnyCollection.comprised_of(Any.string()),
+        AnyMapping(),
+        AnyMapping.containing({"a": Any.int()}),
+    )
+
+    OTHERS = ([], [1], [1, 2], [2, 1], (1, 2), [1, 2, 3], {"a": 1}, {"a": "1"}, None)
+
+    @pytest.mark.parametrize("matcher", MATCHERS)
+    @pytest.mark.parametrize("other", OTHERS)
+    def test_it_compiles_to_the_same_result_as_comparison(self, matcher, other):
+        assert matcher.compile()(other) == (matcher == other)
+
+    def test_it_compiles_to_match_generators(self):
+        predicate = AnyCollection.containing([2]).only().compile()
+
+        assert predicate(item for item in [2])
+        assert not predicate(item for item in [2, 3])
+
+
+class TestAnyCollectionCache:
+    @pytest.mark.parametrize("method", ("in_order", "only"))
+    def test_reconfiguring_clears_cached_results(self, method):
+        matcher = AnyCollection.containing([1, 2]).cache_results()
+        assert matcher == (2, 1, 3)
+
+        getattr(matcher, method)()
+
+        assert matcher != (2, 1, 3)
+
+    def test_changing_an_item_clears_cached_results(self):
+        item = Any.int()
+        matcher = AnyCollection.containing([item]).cache_results()
+        assert matcher == (1,)
+
+        item.greater_than(5)
+
+        assert matcher != (1,)
+        assert matcher == (6,)
+
+
+class TestAnyCollectionPickle:
+    @pytest.mark.parametrize("matcher", TestAnyCollectionCompile.MATCHERS)
+    @pytest.mark.parametrize("other", TestAnyCollectionCompile.OTHERS)
+    def test_it_matches_the_same_when_unpickled(self, matcher, other):
+        unpickled = pickle.loads(pickle.dumps(matcher))
+
+        assert (unpickled == other) == (matcher == other)
+        assert str(unpickled) == str(matcher)
+
+
 class TestAnyMapping:
     def test_any_mapping_requires_items(self):
         class TestObject(list):
@@ -119,10 +291,12 @@ class TestAnyMapping:
         assert TestObject() == AnyMapping()
         # pylint: disable=use-implicit-booleaness-not-comparison
         assert {} == AnyMapping()
+        assert AnyMapping().compile()(TestObject())
 
     @pytest.mark.parametrize("non_matching", (tuple(), [], set()))
     def test_non_matching_items(self, non_matching):
         assert non_matching != AnyMapping()
+        assert not AnyMapping().compile()(non_matching)
 
 
 class TestTypeSpecificCollectionMatchers:
@@ -1,6 +1,9 @@
+import pytest
+
 from h_matchers.matcher.anything import AnyThing
 from h_matchers.matcher.collection import AnyMapping
 from h_matchers.matcher.combination import AllOf, AnyOf, NamedMatcher
+from h_matchers.matcher.number import AnyInt
 from h_matchers.matcher.strings import AnyString
 
 
@@ -21,6 +24,114 @@ class TestAnyOf:
         assert matcher == 2
         assert matcher != 10
 
+    @pytest.mark.parametrize(
+        "other,matches",
+        (
+            (None, True),
+            (1, True),
+            ("fish", True),
+            ("", True),
+            (2, False),
+            ([], False),
+        ),
+    )
+    def test_it_compiles(self, other, matches):
+        matcher = AnyOf([1, None, AnyString()])
+
+        assert matcher.compile()(other) == matches
+
+    @pytest.mark.parametrize(
+        "options,other,matches",
+        (
+            # Bools and ints compare equal in Python, and so they do here
+            ([1], True, True),
+            ([True], 1, True),
+            ([0], False, True),
+            ([1.0], 1, True),
+            ([2], True, False),
+            (["1"], 1, False),
+            ([b"a"], "a", False),
+            # Unhashable options are still found
+            ([[1, 2]], [1, 2], True),
+            ([{"a": 1}], 1, False),
+        ),
+    )
+    def test_it_matches_like_in(self, options, other, matches):
+        matcher = AnyOf(options)
+
+        assert (matcher == other) == matches
+        assert matcher.compile()(other) == matches
+        assert (other in options) == matches
+
+    @pytest.mark.parametrize(
+        "options", ([1, "a", None, 2.5], [1, "a", AnyString()], [[1, 2], "a"])
+    )
+    def test_match_many(self, options):
+        class EqualsOne:
+            def __eq__(self, other):
+                return other == 1
+
+        items = [1, True, "a", "b", None, 2.5, [1, 2], EqualsOne(), object()]
+        matcher = AnyOf(options)
+
+        assert matcher.match_many(items) == [matcher == item for item in items]
+
+    def test_it_compares_other_types_to_every_option(self):
+        class EqualsOne:
+            def __eq__(self, other):
+                return other == 1
+
+        matcher = AnyOf(["a", 1, None])
+
+        assert matcher == EqualsOne()
+        assert matcher.compile()(EqualsOne())
+
+    def test_it_compares_literals_to_options_with_custom_equality(self):
+        class EqualsOne:
+            def __eq__(self, other):
+                return other == 1
+
+        matcher = AnyOf(["a", EqualsOne()])
+
+        assert matcher == 1
+        assert matcher.compile()(1)
+        assert matcher != 2
+
+    def test_it_handles_subclasses_of_literal_types(self):
+        class CaseInsensitive(str):
+            def __eq__(self, other):
+                return self.lower() == other.lower()
+
+            __hash__ = str.__hash__
+
+        assert AnyOf(["FISH"]) == CaseInsensitive("fish")
+        assert AnyOf(["FISH"]).compile()(CaseInsensitive("fish"))
+
+    def test_it_handles_many_options(self):
+        matcher = AnyOf(range(10000))
+
+        assert matcher == 9999
+        assert matcher != 10000
+        assert matcher.compile()(9999)
+
+    def test_stateless_applies_to_options(self):
+        option = AnyString()
+        matcher = AnyOf([None, option]).stateless()
+
+        assert matcher == "string"
+
+        assert not option.matched_to
+
+    def test_changing_an_option_clears_cached_results(self):
+        inner = AnyInt()
+        matcher = AnyOf([inner, "x"]).cache_results()
+        assert matcher == 1
+
+        inner.greater_than(5)
+
+        assert matcher != 1
+        assert matcher == 6
+
 
 class TestAllOf:
     def test_requires_all_things_to_match(self):
@@ -36,6 +147,10 @@ class TestAllOf:
         assert matcher != "foo"
         assert matcher != "bar"
 
+        predicate = matcher.compile()
+        assert predicate("foo bar")
+        assert not predicate("foo")
+
     def test_it_can_use_generators(self):
         matcher = AllOf(iter(range(1, 2)))
 
@@ -43,6 +158,14 @@ class TestAllOf:
         assert matcher == 1
         assert matcher != 10
 
+    def test_stateless_applies_to_options(self):
+        option = AnyString()
+        matcher = AllOf([option]).stateless()
+
+        assert matcher == "string"
+
+        assert not option.matched_to
+
     def test_it_can_match_objects_with_equals(self):
         class NeverMatches:
             def __eq__(self, other):  # pragma: no cover
@@ -60,6 +183,16 @@ class TestNamedMatcher:
         # pylint: disable=use-implicit-booleaness-not-comparison
         assert matcher == {}
         assert matcher != []
+        assert matcher.compile()({})
+        assert not matcher.compile()([])
+
+    def test_stateless_applies_to_the_wrapped_matcher(self):
+        wrapped = AnyString()
+        matcher = NamedMatcher("string", wrapped).stateless()
+
+        assert matcher == "string"
+
+        assert not wrapped.matched_to
 
     def test_it_stringifies_as_we_specify(self):
         matcher = NamedMatcher("string", AnyMapping())
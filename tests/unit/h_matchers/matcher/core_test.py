@@ -1,8 +1,32 @@
+import copy
+import pickle
+from functools import partial
 from unittest.mock import create_autospec, sentinel
 
 import pytest
 
-from h_matchers.matcher.core import Matcher
+from h_matchers.matcher.cache import CacheInfo
+from h_matchers.matcher.core import (
+    MATCH,
+    Matcher,
+    MatchResult,
+    Sentinel,
+    compile_value,
+    freeze_value,
+    match_value,
+)
+from h_matchers.matcher.history import History
+
+SENTINEL = Sentinel(__name__, "SENTINEL")
+
+
+class Parent(Matcher):
+    """A matcher with other matchers in its configuration."""
+
+    def __init__(self, children, test_function):
+        self.children = children
+
+        super().__init__("parent", test_function)
 
 
 class TestMatcher:
@@ -40,6 +64,101 @@ class TestMatcher:
             # pylint: disable=pointless-statement
             matcher == sentinel.other
 
+    def test_it_compares_using_match_results(self, function):
+        function.return_value = MatchResult(False, "reason")
+        matcher = Matcher(sentinel.description, function)
+
+        assert matcher != sentinel.other
+
+        assert matcher.match(sentinel.other).reason == "reason"
+
+    def test_it_raises_with_the_reason_if_assert_on_comparison(self, no_way):
+        matcher = Matcher("description", no_way)
+        matcher.assert_on_comparison = True
+
+        with pytest.raises(AssertionError, match="'other' does not match description"):
+            # pylint: disable=pointless-statement
+            matcher == "other"
+
+    @pytest.mark.parametrize(
+        "fixture,matches,reason",
+        (
+            ("true_dat", True, None),
+            ("no_way", False, "'other' does not match description"),
+            ("raise_assertion_error", False, "reason"),
+        ),
+    )
+    def test_match(self, request, fixture, matches, reason):
+        function = request.getfixturevalue(fixture)
+        matcher = Matcher("description", function)
+
+        result = matcher.match("other")
+
+        assert result.matched is matches
+        assert result.reason == reason
+        assert matcher.matched_to == (["other"] if matches else [])
+
+    def test_assert_equal_to(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat)
+
+        assert matcher.assert_equal_to(sentinel.other) is True
+        assert not matcher.matched_to
+
+    def test_assert_equal_to_raises_with_the_reason(self, raise_assertion_error):
+        matcher = Matcher(sentinel.description, raise_assertion_error)
+
+        with pytest.raises(AssertionError, match="reason"):
+            matcher.assert_equal_to(sentinel.other)
+
+    @pytest.mark.parametrize(
+        "result,expected", ((True, True), ("truthy", True), (0, False))
+    )
+    def test_it_compiles_to_a_predicate(self, function, result, expected):
+        function.return_value = result
+
+        predicate = Matcher(sentinel.description, function).compile()
+
+        assert predicate(sentinel.other) is expected
+        function.assert_called_once_with(sentinel.other)
+
+    def test_it_compiles_AssertionError_to_False(self, raise_assertion_error):
+        predicate = Matcher(sentinel.description, raise_assertion_error).compile()
+
+        assert predicate(sentinel.other) is False
+
+    def test_match_many(self, function):
+        function.side_effect = lambda other: other > 1
+        matcher = Matcher(sentinel.description, function)
+
+        assert matcher.match_many(iter([1, 2, 3])) == [False, True, True]
+        assert matcher.match_many([1, 2, 3], indices=True) == [1, 2]
+        assert not matcher.matched_to
+
+    def test_filter(self, function):
+        function.side_effect = lambda other: other > 1
+        items = iter([1, 2, 3])
+
+        matches = Matcher(sentinel.description, function).filter(items)
+
+        assert next(matches) == 2
+        assert list(items) == [3]
+
+    def test_first_match(self, function):
+        function.side_effect = lambda other: other > 1
+        items = iter([1, 2, 3])
+        matcher = Matcher(sentinel.description, function)
+
+        assert matcher.first_match(items) == 2
+        assert list(items) == [3]
+        assert matcher.first_match([], default=sentinel.default) == sentinel.default
+
+    def test_compiled_predicates_do_not_record_history(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat)
+
+        assert matcher.compile()(sentinel.other)
+
+        assert not matcher.matched_to
+
     def test_it_grabs_last_matched(self, function):
         function.side_effect = (True, False)
         matcher = Matcher(sentinel.description, function)
@@ -54,9 +173,363 @@ class TestMatcher:
         assert matcher.last_matched() == "match"
         assert matcher.matched_to == ["match"]
 
+    def test_it_only_keeps_the_last_match_by_default(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat)
+
+        assert matcher == "first"
+        assert matcher == "second"
+
+        assert matcher.matched_to == ["second"]
+
+    def test_it_applies_the_history_policy(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat)
+        matcher.keep_history(History.last(2))
+
+        for item in range(5):
+            assert matcher == item
+
+        assert matcher.matched_to == [3, 4]
+        assert matcher.last_matched() == 4
+
+    def test_it_can_keep_no_history(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat).keep_history(History.off())
+
+        assert matcher == "match"
+
+        assert not matcher.matched_to
+        assert matcher.last_matched(...) is ...
+
+    def test_keep_history_resets_the_history(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat)
+        assert matcher == "match"
+
+        matcher.keep_history(History.unbounded())
+
+        assert not matcher.matched_to
+
+    def test_it_uses_the_class_history_policy_as_the_default(
+        self, true_dat, monkeypatch
+    ):
+        monkeypatch.setattr(Matcher, "history", History.unbounded())
+        matcher = Matcher(sentinel.description, true_dat)
+
+        for item in range(5):
+            assert matcher == item
+
+        assert matcher.matched_to == [0, 1, 2, 3, 4]
+
+    def test_matched_to_can_be_set(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat)
+        assert matcher == "match"
+
+        matcher.matched_to = ["other"]
+
+        assert matcher.last_matched() == "other"
+
+    def test_stateless_turns_off_history(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat).stateless()
+
+        assert matcher == "match"
+
+        assert not matcher.matched_to
+
+    def test_stateless_applies_to_child_matchers(self, true_dat):
+        child = Matcher(sentinel.description, true_dat)
+
+        class Parent(Matcher):
+            def _child_matchers(self):
+                return [child]
+
+        Parent(sentinel.description, true_dat).stateless()
+
+        assert child == "match"
+        assert not child.matched_to
+
+    def test_it_can_cache_results(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat).cache_results(size=2)
+
+        assert matcher == "match"
+        assert matcher == "match"
+
+        true_dat.assert_called_once_with("match")
+        assert matcher.cache_info() == CacheInfo(1, 1, 2, 1)
+        # Cached results still count as matches
+        assert matcher.matched_to == ["match"]
+
+    def test_it_uses_cached_results_for_assert_equal_to(self, raise_assertion_error):
+        matcher = Matcher(sentinel.description, raise_assertion_error).cache_results()
+
+        for _ in range(2):
+            with pytest.raises(AssertionError):
+                matcher.assert_equal_to("other")
+
+        raise_assertion_error.assert_called_once_with("other")
+
+    def test_it_does_not_cache_values_which_can_change(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat).cache_results()
+
+        assert matcher == ["match"]
+        assert matcher == ["match"]
+
+        assert true_dat.call_count == 2
+        assert matcher.cache_info() == CacheInfo(0, 0, 128, 0)
+
+    def test_it_does_not_cache_results_by_default(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat)
+
+        assert matcher == "match"
+        assert matcher == "match"
+
+        assert true_dat.call_count == 2
+        assert matcher.cache_info() == CacheInfo(0, 0, 0, 0)
+
+    def test_cache_results_can_turn_caching_off(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat).cache_results()
+
+        matcher.cache_results(0)
+
+        assert matcher == "match"
+        assert matcher.cache_info() == CacheInfo(0, 0, 0, 0)
+
+    @pytest.mark.parametrize("size,eviction", ((-1, "lru"), (1, "random")))
+    def test_cache_results_raises_for_bad_settings(self, true_dat, size, eviction):
+        with pytest.raises(ValueError):
+            Matcher(sentinel.description, true_dat).cache_results(size, eviction)
+
+    def test_reconfiguring_clears_the_cache(self, true_dat):
+        matcher = Matcher(sentinel.description, true_dat).cache_results()
+        assert matcher == "match"
+
+        matcher._on_reconfigure()  # pylint: disable=protected-access
+
+        assert matcher == "match"
+        assert true_dat.call_count == 2
+
+    def test_changing_a_matcher_inside_clears_the_cache(self, true_dat):
+        child = Matcher("child", true_dat)
+        matcher = Parent({"key": [child]}, true_dat).cache_results()
+        assert matcher == "match"
+
+        child._on_reconfigure()  # pylint: disable=protected-access
+
+        assert matcher == "match"
+        assert true_dat.call_count == 2
+
+    def test_changing_another_matcher_keeps_the_cache(self, true_dat):
+        matcher = Parent([Matcher("child", true_dat)], true_dat).cache_results()
+        assert matcher == "match"
+
+        Matcher("other", true_dat)._on_reconfigure()  # pylint: disable=protected-access
+
+        assert matcher == "match"
+        assert true_dat.call_count == 1
+        assert matcher.cache_info().hits == 1
+
+    def test_interned_matchers_inside_are_not_checked_for_changes(self, true_dat):
+        child = Matcher("child", bool).interned()
+        matcher = Parent([child], true_dat).cache_results()
+
+        # pylint: disable=protected-access
+        assert matcher._changeable_matchers() == [matcher]
+
+    def test_it_finds_matchers_inside_its_configuration(self):
+        children = [Matcher(f"child {number}", bool) for number in range(5)]
+        # Only interned matchers can go in sets
+        children[2] = children[2].interned()
+
+        matcher = Parent(
+            [children[0], (children[1], {children[2]}), {"key": children[3]}],
+            children[4],
+        )
+
+        # pylint: disable=protected-access
+        assert matcher._child_matchers() == children
+
+    def test_it_can_be_pickled_with_a_cache(self):
+        matcher = Matcher("description", bool).cache_results(size=2, eviction="fifo")
+        assert matcher == "match"
+
+        matcher = pickle.loads(pickle.dumps(matcher))
+
+        assert matcher.cache_info() == CacheInfo(0, 0, 2, 0)
+
+    @pytest.mark.parametrize(
+        "value",
+        (
+            None,
+            "string",
+            [1, "a"],
+            (1, ["a"]),
+            {"a": [1]},
+            {1, 2},
+            frozenset((1, 2)),
+            partial(max, 1, key=abs),
+            str.lower,
+            sentinel.value,
+        ),
+    )
+    def test_matchers_configured_the_same_have_the_same_fingerprint(self, value):
+        def make_matcher():
+            matcher = Matcher("description", bool)
+            matcher.value = copy.deepcopy(value)
+            return matcher
+
+        matcher, other = make_matcher(), make_matcher()
+
+        assert matcher.fingerprint() == other.fingerprint()
+
+    @pytest.mark.parametrize(
+        "value,other",
+        (
+            ("string", "other"),
+            (1, True),
+            ([1], (1,)),
+            ({"a": 1}, {"a": 2}),
+            ({1}, frozenset((1,))),
+            (partial(max, 1), partial(max, 2)),
+        ),
+    )
+    def test_matchers_configured_differently_have_different_fingerprints(
+        self, value, other
+    ):
+        matcher = Matcher("description", bool)
+        matcher.value = value
+        different = Matcher("description", bool)
+        different.value = other
+
+        assert matcher.fingerprint() != different.fingerprint()
+
+    def test_fingerprints_include_the_type(self):
+        class Other(Matcher):
+            pass
+
+        assert (
+            Matcher("description", bool).fingerprint()
+            != Other("description", bool).fingerprint()
+        )
+
+    def test_fingerprints_include_nested_matchers(self):
+        child = Matcher("child", bool)
+        matcher = Matcher("description", child.match)
+
+        assert (
+            matcher.fingerprint() == Matcher("description", child.match).fingerprint()
+        )
+        assert (
+            matcher.fingerprint()
+            != Matcher("description", Matcher("other", bool).match).fingerprint()
+        )
+
+    def test_fingerprints_compare_unhashable_values_by_identity(self):
+        value = bytearray(b"value")
+        matcher = Matcher("description", bool)
+        matcher.value = value
+        same = Matcher("description", bool)
+        same.value = value
+        copied = Matcher("description", bool)
+        copied.value = bytearray(b"value")
+
+        assert matcher.fingerprint() == same.fingerprint()
+        assert matcher.fingerprint() != copied.fingerprint()
+
+    def test_fingerprints_ignore_history_and_caches(self):
+        matcher = Matcher("description", bool)
+        fingerprint = matcher.fingerprint()
+
+        assert matcher == "match"
+        matcher.keep_history(History.unbounded()).cache_results()
+
+        assert matcher.fingerprint() == fingerprint
+
+    def test_matchers_which_can_change_cant_be_hashed(self):
+        with pytest.raises(TypeError):
+            hash(Matcher("description", bool))
+
+    def test_interned_matchers_can_be_used_in_sets(self):
+        matcher = Matcher("description", bool).interned()
+
+        assert hash(matcher) == hash(matcher.fingerprint())
+        assert matcher in {matcher}
+
+    def test_changing_a_matcher_changes_its_fingerprint(self):
+        matcher = Matcher("description", bool)
+        fingerprint = matcher.fingerprint()
+
+        matcher.value = "changed"
+
+        assert matcher.fingerprint() != fingerprint
+
+    def test_interned_returns_a_shared_copy(self):
+        matcher = Matcher("description", bool)
+
+        interned = matcher.interned()
+
+        assert interned is not matcher
+        assert interned is Matcher("description", bool).interned()
+        assert interned is interned.interned()
+        assert interned == "match"
+        assert not interned.matched_to
+
+    def test_interned_matchers_compile_once(self):
+        interned = Matcher("description", bool).interned()
+
+        predicate = interned.compile()
+
+        assert interned.compile() is predicate
+        assert predicate("match")
+
+    def test_interned_matchers_are_stateless_already(self):
+        interned = Matcher("description", bool).interned()
+
+        assert interned.stateless() is interned
+
+    @pytest.mark.parametrize(
+        "change",
+        (
+            lambda matcher: matcher.keep_history(History.unbounded()),
+            lambda matcher: matcher.cache_results(),
+            # pylint: disable=protected-access
+            lambda matcher: matcher._on_reconfigure(),
+        ),
+    )
+    def test_interned_matchers_cant_be_changed(self, change):
+        interned = Matcher("description", bool).interned()
+
+        with pytest.raises(TypeError):
+            change(interned)
+
+    def test_interned_matchers_can_be_pickled(self):
+        interned = Matcher("description", bool).interned()
+        interned.compile()
+
+        unpickled = pickle.loads(pickle.dumps(interned))
+
+        assert unpickled == "match"
+        assert unpickled.fingerprint() == interned.fingerprint()
+
+    def test_it_can_be_pickled_without_its_history(self):
+        matcher = Matcher("description", bool).keep_history(History.last(2))
+        assert matcher == "match"
+
+        matcher = pickle.loads(pickle.dumps(matcher))
+
+        assert not matcher.matched_to
+        for item in range(1, 4):
+            assert matcher == item
+        assert matcher.matched_to == [2, 3]
+        assert str(matcher) == "description"
+
+    def test_it_can_be_pickled_with_weak_history(self):
+        matcher = Matcher("description", bool).keep_history(History.weak())
+        assert matcher == ValueError()
+
+        matcher = pickle.loads(pickle.dumps(matcher))
+
+        assert not matcher.matched_to
+
     @pytest.fixture
     def raise_assertion_error(self, function):
-        function.side_effect = AssertionError
+        function.side_effect = AssertionError("reason")
         return function
 
     @pytest.fixture
@@ -74,3 +547,161 @@ class TestMatcher:
         function = create_autospec(lambda other: True)  # pragma: no cover
 
         return function
+
+
+class TestMatchResult:
+    def test_it_is_truthy_when_matched(self):
+        assert MATCH
+        assert MATCH.reason is None
+        assert str(MATCH) == "Matched"
+
+    def test_it_is_falsy_when_not_matched(self):
+        result = MatchResult(False, "reason")
+
+        assert not result
+        assert result.reason == "reason"
+        assert str(result) == "reason"
+        assert repr(result) == "<MatchResult reason>"
+
+    def test_it_formats_the_reason_lazily(self):
+        class Argument:
+            formatted = 0
+
+            def __format__(self, format_spec):
+                self.formatted += 1
+                return "arg"
+
+        arg = Argument()
+        result = MatchResult(False, "reason {}", arg)
+
+        assert not arg.formatted
+        assert result.reason == "reason arg"
+        assert result.reason == "reason arg"
+        assert arg.formatted == 1
+
+    def test_it_does_not_format_a_reason_without_arguments(self):
+        assert MatchResult(False, "{not a template}").reason == "{not a template}"
+
+
+class TestMatchValue:
+    def test_it_matches_with_matchers(self):
+        matcher = Matcher(sentinel.description, lambda other: other == "match")
+
+        assert match_value(matcher, "match")
+        assert not match_value(matcher, "other")
+        assert matcher.matched_to == ["match"]
+
+    def test_it_compares_plain_values(self):
+        assert match_value(1, 1) is MATCH
+
+        result = match_value(1, 2)
+        assert not result
+        assert result.reason == "2 != 1"
+
+
+class TestSentinel:
+    def test_it_is_the_same_object_when_unpickled(self):
+        assert pickle.loads(pickle.dumps(SENTINEL)) is SENTINEL
+
+    def test_repr(self):
+        assert repr(SENTINEL) == "<SENTINEL>"
+
+
+class TestCompileValue:
+    def test_it_compiles_matchers(self):
+        matcher = Matcher(sentinel.description, lambda other: other == "match")
+
+        predicate = compile_value(matcher)
+
+        assert predicate("match")
+        assert not predicate("other")
+
+    def test_it_compares_plain_values(self):
+        predicate = compile_value(1)
+
+        assert predicate(1)
+        assert predicate(1.0)
+        assert not predicate(2)
+
+
+class TestFreezeValue:
+    @pytest.mark.parametrize(
+        "value,change",
+        (
+            ([1], lambda value: value.append(2)),
+            ([1], lambda value: value.__setitem__(0, 2)),
+            ([1], lambda value: value.sort()),
+            ({"a": 1}, lambda value: value.update(a=2)),
+            ({"a": 1}, lambda value: value.pop("a")),
+            ({1}, lambda value: value.add(2)),
+            ({1}, lambda value: value.discard(1)),
+            ({1}, lambda value: value.update({2})),
+        ),
+    )
+    def test_it_makes_containers_read_only(self, value, change):
+        frozen = freeze_value(value)
+
+        assert frozen == value
+        assert isinstance(frozen, type(value))
+        with pytest.raises(TypeError):
+            change(frozen)
+
+    def test_it_freezes_matchers_inside_containers(self):
+        matcher = Matcher("description", bool)
+        other = Matcher("other", bool)
+
+        frozen = freeze_value(([matcher], {"a": [other]}, frozenset((1,))))
+
+        assert frozen[2] == frozenset((1,))
+        with pytest.raises(TypeError):
+            frozen[1]["a"].append(1)
+        for item in (matcher, other):
+            with pytest.raises(TypeError):
+                item.cache_results()
+
+    def test_freezing_a_matcher_again_does_nothing(self):
+        matcher = freeze_value(Matcher("description", bool))
+        fingerprint = matcher.fingerprint()
+
+        assert freeze_value(matcher) is matcher
+        assert matcher.fingerprint() is fingerprint
+
+    def test_it_freezes_the_owners_of_methods(self):
+        matcher = Matcher("description", bool)
+
+        freeze_value(matcher.match)
+
+        with pytest.raises(TypeError):
+            matcher.cache_results()
+
+    def test_it_freezes_partials(self):
+        matcher = Matcher("description", bool)
+
+        frozen = freeze_value(partial(max, [1], key=matcher.match))
+
+        assert frozen() == 1
+        with pytest.raises(TypeError):
+            frozen.args[0].append(2)
+        with pytest.raises(TypeError):
+            matcher.cache_results()
+
+    @pytest.mark.parametrize("value", (1, "string", bytearray(b"value"), (1, 2)))
+    def test_it_leaves_other_values_alone(self, value):
+        assert freeze_value(value) == value
+
+    @pytest.mark.parametrize("value", ([1, [2]], {"a": {1}}, {1, 2}))
+    def test_frozen_values_can_be_pickled_and_frozen_again(self, value):
+        frozen = freeze_value(value)
+
+        assert freeze_value(frozen) == value
+        assert pickle.loads(pickle.dumps(frozen)) == value
+        assert type(pickle.loads(pickle.dumps(frozen))) is type(frozen)
+
+    def test_freezing_does_not_change_fingerprints(self):
+        value = [{"a": {1}}]
+        matcher = Matcher("description", bool)
+        matcher.value = value
+        frozen = Matcher("description", bool)
+        frozen.value = freeze_value(value)
+
+        assert frozen.fingerprint() == matcher.fingerprint()
@@ -0,0 +1,66 @@
+import gc
+
+import pytest
+
+from h_matchers.matcher.history import History
+
+
+class Weakable:
+    pass
+
+
+class TestHistory:
+    def test_last_keeps_the_last_items(self):
+        store = History.last(2)()
+
+        for item in range(5):
+            store.append(item)
+
+        assert list(store) == [3, 4]
+
+    def test_unbounded_keeps_everything(self):
+        store = History.unbounded()()
+
+        for item in range(5):
+            store.append(item)
+
+        assert list(store) == [0, 1, 2, 3, 4]
+
+    def test_off_keeps_nothing(self):
+        store = History.off()()
+
+        store.append("item")
+
+        assert not list(store)
+
+    def test_weak_keeps_live_items(self):
+        store = History.weak(2)()
+        items = [Weakable() for _ in range(3)]
+
+        for item in items:
+            store.append(item)
+
+        assert list(store) == items[1:]
+
+    def test_weak_drops_collected_items(self):
+        store = History.weak()()
+
+        store.append(Weakable())
+        gc.collect()
+
+        assert not list(store)
+
+    def test_weak_ignores_items_which_cannot_be_weakly_referenced(self):
+        store = History.weak()()
+
+        store.append("string")
+
+        assert not list(store)
+
+    @pytest.mark.parametrize("policy", (History.last, History.weak))
+    def test_it_requires_a_positive_size(self, policy):
+        with pytest.raises(ValueError):
+            policy(0)
+
+    def test_policies_have_a_nice_repr(self):
+        assert repr(History.last(3)) == "<History last 3>"
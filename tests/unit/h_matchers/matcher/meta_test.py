@@ -11,6 +11,7 @@ class TestAnyFunction:
     def test_it_matches(self, item, _):
         assert AnyFunction() == item
         assert item == AnyFunction()
+        assert AnyFunction().compile()(item)
 
     @pytest.mark.parametrize(
         "item,_", DataTypes.parameters(exclude=DataTypes.Groups.FUNCTIONS)
@@ -18,6 +19,7 @@ class TestAnyFunction:
     def test_it_does_not_match(self, item, _):
         assert AnyFunction() != item
         assert item != AnyFunction()
+        assert not AnyFunction().compile()(item)
 
 
 class TestAnyCallable:
@@ -27,6 +29,7 @@ class TestAnyCallable:
     def test_it_matches(self, item, _):
         assert AnyCallable() == item
         assert item == AnyCallable()
+        assert AnyCallable().compile()(item)
 
     @pytest.mark.parametrize(
         "item,_", DataTypes.parameters(exclude=DataTypes.Groups.CALLABLES)
@@ -34,3 +37,4 @@ class TestAnyCallable:
     def test_it_does_not_match(self, item, _):
         assert AnyCallable() != item
         assert item != AnyCallable()
+        assert not AnyCallable().compile()(item)
@@ -18,6 +18,7 @@ class TestAnyNumber:
     def test_it_matches(self, item, _):
         assert AnyNumber() == item
         assert item == AnyNumber()
+        assert AnyNumber().compile()(item)
 
     @pytest.mark.parametrize(
         "item,_", DataTypes.parameters(exclude=DataTypes.Groups.NUMERIC)
@@ -25,6 +26,7 @@ class TestAnyNumber:
     def test_it_does_not_match(self, item, _):
         assert AnyNumber() != item
         assert item != AnyNumber()
+        assert not AnyNumber().compile()(item)
 
     @pytest.mark.parametrize(
         "value,matcher,should_match",
@@ -40,6 +42,14 @@ class TestAnyNumber:
     def test_comparators(self, value, matcher, should_match):
         assert bool(value == matcher) == should_match
         assert bool(matcher == value) == should_match
+        assert matcher.compile()(value) == should_match
+
+    @pytest.mark.parametrize(
+        "value,reason",
+        ((True, "Not a boolean"), ("1", "'1' is not a number"), (1, "!= 1")),
+    )
+    def test_it_explains_mismatches(self, value, reason):
+        assert AnyNumber().not_equal_to(1).match(value).reason == reason
 
     @pytest.mark.parametrize(
         "matcher,string",
@@ -63,6 +73,7 @@ class TestAnyReal:
     def test_it_matches(self, item, _):
         assert AnyReal() == item
         assert item == AnyReal()
+        assert AnyReal().compile()(item)
 
     @pytest.mark.parametrize(
         "item,_", DataTypes.parameters(exclude=DataTypes.Groups.REALS)
@@ -70,6 +81,7 @@ class TestAnyReal:
     def test_it_does_not_match(self, item, _):
         assert AnyReal() != item
         assert item != AnyReal()
+        assert not AnyReal().compile()(item)
 
     @pytest.mark.parametrize(
         "value,matcher,should_match",
@@ -113,6 +125,17 @@ class TestAnyReal:
     def test_comparators(self, value, matcher, should_match):
         assert bool(value == matcher) == should_match
         assert bool(matcher == value) == should_match
+        assert matcher.compile()(value) == should_match
+
+
+class TestAnyRealCache:
+    def test_adding_conditions_clears_cached_results(self):
+        matcher = AnyReal().cache_results()
+        assert matcher == 1
+
+        matcher.greater_than(1)
+
+        assert matcher != 1
 
 
 class TestAnyInt:
@@ -122,6 +145,7 @@ class TestAnyInt:
     def test_it_matches(self, item, _):
         assert AnyInt() == item
         assert item == AnyInt()
+        assert AnyInt().compile()(item)
 
     @pytest.mark.parametrize(
         "item,_", DataTypes.parameters(exclude=DataTypes.Groups.INTS)
@@ -129,6 +153,7 @@ class TestAnyInt:
     def test_it_does_not_match(self, item, _):
         assert AnyInt() != item
         assert item != AnyInt()
+        assert not AnyInt().compile()(item)
 
 
 class TestAnyFloat:
@@ -138,6 +163,7 @@ class TestAnyFloat:
     def test_it_matches(self, item, _):
         assert AnyFloat() == item
         assert item == AnyFloat()
+        assert AnyFloat().compile()(item)
 
     @pytest.mark.parametrize(
         "item,_", DataTypes.parameters(exclude=DataTypes.Groups.FLOATS)
@@ -145,6 +171,7 @@ class TestAnyFloat:
     def test_it_does_not_match(self, item, _):
         assert AnyFloat() != item
         assert item != AnyFloat()
+        assert not AnyFloat().compile()(item)
 
 
 class TestAnyComplex:
@@ -154,6 +181,7 @@ class TestAnyComplex:
     def test_it_matches(self, item, _):
         assert AnyComplex() == item
         assert item == AnyComplex()
+        assert AnyComplex().compile()(item)
 
     @pytest.mark.parametrize(
         "item,_", DataTypes.parameters(exclude=DataTypes.Groups.COMPLEX)
@@ -161,6 +189,7 @@ class TestAnyComplex:
     def test_it_does_not_match(self, item, _):
         assert AnyComplex() != item
         assert item != AnyComplex()
+        assert not AnyComplex().compile()(item)
 
 
 class TestAnyDecimal:
@@ -170,6 +199,7 @@ class TestAnyDecimal:
     def test_it_matches(self, item, _):
         assert AnyDecimal() == item
         assert item == AnyDecimal()
+        assert AnyDecimal().compile()(item)
 
     @pytest.mark.parametrize(
         "item,_", DataTypes.parameters(exclude=DataTypes.Groups.DECIMAL)
@@ -177,3 +207,4 @@ class TestAnyDecimal:
     def test_it_does_not_match(self, item, _):
         assert AnyDecimal() != item
         assert item != AnyDecimal()
+        assert not AnyDecimal().compile()(item)
@@ -28,6 +28,8 @@ class TestAnyObject:
     def test_it_matches_types_correctly(self, type_, instance, matches):
         matcher = AnyObject(type_=type_)
 
+        assert matcher.compile()(instance) == matches
+
         if matches:
             assert instance == matcher
             assert matcher.assert_equal_to(instance)
@@ -51,6 +53,8 @@ class TestAnyObject:
         other = ValueObject(one="one", two="two")
         matcher = AnyObject.with_attrs(attributes)
 
+        assert matcher.compile()(other) == matches
+
         if matches:
             assert other == matcher
             assert matcher.assert_equal_to(other)
@@ -100,6 +104,24 @@ class TestAnyObject:
         assert NotValueObject("one", "two") != matcher
         assert ValueObject("bad", "two") != matcher
 
+    def test_fluent_methods_clear_cached_results(self):
+        matcher = AnyObject().cache_results()
+        assert matcher == ValueObject("one", "two")
+
+        matcher.with_attrs({"one": "other"})
+
+        assert matcher != ValueObject("one", "two")
+
+    def test_changing_an_attribute_matcher_clears_cached_results(self):
+        attribute = Any.int()
+        matcher = AnyObject.with_attrs({"one": attribute}).cache_results()
+        assert matcher == ValueObject(1, "two")
+
+        attribute.greater_than(5)
+
+        assert matcher != ValueObject(1, "two")
+        assert matcher == ValueObject(6, "two")
+
     @pytest.mark.parametrize(
         "type_,attributes,string",
         (
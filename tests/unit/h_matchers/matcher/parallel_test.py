@@ -0,0 +1,103 @@
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from h_matchers import Any
+from h_matchers.matcher import parallel
+from h_matchers.matcher.parallel import _match_chunk, _start_worker
+
+
+class TestMatchManyParallel:
+    @pytest.mark.parametrize("indices", (False, True))
+    def test_it_matches_like_match_many(self, matcher, items, indices):
+        results = matcher.match_many_parallel(
+            iter(items), indices=indices, max_workers=2, chunk_size=7
+        )
+
+        assert results == matcher.match_many(items, indices=indices)
+
+    @pytest.mark.parametrize(
+        "kwargs", ({"chunk_size": 0}, {"chunk_size": -1}, {"max_workers": 0})
+    )
+    def test_it_rejects_bad_options(self, matcher, items, kwargs):
+        with pytest.raises(ValueError):
+            matcher.match_many_parallel(items, **kwargs)
+
+    def test_it_matches_small_inputs_in_this_process(self, matcher, items, patch):
+        ProcessPoolExecutor = patch("h_matchers.matcher.parallel.ProcessPoolExecutor")
+
+        results = matcher.match_many_parallel(items, chunk_size=len(items) + 1)
+
+        assert results == matcher.match_many(items)
+        ProcessPoolExecutor.assert_not_called()
+
+    def test_it_starts_the_workers_with_the_matcher(self, matcher, items, patch):
+        ProcessPoolExecutor = patch("h_matchers.matcher.parallel.ProcessPoolExecutor")
+
+        matcher.match_many_parallel(items, max_workers=3, chunk_size=10)
+
+        ProcessPoolExecutor.assert_called_once_with(
+            3, initializer=_start_worker, initargs=(pickle.dumps(matcher),)
+        )
+
+    def test_it_defaults_to_a_worker_per_cpu(self, matcher, items, patch):
+        ProcessPoolExecutor = patch("h_matchers.matcher.parallel.ProcessPoolExecutor")
+        patch("h_matchers.matcher.parallel.os.cpu_count").return_value = 3
+
+        matcher.match_many_parallel(items, chunk_size=10)
+
+        ProcessPoolExecutor.assert_called_once_with(
+            3,
+            initializer=_start_worker,
+            initargs=(pickle.dumps(matcher),),
+        )
+
+    def test_it_limits_the_chunks_in_flight(self, matcher, patch):
+        executor = patch(
+            "h_matchers.matcher.parallel.ProcessPoolExecutor"
+        ).return_value.__enter__.return_value
+        in_flight = []
+
+        def submit(_function, chunk, indices, offset):
+            in_flight.append(offset)
+            future = Mock()
+            future.result.side_effect = lambda: (
+                in_flight.remove(offset) or _match_chunk(chunk, indices, offset)
+            )
+            assert len(in_flight) <= 2
+            return future
+
+        executor.submit.side_effect = submit
+        _start_worker(pickle.dumps(matcher))
+
+        results = matcher.match_many_parallel(
+            iter(range(100)), indices=True, max_workers=1, chunk_size=10
+        )
+
+        assert results == list(range(100))
+        assert executor.submit.call_count == 10
+
+    def test_workers_match_chunks(self, matcher):
+        _start_worker(pickle.dumps(matcher))
+
+        assert _match_chunk([1, "a", 2], indices=False, offset=0) == [
+            True,
+            False,
+            True,
+        ]
+        assert _match_chunk([1, "a", 2], indices=True, offset=10) == [10, 12]
+
+    @pytest.fixture
+    def matcher(self):
+        return Any.int()
+
+    @pytest.fixture
+    def items(self):
+        return [1, "a", 2, None, 3.5] * 5
+
+    @pytest.fixture(autouse=True)
+    def reset_worker(self):
+        yield
+
+        parallel._worker_matcher = None  # pylint: disable=protected-access
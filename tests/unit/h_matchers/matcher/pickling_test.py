@@ -0,0 +1,98 @@
+import pickle
+import re
+from collections import namedtuple
+
+import pytest
+from requests import Request
+
+from h_matchers import Any
+from h_matchers.matcher.anything import AnyThing
+from h_matchers.matcher.combination import AllOf, AnyOf, NamedMatcher
+from h_matchers.matcher.history import History
+from h_matchers.matcher.meta import AnyCallable, AnyFunction
+from h_matchers.matcher.number import AnyInt, AnyReal
+from h_matchers.matcher.object import AnyObject
+from h_matchers.matcher.strings import AnyString, AnyStringContaining, AnyStringMatching
+from h_matchers.matcher.web.request import AnyRequest
+from h_matchers.matcher.web.url import AnyURL
+from h_matchers.matcher.web.url.core import AnyURLCore
+
+ValueObject = namedtuple("ValueObject", ["one", "two"])
+
+
+class TestPickling:
+    @pytest.mark.parametrize(
+        "matcher,others",
+        (
+            (AnyThing(), (1, None)),
+            (AnyFunction(), (len, int)),
+            (AnyCallable(), (int, 1)),
+            (AnyString(), ("string", 1)),
+            (AnyStringContaining("needle"), ("a needle", "haystack")),
+            (AnyStringMatching("a.*b", flags=re.IGNORECASE), ("A to B", "b to a")),
+            (AnyOf([None, 1, AnyString()]), ("string", 2)),
+            (AllOf([AnyString(), "foo"]), ("foo", "bar")),
+            (NamedMatcher("string", AnyString()), ("string", 1)),
+            (AnyReal().not_equal_to(4), (3, 4)),
+            (AnyReal().falsy(), (0, 1)),
+            (AnyReal().truthy(), (1, 0)),
+            (AnyReal() < 2, (1, 2)),
+            (AnyReal() <= 2, (2, 3)),
+            (AnyReal() > 2, (3, 2)),
+            (AnyReal() >= 2, (2, 1)),
+            (AnyReal().multiple_of(3), (6, 4)),
+            (AnyReal().odd(), (3, 4)),
+            (AnyReal().approximately(4), (4.0001, 4.3)),
+            (AnyInt().greater_than(1).even(), (4, 3)),
+            (
+                AnyObject.of_type(ValueObject).with_attrs({"one": Any.string()}),
+                (ValueObject("one", "two"), ValueObject(1, "two")),
+            ),
+            (
+                AnyURLCore(
+                    scheme="http",
+                    host="example.com",
+                    query={"a": "1"},
+                    fragment=Any.string(),
+                ),
+                (
+                    "http://example.com/path?a=1#fragment",
+                    "http://example.com/path?a=2#fragment",
+                ),
+            ),
+            (
+                AnyURL.with_scheme("https")
+                .with_host()
+                .with_path("path")
+                .containing_query({"a": "1"}),
+                ("https://example.com/path?a=1&b=2", "https:///path?a=1"),
+            ),
+            (
+                AnyRequest.with_method("POST")
+                .with_url(Any.url(host="example.com"))
+                .containing_headers({"A": Any.string()}),
+                (
+                    Request("POST", "http://example.com", headers={"A": "a"}),
+                    Request("POST", "http://example.com"),
+                ),
+            ),
+        ),
+    )
+    def test_it_matches_the_same_when_unpickled(self, matcher, others):
+        unpickled = pickle.loads(pickle.dumps(matcher))
+
+        for other in others:
+            assert (unpickled == other) == (matcher == other)
+            assert unpickled.compile()(other) == (matcher == other)
+        assert str(unpickled) == str(matcher)
+
+    def test_it_leaves_out_the_history_and_compiled_state(self):
+        matcher = AnyURL(host="example.com").keep_history(History.last(2))
+        pickled = pickle.dumps(matcher)
+
+        assert matcher == "http://example.com"
+        assert matcher.compile()("http://example.com")
+        assert matcher.match_many(["http://example.com"])
+
+        assert pickle.dumps(matcher) == pickled
+        assert not pickle.loads(pickled).matched_to
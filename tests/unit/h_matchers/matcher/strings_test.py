@@ -13,6 +13,7 @@ class TestAnyString:
     def test_it_matches(self, item, _):
         assert AnyString() == item
         assert item == AnyString()
+        assert AnyString().compile()(item)
 
     @pytest.mark.parametrize(
         "item,_", DataTypes.parameters(exclude=DataTypes.Groups.STRINGS)
@@ -20,6 +21,12 @@ class TestAnyString:
     def test_it_does_not_match(self, item, _):
         assert AnyString() != item
         assert item != AnyString()
+        assert not AnyString().compile()(item)
+
+    def test_match_many(self):
+        items = [item for item, _ in DataTypes.parameters()]
+
+        assert AnyString().match_many(items) == [AnyString() == item for item in items]
 
     @pytest.mark.parametrize("attribute", ["containing", "matching"])
     def test_it_has_expected_attributes(self, attribute):
@@ -32,12 +39,14 @@ class TestAnyStringContaining:
         assert matcher == "a long string with a specific string in it"
 
         assert "a long string with a specific string in it" == matcher
+        assert matcher.compile()("a long string with a specific string in it")
 
     @pytest.mark.parametrize("item,_", DataTypes.parameters())
     def test_it_does_not_match(self, item, _):
         matcher = AnyStringContaining("specific string")
         assert matcher != item
         assert item != matcher
+        assert not matcher.compile()(item)
 
 
 class TestAnyStringMatching:
@@ -47,6 +56,7 @@ class TestAnyStringMatching:
 
         assert "a to b" == matcher
         assert "A to B" != matcher
+        assert matcher.compile()("a to b") is True
 
     def test_it_matches_with_flags(self):
         matcher = AnyStringMatching("a.*b", flags=re.IGNORECASE)
@@ -59,3 +69,4 @@ class TestAnyStringMatching:
         matcher = AnyStringMatching("a.*b")
         assert matcher != item
         assert item != matcher
+        assert matcher.compile()(item) is False
@@ -0,0 +1,332 @@
+from unittest.mock import Mock, create_autospec, sentinel
+
+import pytest
+from pyramid.request import Request as PyramidRequest
+from requests import PreparedRequest, Request
+from webob import Request as WebObRequest
+
+from h_matchers.matcher.collection import AnyMapping
+from h_matchers.matcher.web.adapters import (
+    ADAPTERS,
+    AdapterRegistry,
+    _EnvironHeaders,
+    _EnvironRequest,
+    _HeadersWithoutHost,
+)
+from h_matchers.matcher.web.request import AnyRequest
+
+
+class FakeRequest:
+    method = "GET"
+    url = "http://example.com"
+    headers = {"A": "a"}
+
+
+class FakeRequestSubclass(FakeRequest):
+    pass
+
+
+class CountingDict(dict):
+    """A dict which counts how often it's iterated over."""
+
+    iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return super().__iter__()
+
+
+FAKE_REQUEST = f"{__name__}.FakeRequest"
+
+
+class TestAdapterRegistry:
+    def test_it_finds_adapters_by_class_name(self, registry, adapter):
+        registry.register(FAKE_REQUEST, adapter)
+
+        request = FakeRequest()
+
+        assert registry.adapt(request) == adapter.return_value
+        adapter.assert_called_once_with(request)
+
+    def test_it_finds_adapters_for_subclasses(self, registry, adapter):
+        registry.register(FAKE_REQUEST, adapter)
+
+        assert registry.adapt(FakeRequestSubclass()) == adapter.return_value
+
+    def test_it_imports_adapters_when_first_used(self, registry, patch):
+        import_module = patch("h_matchers.matcher.web.adapters.import_module")
+        import_module.return_value.Adapter.return_value = sentinel.adapted
+
+        registry.register(FAKE_REQUEST, "some.module:Adapter")
+        import_module.assert_not_called()
+
+        assert registry.adapt(FakeRequest()) == sentinel.adapted
+        assert registry.adapt(FakeRequestSubclass()) == sentinel.adapted
+        import_module.assert_called_once_with("some.module")
+
+    def test_it_caches_the_adapter_for_each_type(self, registry, adapter):
+        registry.register(FAKE_REQUEST, adapter)
+        registry.adapt(FakeRequest())
+
+        # pylint: disable=protected-access
+        assert registry._by_type == {FakeRequest: adapter}
+
+    def test_registering_an_adapter_clears_the_cache(self, registry, adapter):
+        registry.register(FAKE_REQUEST, Mock())
+        registry.adapt(FakeRequestSubclass())
+
+        registry.register(f"{__name__}.FakeRequestSubclass", adapter)
+
+        assert registry.adapt(FakeRequestSubclass()) == adapter.return_value
+
+    def test_it_adapts_wsgi_environs(self, registry):
+        environ = {"REQUEST_METHOD": "GET", "wsgi.url_scheme": "http"}
+
+        assert registry.adapt(environ).method == "GET"
+
+    @pytest.mark.parametrize("other", ("http://example.com", {"a": "b"}, None))
+    def test_it_returns_None_for_other_objects(self, registry, other):
+        assert registry.adapt(other) is None
+
+    def test_it_lists_the_types_it_can_import(self, registry):
+        registry.register("requests.models.Request", _EnvironRequest)
+        registry.register("not_a_module.Request", _EnvironRequest)
+        registry.register("requests.models.NotAClass", _EnvironRequest)
+
+        assert registry.types() == (Request,)
+
+    @pytest.fixture
+    def registry(self):
+        return AdapterRegistry()
+
+    @pytest.fixture
+    def adapter(self):
+        return create_autospec(lambda request: None)
+
+
+class TestDefaultAdapters:
+    @pytest.mark.parametrize("request_class", (Request, PreparedRequest))
+    def test_requests_are_used_as_is(self, request_class):
+        request = request_class()
+
+        assert ADAPTERS.adapt(request) is request
+
+    @pytest.mark.parametrize("request_class", (PyramidRequest, WebObRequest))
+    def test_webob_requests_hide_the_host(self, request_class):
+        request = request_class.blank(
+            "http://example.com/path", headers={"A": "a"}, method="POST"
+        )
+
+        adapted = ADAPTERS.adapt(request)
+
+        assert adapted.method == "POST"
+        assert adapted.url == "http://example.com/path"
+        assert dict(adapted.headers) == {"A": "a"}
+
+    def test_it_provides_supported_types_for_compatibility(self):
+        assert set(AnyRequest.SUPPORTED_TYPES) == set(ADAPTERS.types())
+        assert PyramidRequest not in AnyRequest.SUPPORTED_TYPES
+        assert Request in AnyRequest.SUPPORTED_TYPES
+
+    def test_any_request_can_have_adapters_registered(self, patch):
+        register = patch("h_matchers.matcher.web.request.ADAPTERS.register")
+
+        AnyRequest.register_adapter("some.Request", sentinel.adapter)
+
+        register.assert_called_once_with("some.Request", sentinel.adapter)
+
+    def test_any_request_uses_registered_adapters(self):
+        # pylint: disable=protected-access
+        request = FakeRequest()
+        matcher = AnyRequest("GET", "http://example.com", {"A": "a"})
+        assert request != matcher
+
+        ADAPTERS.register(FAKE_REQUEST, lambda request: request)
+        try:
+            assert request == matcher
+            assert matcher.compile()(request)
+        finally:
+            del ADAPTERS._adapters[FAKE_REQUEST]
+            ADAPTERS._by_type.clear()
+
+
+class TestEnvironRequest:
+    URLS = (
+        ({"HTTP_HOST": "example.com:8080"}, "http://example.com:8080"),
+        ({"HTTP_HOST": "example.com:80"}, "http://example.com"),
+        (
+            {"wsgi.url_scheme": "https", "HTTP_HOST": "example.com:443"},
+            "https://example.com",
+        ),
+        ({"HTTP_HOST": "[::1]"}, "http://[::1]"),
+        ({"HTTP_HOST": "[::1]:8080"}, "http://[::1]:8080"),
+        ({"SERVER_NAME": "example.com", "SERVER_PORT": "80"}, "http://example.com"),
+        (
+            {"SERVER_NAME": "example.com", "SERVER_PORT": "443"},
+            "http://example.com:443",
+        ),
+        (
+            {
+                "wsgi.url_scheme": "https",
+                "SERVER_NAME": "example.com",
+                "SERVER_PORT": "443",
+            },
+            "https://example.com",
+        ),
+        (
+            {
+                "HTTP_HOST": "example.com",
+                "SCRIPT_NAME": "/app",
+                "PATH_INFO": "/a path",
+                "QUERY_STRING": "a=1",
+            },
+            "http://example.com/app/a%20path?a=1",
+        ),
+        (
+            # WSGI gives us UTF-8 bytes decoded as latin-1
+            {
+                "HTTP_HOST": "example.com",
+                "PATH_INFO": "/café".encode().decode("latin-1"),
+            },
+            "http://example.com/caf%C3%A9",
+        ),
+        (
+            {"HTTP_HOST": "example.com", "PATH_INFO": "/a;b=c/@d:e/~f"},
+            "http://example.com/a;b=c/@d:e/~f",
+        ),
+    )
+
+    @pytest.mark.parametrize("environ,url", URLS)
+    def test_it_rebuilds_the_url(self, environ, url):
+        environ = dict({"REQUEST_METHOD": "GET", "wsgi.url_scheme": "http"}, **environ)
+
+        assert _EnvironRequest(environ).url == url
+
+    @pytest.mark.parametrize("environ", [environ for environ, _ in URLS])
+    @pytest.mark.parametrize("request_class", (PyramidRequest, WebObRequest))
+    def test_it_rebuilds_the_url_like_webob(self, environ, request_class):
+        environ = dict(
+            {
+                "REQUEST_METHOD": "GET",
+                "wsgi.url_scheme": "http",
+                "SERVER_NAME": "localhost",
+                "SERVER_PORT": "80",
+                "PATH_INFO": "",
+            },
+            **environ,
+        )
+
+        assert _EnvironRequest(environ).url == request_class(environ).url
+
+    def test_it_includes_the_host_in_the_raw_headers(self):
+        headers = _EnvironHeaders({"HTTP_HOST": "example.com", "HTTP_A": "a"})
+
+        assert len(headers) == 2
+        assert headers["Host"] == "example.com"
+
+    def test_it_only_counts_the_headers_once(self):
+        environ = CountingDict({"HTTP_HOST": "example.com", "HTTP_A": "a"})
+        headers = _EnvironHeaders(environ)
+
+        assert len(headers) == len(headers) == 2
+        assert environ.iterations == 1
+
+    def test_it_reads_headers(self):
+        headers = _EnvironRequest(
+            {
+                "HTTP_HOST": "example.com",
+                "HTTP_X_CUSTOM_HEADER": "custom",
+                "CONTENT_TYPE": "text/plain",
+                "PATH_INFO": "/",
+            }
+        ).headers
+
+        assert dict(headers) == {
+            "X-Custom-Header": "custom",
+            "Content-Type": "text/plain",
+        }
+        assert headers["x-custom-header"] == "custom"
+        assert "content-type" in headers
+        assert "Host" not in headers
+        assert 1 not in headers
+        with pytest.raises(KeyError):
+            _ = headers[1]
+        assert repr(headers) == (
+            "{'X-Custom-Header': 'custom', 'Content-Type': 'text/plain'}"
+        )
+
+    def test_it_matches_environs(self):
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "wsgi.url_scheme": "https",
+            "HTTP_HOST": "example.com",
+            "PATH_INFO": "/api",
+            "HTTP_ACCEPT": "application/json",
+        }
+
+        assert environ == AnyRequest(
+            "POST", "https://example.com/api", {"Accept": "application/json"}
+        )
+
+    def test_it_explains_mismatches(self):
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "wsgi.url_scheme": "http",
+            "HTTP_HOST": "example.com",
+            "HTTP_A": "a",
+        }
+
+        result = AnyRequest.with_headers({"B": "b"}).match(environ)
+
+        assert result.reason.startswith("Headers {'A': 'a'} != ")
+
+    def test_it_stringifies(self):
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "wsgi.url_scheme": "http",
+            "HTTP_HOST": "example.com",
+        }
+
+        assert repr(_EnvironRequest(environ)) == "<WSGI environ GET http://example.com>"
+
+
+class TestHeadersWithoutHost:
+    def test_it_hides_the_host(self, view):
+        assert dict(view) == {"A": "a", "B": "b"}
+        assert len(view) == 2
+        assert "A" in view
+        assert "Host" not in view
+        assert "host" not in view
+        with pytest.raises(KeyError):
+            _ = view["Host"]
+
+    def test_it_only_counts_the_headers_once(self):
+        headers = CountingDict({"host": "example.com", "A": "a"})
+        view = _HeadersWithoutHost(headers)
+
+        for _ in range(3):
+            assert view == AnyMapping.containing({"A": "a"}).only()
+
+        assert len(view) == 1
+        # Once to read the items for each comparison, and once to count them
+        assert headers.iterations == 4
+
+    def test_it_does_not_copy_the_headers(self, headers, view):
+        headers["C"] = "c"
+
+        assert view["C"] == "c"
+
+    def test_it_matches_mappings(self, view):
+        assert view == AnyMapping.containing({"A": "a", "B": "b"}).only()
+        assert view != AnyMapping.containing({"Host": "example.com"})
+
+    def test_it_stringifies_like_a_dict(self, view):
+        assert repr(view) == "{'A': 'a', 'B': 'b'}"
+
+    @pytest.fixture
+    def headers(self):
+        return {"host": "example.com", "A": "a", "B": "b"}
+
+    @pytest.fixture
+    def view(self, headers):
+        return _HeadersWithoutHost(headers)
@@ -8,7 +8,7 @@ from requests import PreparedRequest, Request
 
 from h_matchers import Any
 from h_matchers.matcher.collection import AnyMapping
-from h_matchers.matcher.web.request import AnyRequest
+from h_matchers.matcher.web.request import AnyRequest, _RequestIndex
 
 # We have a lot of fixtures going on in this file
 # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -41,6 +41,7 @@ class TestAnyRequest:
         )
 
         assert (request == matcher) is matches
+        assert matcher.compile()(request) is matches
 
     @pytest.mark.parametrize(
         "request_url,matcher_url,matches",
@@ -66,6 +67,7 @@ class TestAnyRequest:
         )
 
         assert (request == matcher) is matches
+        assert matcher.compile()(request) is matches
 
     @pytest.mark.parametrize(
         "header_matcher,matches",
@@ -87,6 +89,7 @@ class TestAnyRequest:
             matcher = AnyRequest(headers=header_matcher)
 
         assert (request == matcher) is matches
+        assert matcher.compile()(request) is matches
 
     @pytest.mark.parametrize(
         "header_matcher,matches",
@@ -107,6 +110,49 @@ class TestAnyRequest:
         matcher = AnyRequest.containing_headers(header_matcher)
 
         assert (request == matcher) is matches
+        assert matcher.compile()(request) is matches
+
+    @pytest.mark.parametrize("method", ("with_headers", "containing_headers"))
+    def test_it_looks_up_headers_rather_than_searching(
+        self, make_request, method, patch
+    ):
+        mapping_comparison = patch(
+            "h_matchers.matcher.collection.containment"
+            ".AnyMappingWithItems._mapping_comparison"
+        )
+        request = make_request(headers={"A": "a", "B": "b"})
+        matcher = getattr(AnyRequest, method)({"A": "a", "B": Any.string()})
+
+        assert request == matcher
+        assert request != getattr(AnyRequest, method)({"A": "b"})
+        mapping_comparison.assert_not_called()
+
+    def test_it_explains_unsupported_types(self):
+        result = AnyRequest().match("http://example.com")
+
+        assert "Unknown request type" in result.reason
+
+    def test_it_explains_mismatches(self, make_request):
+        request = make_request(method="GET")
+
+        result = AnyRequest(method="POST").match(request)
+
+        assert result.reason == "Method 'GET' != 'POST'"
+
+    def test_it_ignores_the_host_header_for_pyramid(self):
+        request = RequestBuilder.build(
+            PyramidRequest,
+            {"url": "http://example.com/", "method": "GET", "headers": {"A": "a"}},
+        )
+
+        matcher = AnyRequest.with_headers({"A": "a"})
+
+        assert request == matcher
+        assert matcher.compile()(request)
+
+    @pytest.mark.parametrize("other", ("http://example.com", {"a": "b"}))
+    def test_it_compiles_to_reject_unsupported_types(self, other):
+        assert not AnyRequest().compile()(other)
 
     @pytest.fixture
     def make_request(self, request_class, default_params):
@@ -127,6 +173,7 @@ class TestAnyRequest:
             param(PreparedRequest, id="requests.PreparedRequest"),
             param(PyramidRequest, id="pyramid.request.Request"),
             param(DummyRequest, id="pyramid.testing.DummyRequest"),
+            param(dict, id="WSGI environ"),
         )
     )
     def request_class(self, request):
@@ -138,6 +185,109 @@ class TestAnyRequest:
         return request.param
 
 
+class TestAnyRequestMatchAll:
+    def test_it_matches_requests_one_to_one(self):
+        captured = [
+            Request("GET", "http://example.com/a"),
+            Request("GET", "http://example.com/a"),
+        ]
+
+        result = AnyRequest.match_all(
+            [AnyRequest("GET", "http://example.com/a")] * 3, captured
+        )
+
+        assert not result
+        assert [pair[1] for pair in result.pairs] == captured
+        assert len(result.unmatched_expected) == 1
+        assert not result.unmatched_captured
+
+    def test_it_finds_the_best_assignment(self):
+        captured = [
+            Request("GET", "http://example.com/specific"),
+            Request("GET", "http://example.com/other"),
+        ]
+        expected = [
+            AnyRequest("GET", Any.url(host="example.com")),
+            AnyRequest("GET", "http://example.com/specific"),
+        ]
+
+        result = AnyRequest.match_all(expected, captured)
+
+        assert result
+        assert result.pairs == [(expected[0], captured[1]), (expected[1], captured[0])]
+        assert str(result) == "Matched 2 of 2 expected requests"
+
+    def test_it_reports_unmatched_requests_on_both_sides(self):
+        result = AnyRequest.match_all(
+            [AnyRequest("GET", "http://example.com"), AnyRequest("POST")],
+            [Request("DELETE", "http://example.com"), "not a request"],
+        )
+
+        assert str(result) == (
+            "Matched 0 of 2 expected requests\n"
+            "Expected but not captured:\n"
+            "  * <AnyRequest method:GET url:* any URL matching {'scheme': 'http', "
+            "'host': 'example.com', 'path': <Path '/'>, 'params': None, "
+            "'fragment': None, 'query': None} *>\n"
+            "  * <AnyRequest method:POST url:* any URL *>\n"
+            "Captured but not expected:\n"
+            "  * DELETE http://example.com\n"
+            "  * 'not a request'"
+        )
+
+    def test_it_accepts_any_matcher(self):
+        captured = ["not a request", Request("GET", "http://example.com")]
+
+        matcher = Any.string()
+
+        result = AnyRequest.match_all([matcher], captured)
+
+        assert result.pairs == [(matcher, "not a request")]
+
+    def test_assert_all_made(self):
+        captured = [
+            Request("GET", "http://example.com"),
+            Request("GET", "http://a.com"),
+        ]
+        expected = [AnyRequest("GET", "http://example.com")]
+
+        assert AnyRequest.assert_all_made(expected, captured)
+
+        with pytest.raises(AssertionError, match="Captured but not expected"):
+            AnyRequest.assert_all_made(expected, captured, exact=True)
+
+        with pytest.raises(AssertionError, match="Expected but not captured"):
+            AnyRequest.assert_all_made(expected * 2, captured)
+
+    @pytest.mark.parametrize(
+        "expected,positions",
+        (
+            (AnyRequest("GET", "http://a.com"), [0]),
+            (AnyRequest("POST", "http://A.com/path"), [1]),
+            (AnyRequest("GET"), [0, 2]),
+            (AnyRequest(url="http://a.com/path"), [0, 1]),
+            (AnyRequest(url=Any.url(scheme=None, host=None, path="a")), [3]),
+            (AnyRequest(url=Any.url(host=Any.string())), [0, 1, 2, 3, 4]),
+            (AnyRequest(method=Any.string()), [0, 1, 2, 3, 4]),
+            (AnyRequest(url=None), [0, 1, 2, 3, 4]),
+            (AnyRequest("PUT", "http://a.com"), ()),
+            (Any.string(), [0, 1, 2, 3, 4]),
+        ),
+    )
+    def test_it_groups_captured_requests(self, expected, positions):
+        index = _RequestIndex(
+            [
+                Request("get", "http://a.com"),
+                Request("POST", "http://a.com/b"),
+                Request("GET", "http://b.com"),
+                Request("HEAD", "a"),
+                "not a request",
+            ]
+        )
+
+        assert list(index.candidates(expected)) == list(positions)
+
+
 class RequestBuilder:
     @classmethod
     def build(cls, class_, params):
@@ -148,9 +298,12 @@ class RequestBuilder:
         if issubclass(class_, PreparedRequest):
             return Request(**params).prepare()
 
-        # Pyramid objects
+        # Pyramid objects and raw WSGI environs
         environ = cls._make_environ(**params)
 
+        if class_ is dict:
+            return environ
+
         if issubclass(class_, PyramidRequest):
             return PyramidRequest(environ)
 
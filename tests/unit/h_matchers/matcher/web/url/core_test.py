@@ -1,7 +1,12 @@
+import pickle
+from unittest.mock import Mock
+
 import pytest
 
 from h_matchers import Any
 from h_matchers.matcher.collection import AnyMapping
+from h_matchers.matcher.combination import AnyOf
+from h_matchers.matcher.core import Matcher
 from h_matchers.matcher.web.url.core import AnyURLCore, MultiValueQuery
 
 # We do lots of goofy comparisons on purpose
@@ -137,15 +142,18 @@ class TestAnyURL:
     )
     def test_generic_matching(self, part, value):
         matcher = AnyURLCore(**{part: value})
+        predicate = matcher.compile()
 
         for comparison_part, url in self.PART_MODIFIED_URLS.items():
             if comparison_part == part:
                 # The URLs are different here and this is the part we specified
                 # so we should spot the difference
                 assert url != matcher
+                assert not predicate(url)
             else:
                 # These are different too, but these should all match
                 assert url == matcher
+                assert predicate(url)
 
     @pytest.mark.parametrize(
         "_,query",
@@ -192,6 +200,40 @@ class TestAnyURL:
         assert "boo" in repr(matcher)
         assert "boo" in str(matcher)
 
+    @pytest.mark.parametrize(
+        "change",
+        (
+            lambda parts: parts.__setitem__("scheme", "https"),
+            lambda parts: parts.update(scheme="https"),
+        ),
+    )
+    def test_it_notices_changes_to_parts(self, change):
+        matcher = AnyURLCore(scheme="http")
+        assert matcher == "http://example.com"
+
+        change(matcher.parts)
+
+        assert matcher != "http://example.com"
+        assert matcher == "https://example.com"
+
+    def test_it_only_parses_the_query_if_needed(self):
+        # pylint: disable=protected-access
+        AnyURLCore.clear_parse_cache()
+
+        assert AnyURLCore(host="example.com") == "http://example.com?a=1"
+        assert not AnyURLCore._parse_query_cached.cache_info().misses
+
+        assert AnyURLCore(query={"a": "1"}) == "http://example.com?a=1"
+        assert AnyURLCore._parse_query_cached.cache_info().misses == 1
+
+    def test_it_checks_plain_values_before_matchers(self):
+        test_function = Mock(return_value=True)
+
+        matcher = AnyURLCore(scheme=Matcher("spy", test_function), fragment="a")
+
+        assert matcher != "http://example.com/path#b"
+        test_function.assert_not_called()
+
     def test_it_raises_with_assert_on_comparison_enabled(self):
         # Normally you'd turn this on for the whole class, but it has totally
         # non-local effects and explodes the tests
@@ -201,13 +243,225 @@ class TestAnyURL:
         with pytest.raises(AssertionError):
             _ = "abc" == matcher
 
+    def test_it_explains_mismatches(self):
+        result = AnyURLCore(fragment="a").match("http://example.com#b")
+
+        assert result.reason == "Other 'fragment' b != a"
+
     @pytest.mark.parametrize("other", (None, 123, True))
     def test_it_refuses_to_compare_to_non_strings(self, other):
         assert AnyURLCore() != other
+        assert not AnyURLCore().compile()(other)
+
+    @pytest.mark.parametrize("matcher", ["STRING_OR_NONE", "MAP_OR_NONE"])
+    def test_shared_defaults_retain_nothing(self, matcher):
+        assert AnyURLCore() == "http://example.com/path;params?a=1#fragment"
+
+        assert not getattr(AnyURLCore, matcher).matched_to
 
     def test_stringification_default(self):
         assert str(AnyURLCore()) == "* any URL *"
 
+    @pytest.mark.parametrize("matcher", ["STRING_OR_NONE", "MAP_OR_NONE"])
+    def test_shared_defaults_are_the_same_when_unpickled(self, matcher):
+        shared = getattr(AnyURLCore, matcher)
+
+        assert pickle.loads(pickle.dumps(shared)) is shared
+
+    def test_unpickled_matchers_keep_the_shared_defaults(self):
+        matcher = pickle.loads(pickle.dumps(AnyURLCore(host="example.com")))
+
+        assert matcher.parts["params"] is AnyURLCore.STRING_OR_NONE
+        assert matcher.parts["query"] is AnyURLCore.MAP_OR_NONE
+
+    def test_it_can_be_changed_after_unpickling(self):
+        matcher = pickle.loads(pickle.dumps(AnyURLCore(host="example.com")))
+        assert matcher == "http://example.com"
+
+        matcher.parts["host"] = "other.com"
+
+        assert matcher != "http://example.com"
+        assert matcher == "http://other.com"
+
+    def test_parts_can_be_replaced_with_a_plain_dict(self):
+        matcher = AnyURLCore(scheme="http", host="example.com")
+        assert matcher == "http://example.com"
+
+        matcher.parts = dict(matcher.parts, scheme="https")
+
+        assert matcher != "http://example.com"
+        assert matcher == "https://example.com"
+        matcher.parts["host"] = "other.com"
+        assert matcher == "https://other.com"
+
+    @pytest.mark.parametrize(
+        "change,matches_http,matches_https",
+        (
+            (lambda parts: parts.__setitem__("scheme", "https"), False, True),
+            (lambda parts: parts.update(scheme="https"), False, True),
+            (lambda parts: parts.__ior__({"scheme": "https"}), False, True),
+            (lambda parts: parts.__delitem__("scheme"), True, True),
+            (lambda parts: parts.pop("scheme"), True, True),
+            (lambda parts: parts.clear(), True, True),
+            (
+                lambda parts: (
+                    parts.pop("scheme"),
+                    parts.setdefault("scheme", "https"),
+                ),
+                False,
+                True,
+            ),
+        ),
+    )
+    def test_changing_the_parts_in_any_way_is_noticed(
+        self, change, matches_http, matches_https
+    ):
+        matcher = AnyURLCore(scheme="http", host="example.com")
+        assert matcher == "http://example.com"
+        assert matcher.compile()("http://example.com")
+
+        change(matcher.parts)
+
+        for url, matches in (
+            ("http://example.com", matches_http),
+            ("https://example.com", matches_https),
+        ):
+            assert (matcher == url) is matches
+            assert matcher.compile()(url) is matches
+
+    def test_removing_the_last_part_is_noticed(self):
+        # The query is set last
+        matcher = AnyURLCore(host="example.com", query={"a": "1"})
+        assert matcher != "http://example.com?a=2"
+
+        matcher.parts.popitem()
+
+        assert matcher == "http://example.com?a=2"
+
+    def test_changing_the_parts_with_or_equals_keeps_them(self):
+        matcher = AnyURLCore(scheme="http")
+        parts = matcher.parts
+
+        matcher.parts |= {"scheme": "https"}
+
+        assert matcher.parts is parts
+        assert matcher == "https://example.com"
+
+    def test_interned_matchers_parts_cant_be_replaced(self):
+        matcher = AnyURLCore(host="example.com").interned()
+
+        with pytest.raises(TypeError):
+            matcher.parts = {}
+
+    def test_interned_matchers_parts_cant_be_changed(self):
+        matcher = AnyURLCore(host="example.com", query={"a": Any.string()})
+        assert matcher == "http://example.com?a=1"  # Works out the constraints
+
+        interned = matcher.interned()
+
+        with pytest.raises(TypeError):
+            interned.parts["host"] = "other.com"
+        with pytest.raises(TypeError):
+            interned.parts["query"].only()
+        assert interned == "http://example.com?a=1"
+        assert interned != "http://other.com?a=1"
+        assert interned.fingerprint() == matcher.fingerprint()
+
+    def test_interning_leaves_the_shared_defaults_alone(self):
+        interned = AnyURLCore(host="example.com").interned()
+
+        assert interned.parts["scheme"] is AnyURLCore.STRING_OR_NONE
+        # pylint: disable=protected-access
+        assert not AnyURLCore.STRING_OR_NONE._frozen
+
+
+class TestAnyURLStringFilter:
+    # pylint: disable=protected-access
+
+    @pytest.mark.parametrize(
+        "matcher,url,reason",
+        (
+            (
+                AnyURLCore(scheme="https"),
+                "http://example.com",
+                "Other URL 'http://example.com' doesn't start with 'https:'",
+            ),
+            (
+                AnyURLCore(host="example.com"),
+                "http://example.org",
+                "Other URL 'http://example.org' doesn't contain host 'example.com'",
+            ),
+            (
+                AnyURLCore(query={"a": "1"}),
+                "http://example.com?b=1",
+                "Other URL 'http://example.com?b=1' doesn't contain 'a='",
+            ),
+            (
+                AnyURLCore(query={"a": "1"}),
+                "http://example.com?a",
+                "Other URL 'http://example.com?a' doesn't contain 'a='",
+            ),
+        ),
+    )
+    def test_it_rejects_strings_without_parsing_them(self, matcher, url, reason):
+        AnyURLCore.clear_parse_cache()
+
+        assert matcher.match(url).reason == reason
+        assert not matcher.compile()(url)
+        assert not AnyURLCore.parse_cache_info().urls.misses
+
+    @pytest.mark.parametrize(
+        "matcher,url",
+        (
+            (AnyURLCore(scheme="HTTP", host="EXAMPLE.com"), "Http://Example.COM"),
+            (AnyURLCore(scheme="http"), " \x00http://example.com"),
+            (AnyURLCore(scheme="http"), "ht\ttp://example.com"),
+            (AnyURLCore(host="example.com"), "http://exam\nple.com"),
+            (AnyURLCore(host="example.com"), "example.com/path"),
+            (AnyURLCore(query={"a": "1"}), "http://example.com?%61=1"),
+            (AnyURLCore(query={"a b": "1"}), "http://example.com?a+b=1"),
+            (AnyURLCore(query={"ü": "1"}), "http://example.com?%C3%BC=1"),
+            (AnyURLCore(query={"ü": "1"}), "http://example.com?ü=1"),
+            (AnyURLCore(query={"a": "1", "b": "2"}), "http://example.com?b=2&a=1"),
+            (AnyURLCore(query="a=1&a=2"), "http://example.com?a=1&a=2"),
+        ),
+    )
+    def test_it_never_rejects_strings_which_match(self, matcher, url):
+        assert matcher == url
+        assert matcher.compile()(url)
+
+    @pytest.mark.parametrize(
+        "matcher",
+        (
+            AnyURLCore(),
+            AnyURLCore(scheme=None, host=None),
+            AnyURLCore(scheme=Any.string(), host=Any.string()),
+            AnyURLCore(query=Any.mapping()),
+            AnyURLCore(query=MultiValueQuery([(Any.string(), "1")])),
+        ),
+    )
+    def test_it_has_no_filter_without_plain_values(self, matcher):
+        matcher._constrained_parts()
+
+        assert matcher._string_filter is None
+
+    def test_it_follows_changes_to_the_query(self):
+        matcher = Any.url.containing_query({"a": "1"})
+        assert matcher != "http://example.com?b=1"
+
+        matcher.parts["query"] = AnyMapping.containing({"b": "1"})
+
+        assert matcher == "http://example.com?b=1"
+
+    def test_it_follows_changes_to_the_host(self):
+        matcher = AnyURLCore(host="example.com")
+        assert matcher != "http://example.org"
+
+        matcher.parts["host"] = "example.org"
+
+        assert matcher == "http://example.org"
+        assert matcher.compile()("http://example.org")
+
 
 class TestAnyURLPathMatching:
     def test_we_match_full_paths_with_or_without_slashes(self):
@@ -240,6 +494,35 @@ class TestAnyURLPathMatching:
     def test_it_does_not_match_prefixes_alone(self):
         assert AnyURLCore(path="/start") != "http://example.com/start/more"
 
+    @pytest.mark.parametrize("path", (None, "", "/"))
+    @pytest.mark.parametrize("url", ("http://example.com", "http://example.com/"))
+    def test_empty_paths_match_the_root(self, path, url):
+        assert AnyURLCore(path=path) == url
+        assert AnyURLCore(path=path).compile()(url)
+
+    @pytest.mark.parametrize("path", ("path", "/path"))
+    def test_compiled_path_matching(self, path):
+        predicate = AnyURLCore(path=path).compile()
+
+        assert predicate("http://example.com/path")
+        assert not predicate("http://example.com/other")
+
+    def test_path_matchers_are_shared_and_stateless(self):
+        matcher = AnyURLCore(path="/shared")
+        assert matcher == "http://example.com/shared"
+
+        path_matcher = matcher.parts["path"]
+        assert AnyURLCore("http://example.com/shared").parts["path"] is path_matcher
+        assert not path_matcher.matched_to
+
+    @pytest.mark.parametrize(
+        "path,description", ((None, "<Path '/'>"), ("a", "'<Path 'a'>"))
+    )
+    def test_path_matcher_stringification(self, path, description):
+        path_matcher = AnyURLCore(path=path).parts["path"]
+
+        assert repr(path_matcher) == str(path_matcher) == description
+
 
 class TestAnyURLHostnameGuessing:
     @pytest.mark.parametrize(
@@ -274,8 +557,117 @@ class TestAnyURLHostnameGuessing:
         assert (parsed["host"], parsed["path"]) == (expected_host, expected_path)
 
 
+class TestAnyURLParseCache:
+    # pylint: disable=protected-access
+
+    def test_it_parses_each_url_once(self):
+        matchers = [AnyURLCore(path=path) for path in ("a", "b", "c")]
+
+        assert AnyOf(matchers) == "http://example.com/c"
+
+        info = AnyURLCore.parse_cache_info().urls
+        assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+    def test_it_reports_the_query_cache(self):
+        matchers = [AnyURLCore(query={"a": value}) for value in ("1", "2")]
+
+        assert AnyOf(matchers) == "http://example.com?a=2"
+
+        info = AnyURLCore.parse_cache_info()
+        assert (info.urls.hits, info.urls.misses) == (1, 1)
+        assert (info.queries.hits, info.queries.misses) == (1, 1)
+        assert info.queries.maxsize == AnyURLCore.PARSE_CACHE_SIZE
+
+    def test_it_is_bounded(self):
+        AnyURLCore.set_parse_cache_size(2)
+
+        for path in ("a", "b", "c", "a"):
+            assert AnyURLCore() == f"http://example.com/{path}"
+
+        info = AnyURLCore.parse_cache_info()
+        assert info.urls == (0, 4, 2, 2)
+        assert info.queries.maxsize == 2
+
+    def test_it_can_be_disabled(self):
+        AnyURLCore.set_parse_cache_size(0)
+
+        assert AnyURLCore() == "http://example.com"
+        assert AnyURLCore() == "http://example.com"
+
+        info = AnyURLCore.parse_cache_info().urls
+        assert (info.hits, info.misses, info.currsize) == (0, 2, 0)
+
+    @pytest.mark.parametrize(
+        "mutate",
+        (
+            lambda parsed: parsed.__setitem__("host", "evil.com"),
+            lambda parsed: parsed.pop("host"),
+            lambda parsed: parsed.update(host="evil.com"),
+            lambda parsed: AnyURLCore._parse_query_cached(parsed["query"]).__setitem__(
+                "a", "2"
+            ),
+            lambda parsed: AnyURLCore._parse_query_cached(parsed["query"]).clear(),
+        ),
+    )
+    def test_cached_results_cannot_be_changed(self, mutate):
+        parsed = AnyURLCore._parse_url_cached("http://example.com?a=1")
+
+        with pytest.raises(TypeError):
+            mutate(parsed)
+
+        assert AnyURLCore(host="example.com", query={"a": "1"}) == (
+            "http://example.com?a=1"
+        )
+
+    def test_cached_multi_value_queries_cannot_be_changed(self):
+        query = AnyURLCore._parse_query_cached("a=1&a=2")
+
+        with pytest.raises(AttributeError):
+            query.append(("b", "3"))
+
+        assert query == (("a", "1"), ("a", "2"))
+        assert repr(query) == "<MultiValueQuery [('a', '1'), ('a', '2')]>"
+
+    def test_cached_results_can_be_pickled(self):
+        parsed = AnyURLCore._parse_url_cached("http://example.com?a=1")
+
+        assert pickle.loads(pickle.dumps(parsed)) == parsed
+
+    def test_parse_url_returns_a_copy(self):
+        parsed = AnyURLCore.parse_url("http://example.com?a=1")
+        parsed["host"] = "evil.com"
+        parsed["query"]["a"] = "2"
+
+        assert AnyURLCore.parse_url("http://example.com?a=1") == Any.dict.containing(
+            {"host": "example.com", "query": {"a": "1"}}
+        )
+
+    def test_parse_url_returns_multiple_values_as_a_list(self):
+        query = AnyURLCore.parse_url("http://example.com?a=1&a=2")["query"]
+        query.append(("b", "3"))
+
+        assert isinstance(query, MultiValueQuery)
+        assert query == [("a", "1"), ("a", "2"), ("b", "3")]
+        assert AnyURLCore.parse_url("http://example.com?a=1&a=2")["query"] == [
+            ("a", "1"),
+            ("a", "2"),
+        ]
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        AnyURLCore.clear_parse_cache()
+
+        yield
+
+        AnyURLCore.set_parse_cache_size(AnyURLCore.PARSE_CACHE_SIZE)
+
+
 class TestMultiValueQuery:
     def test_it_stringifies(self):
         query = MultiValueQuery(["1234"])
         assert "MultiValueQuery" in repr(query)
         assert "1234" in repr(query)
+
+    def test_it_is_a_list(self):
+        # This is part of what `AnyURLCore.parse_url()` gives back
+        assert isinstance(MultiValueQuery([("a", "1")]), list)
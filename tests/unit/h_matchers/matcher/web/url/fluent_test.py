@@ -137,3 +137,13 @@ class TestAnyURLFluent:
         matcher = matcher.with_scheme("ftp").containing_query({"c": "d"})
 
         assert matcher == "ftp://www.example.com/different?b=a&c=d#new_fragment"
+
+    @pytest.mark.parametrize("part", AnyURL.PRESENT_DEFAULT)
+    def test_shared_present_defaults_retain_nothing(self, part):
+        matcher = (
+            AnyURL.with_scheme().with_host().with_params().with_query().with_fragment()
+        )
+
+        assert matcher == "http://example.com/path;params?a=1#fragment"
+
+        assert not AnyURL.PRESENT_DEFAULT[part].matched_to
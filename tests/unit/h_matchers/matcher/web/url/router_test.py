@@ -0,0 +1,144 @@
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from h_matchers import Any
+from h_matchers.matcher.core import Matcher
+from h_matchers.matcher.web.url import AnyURL, AnyURLSet
+from h_matchers.matcher.web.url.core import AnyURLCore
+
+
+class TestAnyURLSet:
+    PATTERNS = [
+        AnyURL("https://example.com/api/users"),
+        AnyURL("https://example.com/api/groups"),
+        AnyURL("http://example.com/static"),
+        AnyURL(scheme="https", host="cdn.example.com"),
+        AnyURL(host="example.com"),
+        AnyURL(host=Any.string.matching(r".*\.example\.org")),
+        AnyURL(scheme=None, host=None, path="/relative/path"),
+        AnyURL(scheme=None, host=None, path=None),
+        AnyURL(query={"a": "1"}),
+        AnyURL(path=Any.string.containing("users")),
+        Any.string.containing("needle"),
+    ]
+
+    URLS = [
+        "https://example.com/api/users",
+        "https://example.com/api/users/",
+        "https://EXAMPLE.com/api/users",
+        "https://example.com/api/groups",
+        "https://example.com/api/other",
+        "http://example.com/static",
+        "http://example.com/static/",
+        "https://example.com/static",
+        "https://cdn.example.com",
+        "https://cdn.example.com/image.png",
+        "http://cdn.example.com/image.png",
+        "http://www.example.org/users",
+        "http://example.org",
+        "/relative/path",
+        "relative/path",
+        "",
+        "http://other.com?a=1",
+        "http://other.com/needle",
+        "example.com/users",
+    ]
+
+    @pytest.mark.parametrize("url", URLS)
+    def test_it_finds_the_same_matchers_as_checking_each_one(self, url):
+        url_set = AnyURLSet(self.PATTERNS)
+
+        expected = [pattern for pattern in self.PATTERNS if pattern == url]
+
+        assert url_set.matching(url) == expected
+        assert (url_set == url) == bool(expected)
+        assert url_set.compile()(url) == bool(expected)
+
+    @pytest.mark.parametrize(
+        "url", ("http://a.com/?a=", "https://a.com/?a=", "http://b.com/?a=")
+    )
+    def test_it_checks_each_matchers_string_filter_first(self, url):
+        # Parsing an empty query value raises, but no query here has the key
+        # `b`, so the query matcher rejects the string before it gets that far
+        patterns = [
+            AnyURL(host="a.com", query={"b": "1"}),
+            AnyURL(scheme="https", host="a.com"),
+        ]
+        url_set = AnyURLSet(patterns)
+
+        expected = [pattern for pattern in patterns if pattern == url]
+
+        assert url_set.matching(url) == expected
+        assert (url_set == url) == bool(expected)
+
+    def test_it_only_checks_candidates(self, patch):
+        patterns = [
+            AnyURL("https://example.com/a"),
+            AnyURL("https://example.com/b"),
+            AnyURL("https://other.com/a"),
+            AnyURL(scheme="http", host="example.com"),
+        ]
+        url_set = AnyURLSet(patterns)
+        match_parsed = patch(
+            "h_matchers.matcher.web.url.core.AnyURLCore._match_parsed",
+            return_value=True,
+        )
+
+        assert url_set.matching("https://example.com/a/b") == [patterns[0]]
+        match_parsed.assert_called_once_with(patterns[0], Any.mapping())
+
+    def test_it_parses_the_url_once(self):
+        url_set = AnyURLSet(AnyURL(query={"a": str(i)}) for i in range(10))
+        AnyURLCore.clear_parse_cache()
+
+        assert url_set == "http://example.com?a=9"
+
+        # pylint: disable=protected-access
+        assert AnyURLCore._parse_url_cached.cache_info().misses == 1
+        assert AnyURLCore._parse_query_cached.cache_info().misses == 1
+
+    def test_it_compares_other_matchers_to_everything(self):
+        matcher = Matcher("spy", Mock(return_value=True))
+        url_set = AnyURLSet([AnyURL(host="example.com"), matcher])
+
+        assert url_set.matching(1234) == [matcher]
+
+    def test_it_does_not_match_non_strings_with_url_matchers(self):
+        url_set = AnyURLSet([AnyURL()])
+
+        assert url_set != 1234
+        assert url_set.match(1234).reason == "No matchers in the set match 1234"
+
+    @pytest.mark.parametrize("url", URLS)
+    def test_it_matches_the_same_when_unpickled(self, url):
+        url_set = AnyURLSet(self.PATTERNS)
+
+        unpickled = pickle.loads(pickle.dumps(url_set))
+
+        # The unpickled matchers are copies, so compare their descriptions
+        assert [repr(matcher) for matcher in unpickled.matching(url)] == [
+            repr(matcher) for matcher in url_set.matching(url)
+        ]
+
+    def test_it_can_have_matchers_added(self):
+        pattern = AnyURL(host="example.com")
+
+        url_set = AnyURLSet().add(pattern)
+
+        assert url_set.matchers == (pattern,)
+        assert url_set == "http://example.com"
+
+    def test_adding_matchers_clears_cached_results(self):
+        url_set = AnyURLSet().cache_results()
+        assert url_set != "http://example.com"
+
+        url_set.add(AnyURL(host="example.com"))
+
+        assert url_set == "http://example.com"
+
+    def test_it_stringifies(self):
+        assert str(AnyURLSet(self.PATTERNS)) == (
+            f"* any URL matching one of {len(self.PATTERNS)} matchers *"
+        )